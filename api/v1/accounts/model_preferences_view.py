@@ -4,6 +4,10 @@ User model preferences views.
 from rest_framework.views import APIView
 from rest_framework import permissions
 from core.responses import success_response, error_response
+from apps.accounts.models import User
+
+
+MODEL_PREFERENCE_FIELDS = ('openai_model', 'claude_model', 'gemini_model')
 
 
 class ModelPreferencesView(APIView):
@@ -25,15 +29,12 @@ class ModelPreferencesView(APIView):
         user = request.user
         data = request.data
 
-        # Update model preferences
-        if 'openai_model' in data:
-            user.openai_model = data['openai_model']
-        if 'claude_model' in data:
-            user.claude_model = data['claude_model']
-        if 'gemini_model' in data:
-            user.gemini_model = data['gemini_model']
-
-        user.save()
+        # Update only the model preferences present in the request with a single UPDATE
+        fields = {key: data[key] for key in MODEL_PREFERENCE_FIELDS if key in data}
+        if fields:
+            User.objects.filter(pk=user.pk).update(**fields)
+            for key, value in fields.items():
+                setattr(user, key, value)
 
         preferences = {
             'openai_model': user.openai_model,
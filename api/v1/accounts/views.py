@@ -2,7 +2,10 @@
 API v1 accounts views.
 """
 import json
+import logging
+import re
 import secrets
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlencode
 from datetime import timedelta
@@ -11,10 +14,15 @@ from rest_framework.response import Response
 from rest_framework import status, permissions
 from rest_framework.authtoken.models import Token
 from rest_framework.decorators import api_view, permission_classes, authentication_classes
+from rest_framework.fields import BooleanField
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib.auth import login, logout
 from django.contrib.sessions.models import Session
 from django.conf import settings
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.dispatch import receiver
 from django.utils import timezone
 from core.responses import success_response, error_response
 from apps.accounts.serializers import (
@@ -27,8 +35,75 @@ from apps.accounts.serializers import (
     SetPasswordSerializer
 )
 from apps.accounts.models import APIKey, UserSession, User, EmailPasscode
+from apps.accounts.tasks import send_passcode_email, record_user_session
 import requests
-from django.core.mail import send_mail
+from requests.adapters import HTTPAdapter
+from google.auth import jwt as google_jwt
+from kombu.exceptions import OperationalError as BrokerError
+
+
+# Shared keep-alive session so OAuth calls reuse TCP/TLS connections to Google
+_GOOGLE_HTTP = requests.Session()
+_GOOGLE_HTTP.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32))
+_GOOGLE_HTTP_TIMEOUT = 5
+
+_GOOGLE_CERTS_URL = 'https://www.googleapis.com/oauth2/v1/certs'
+_GOOGLE_CERTS_CACHE_KEY = 'google:oauth2:certs'
+_GOOGLE_ISSUERS = ('accounts.google.com', 'https://accounts.google.com')
+
+logger = logging.getLogger(__name__)
+
+
+def _skip_session(request):
+    """
+    Token-only API clients can pass skip_session to avoid creating a
+    django_session row (and its audit record) they will never use.
+    """
+    return request.data.get('skip_session') in BooleanField.TRUE_VALUES
+
+
+def _record_user_session(request, user):
+    """
+    Queue the UserSession audit write for the current session.
+
+    The row is only used for auditing, so it is written by a Celery task
+    once the login transaction commits. The session key is read at commit
+    time so it reflects the key issued by login(). If the broker is
+    unreachable the row is written inline instead, so session bookkeeping
+    never fails the login.
+    """
+    if not request.session.session_key:
+        request.session.create()
+
+    ip_address = request.META.get('REMOTE_ADDR')
+    user_agent = request.META.get('HTTP_USER_AGENT', '')
+
+    def dispatch():
+        args = (user.pk, request.session.session_key, ip_address, user_agent)
+        try:
+            record_user_session.delay(*args)
+        except BrokerError as e:
+            logger.warning(f"Could not queue session record for user {user.pk}: {e}")
+            try:
+                record_user_session(*args)
+            except Exception:
+                logger.exception(f"Failed to record session for user {user.pk}")
+
+    transaction.on_commit(dispatch)
+
+
+def _get_auth_token(user):
+    """
+    Return the user's DRF token, creating it on first login.
+
+    Login lookups select_related('auth_token'), so returning users are
+    served from the already-loaded relation without another query.
+    """
+    try:
+        return user.auth_token
+    except Token.DoesNotExist:
+        token, _ = Token.objects.get_or_create(user=user)
+        return token
 
 
 class RegisterView(APIView):
@@ -76,25 +151,16 @@ class LoginView(APIView):
         if serializer.is_valid():
             user = serializer.validated_data['user']
             
-            # Get or create authentication token
-            token, created = Token.objects.get_or_create(user=user)
-            
-            # Create user session
-            if not request.session.session_key:
-                request.session.create()
+            with transaction.atomic():
+                # Get or create authentication token
+                token = _get_auth_token(user)
                 
-            UserSession.objects.update_or_create(
-                user=user,
-                session_key=request.session.session_key,
-                defaults={
-                    'ip_address': request.META.get('REMOTE_ADDR'),
-                    'user_agent': request.META.get('HTTP_USER_AGENT', ''),
-                    'is_active': True
-                }
-            )
-            
-            # Log the user in
-            login(request, user)
+                if not _skip_session(request):
+                    # Create user session
+                    _record_user_session(request, user)
+                    
+                    # Log the user in
+                    login(request, user)
             
             return success_response({
                 'user': UserProfileSerializer(user).data,
@@ -114,18 +180,20 @@ class LogoutView(APIView):
     
     def post(self, request):
         try:
-            # Deactivate user session
-            if request.session.session_key:
-                UserSession.objects.filter(
-                    user=request.user,
-                    session_key=request.session.session_key
-                ).update(is_active=False)
-            
-            # Delete authentication token
-            Token.objects.filter(user=request.user).delete()
-            
-            # Log the user out
-            logout(request)
+            # One transaction so the session, token and django_session writes commit together
+            with transaction.atomic():
+                # Deactivate user session
+                if request.session.session_key:
+                    UserSession.objects.filter(
+                        user_id=request.user.pk,
+                        session_key=request.session.session_key
+                    ).update(is_active=False)
+                
+                # Delete authentication token (Token has no dependents, so this is a single DELETE)
+                Token.objects.filter(user_id=request.user.pk).delete()
+                
+                # Log the user out
+                logout(request)
             
             return success_response(message="Logout successful")
         
@@ -164,7 +232,10 @@ class APIKeyManagementView(APIView):
     
     def get(self, request):
         """List user's API keys."""
-        api_keys = APIKey.objects.filter(user=request.user)
+        # Only the columns APIKeySerializer reads; encrypted_key is needed for the masked suffix
+        api_keys = APIKey.objects.filter(user_id=request.user.pk).only(
+            'id', 'service_name', 'encrypted_key', 'is_active', 'created_at', 'updated_at'
+        ).order_by('-created_at')
         serializer = APIKeySerializer(api_keys, many=True)
         return success_response(serializer.data)
     
@@ -172,26 +243,26 @@ class APIKeyManagementView(APIView):
         """Add or update an API key."""
         serializer = APIKeySerializer(data=request.data)
         if serializer.is_valid():
-            # Check if API key for this service already exists
-            existing_key = APIKey.objects.filter(
+            validated_data = serializer.validated_data.copy()
+            service_name = validated_data.pop('service_name')
+            validated_data['encrypted_key'] = APIKey.encrypt_key(validated_data.pop('key'))
+
+            # Insert or update the key for this service in one statement pair
+            api_key, created = APIKey.objects.update_or_create(
                 user=request.user,
-                service_name=serializer.validated_data['service_name']
-            ).first()
-            
-            if existing_key:
-                # Update existing key
-                serializer = APIKeySerializer(existing_key, data=request.data, partial=True)
-                if serializer.is_valid():
-                    serializer.save()
-                    return success_response(serializer.data, message="API key updated successfully")
-            else:
-                # Create new key
-                api_key = serializer.save(user=request.user)
+                service_name=service_name,
+                defaults=validated_data
+            )
+
+            # Render through the already-validated serializer instead of building another
+            serializer.instance = api_key
+            if created:
                 return success_response(
-                    APIKeySerializer(api_key).data, 
+                    serializer.data, 
                     message="API key added successfully",
                     status_code=status.HTTP_201_CREATED
                 )
+            return success_response(serializer.data, message="API key updated successfully")
         
         return error_response(
             message="API key operation failed",
@@ -221,6 +292,45 @@ class APIKeyManagementView(APIView):
 
 # Google OAuth Views
 
+@lru_cache(maxsize=1)
+def _google_oauth_config():
+    """
+    Resolve the Google OAuth client settings once instead of walking the
+    nested SOCIALACCOUNT_PROVIDERS dict on every request.
+    """
+    app = settings.SOCIALACCOUNT_PROVIDERS['google']['APP']
+    return {
+        'client_id': app['client_id'],
+        'client_secret': app['secret'],
+        'redirect_uri': f"{settings.FRONTEND_URL}/auth/google/callback",
+    }
+
+
+@lru_cache(maxsize=1)
+def _google_authorization_base():
+    """
+    Build the state-independent part of the Google authorization URL once.
+    Only the per-request `state` parameter is appended in the view.
+    """
+    oauth_config = _google_oauth_config()
+    params = {
+        'client_id': oauth_config['client_id'],
+        'redirect_uri': oauth_config['redirect_uri'],
+        'response_type': 'code',
+        'scope': 'openid profile email',
+        'access_type': 'online',
+    }
+    return f"https://accounts.google.com/o/oauth2/v2/auth?{urlencode(params)}"
+
+
+@receiver(setting_changed)
+def _reset_google_oauth_cache(setting, **kwargs):
+    """Drop cached OAuth values when the settings they derive from change."""
+    if setting in ('SOCIALACCOUNT_PROVIDERS', 'FRONTEND_URL'):
+        _google_oauth_config.cache_clear()
+        _google_authorization_base.cache_clear()
+
+
 @api_view(['GET'])
 @permission_classes([permissions.AllowAny])
 def google_oauth_init(request):
@@ -237,22 +347,64 @@ def google_oauth_init(request):
     request.session['google_oauth_state_expiry'] = expiry_ts
     request.session.modified = True
 
-    params = {
-        'client_id': settings.SOCIALACCOUNT_PROVIDERS['google']['APP']['client_id'],
-        'redirect_uri': f"{settings.FRONTEND_URL}/auth/google/callback",
-        'response_type': 'code',
-        'scope': 'openid profile email',
-        'access_type': 'online',
-        'state': state,
-    }
-
-    authorization_url = f"https://accounts.google.com/o/oauth2/v2/auth?{urlencode(params)}"
+    authorization_url = f"{_google_authorization_base()}&{urlencode({'state': state})}"
 
     return success_response({
         'authorization_url': authorization_url
     })
 
 
+def _get_google_certs():
+    """
+    Return Google's ID token signing certificates, cached for as long as
+    Google's Cache-Control header allows (an hour if it is missing).
+    """
+    certs = cache.get(_GOOGLE_CERTS_CACHE_KEY)
+    if certs:
+        return certs
+
+    response = _GOOGLE_HTTP.get(_GOOGLE_CERTS_URL, timeout=_GOOGLE_HTTP_TIMEOUT)
+    response.raise_for_status()
+    certs = response.json()
+
+    max_age = re.search(r'max-age=(\d+)', response.headers.get('Cache-Control', ''))
+    cache.set(_GOOGLE_CERTS_CACHE_KEY, certs, int(max_age.group(1)) if max_age else 3600)
+    return certs
+
+
+def _google_user_info(tokens):
+    """
+    Return the Google profile for a token response, or None on failure.
+
+    With the openid scope the token response already carries a signed ID
+    token holding the profile claims, so it is verified locally instead of
+    paying a second round-trip to the userinfo endpoint.
+    """
+    if tokens.get('id_token'):
+        claims = google_jwt.decode(
+            tokens['id_token'],
+            certs=_get_google_certs(),
+            audience=_google_oauth_config()['client_id']
+        )
+        if claims.get('iss') not in _GOOGLE_ISSUERS:
+            raise ValueError('ID token was not issued by Google')
+        return {
+            'id': claims.get('sub'),
+            'email': claims.get('email'),
+            'name': claims.get('name', ''),
+            'picture': claims.get('picture', ''),
+        }
+
+    user_info_response = _GOOGLE_HTTP.get(
+        'https://www.googleapis.com/oauth2/v2/userinfo',
+        headers={'Authorization': f"Bearer {tokens.get('access_token')}"},
+        timeout=_GOOGLE_HTTP_TIMEOUT
+    )
+    if user_info_response.status_code != 200:
+        return None
+    return user_info_response.json()
+
+
 @api_view(['POST'])
 @authentication_classes([])  # Disable authentication to bypass CSRF for OAuth callback
 @permission_classes([permissions.AllowAny])
@@ -313,13 +465,11 @@ def google_oauth_callback(request):
         token_url = 'https://oauth2.googleapis.com/token'
         token_data = {
             'code': code,
-            'client_id': settings.SOCIALACCOUNT_PROVIDERS['google']['APP']['client_id'],
-            'client_secret': settings.SOCIALACCOUNT_PROVIDERS['google']['APP']['secret'],
-            'redirect_uri': f"{settings.FRONTEND_URL}/auth/google/callback",
+            **_google_oauth_config(),
             'grant_type': 'authorization_code',
         }
 
-        token_response = requests.post(token_url, data=token_data)
+        token_response = _GOOGLE_HTTP.post(token_url, data=token_data, timeout=_GOOGLE_HTTP_TIMEOUT)
 
         if token_response.status_code != 200:
             return error_response(
@@ -332,19 +482,14 @@ def google_oauth_callback(request):
         access_token = tokens.get('access_token')
 
         # Get user info from Google
-        user_info_response = requests.get(
-            'https://www.googleapis.com/oauth2/v2/userinfo',
-            headers={'Authorization': f'Bearer {access_token}'}
-        )
+        user_info = _google_user_info(tokens)
 
-        if user_info_response.status_code != 200:
+        if user_info is None:
             return error_response(
                 message="Failed to fetch user information",
                 status_code=status.HTTP_400_BAD_REQUEST
             )
 
-        user_info = user_info_response.json()
-
         # Get or create user
         google_id = user_info.get('id')
         email = (user_info.get('email') or '').lower().strip()
@@ -359,10 +504,10 @@ def google_oauth_callback(request):
         created = False
 
         if google_id:
-            user = User.objects.filter(google_id=google_id).first()
+            user = User.objects.select_related('auth_token').filter(google_id=google_id).first()
 
         if user is None:
-            user = User.objects.filter(email__iexact=email).first()
+            user = User.objects.select_related('auth_token').filter(email__iexact=email).first()
 
         if user is None:
             user = User.objects.create(
@@ -394,27 +539,22 @@ def google_oauth_callback(request):
             access_token,
             tokens.get('refresh_token', '')
         )
-        user.save()
 
-        # Create session
-        login(request, user, backend='django.contrib.auth.backends.ModelBackend')
+        with transaction.atomic():
+            user.save(update_fields=[
+                'google_id', 'google_email', 'google_profile_picture', 'avatar',
+                'auth_method', 'is_active', 'last_auth_at',
+                'google_access_token', 'google_refresh_token', 'updated_at',
+            ])
 
-        # Create DRF token
-        token, _ = Token.objects.get_or_create(user=user)
+            # Create session
+            login(request, user, backend='django.contrib.auth.backends.ModelBackend')
 
-        # Create user session
-        if not request.session.session_key:
-            request.session.create()
+            # Create DRF token
+            token = _get_auth_token(user)
 
-        UserSession.objects.update_or_create(
-            user=user,
-            session_key=request.session.session_key,
-            defaults={
-                'ip_address': request.META.get('REMOTE_ADDR'),
-                'user_agent': request.META.get('HTTP_USER_AGENT', ''),
-                'is_active': True
-            }
-        )
+            # Create user session
+            _record_user_session(request, user)
 
         # Serialize user data
         return success_response({
@@ -452,27 +592,21 @@ def passcode_send(request):
 
     email = serializer.validated_data['email']
 
+    # cache.add is an atomic SET NX on Redis, so repeat requests are rejected
+    # before they reach the passcode table or the mail queue. Without REDIS_URL
+    # the cache is per-process LocMem and the guard only holds per worker.
+    if not cache.add(f"passcode:send:{email}", 1, timeout=30):
+        return error_response(
+            message="Please wait before requesting another code",
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS
+        )
+
     try:
         # Generate passcode
         passcode_obj = EmailPasscode.generate_passcode(email)
 
-        # Send email
-        subject = 'Your AI Consensus Login Code'
-        message = f'''
-Your temporary login code is: {passcode_obj.passcode}
-
-This code will expire in 15 minutes.
-
-If you didn't request this code, you can safely ignore this email.
-        '''
-
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL,
-            [email],
-            fail_silently=False,
-        )
+        # Queue the email so SMTP latency stays off the request path
+        send_passcode_email.delay(email, passcode_obj.passcode)
 
         return success_response({
             'email': email,
@@ -506,25 +640,16 @@ def passcode_verify(request):
     user = serializer.validated_data['user']
 
     try:
-        # Create or get authentication token
-        token, created = Token.objects.get_or_create(user=user)
+        with transaction.atomic():
+            # Create or get authentication token
+            token = _get_auth_token(user)
 
-        # Create user session
-        if not request.session.session_key:
-            request.session.create()
-
-        UserSession.objects.update_or_create(
-            user=user,
-            session_key=request.session.session_key,
-            defaults={
-                'ip_address': request.META.get('REMOTE_ADDR'),
-                'user_agent': request.META.get('HTTP_USER_AGENT', ''),
-                'is_active': True
-            }
-        )
+            if not _skip_session(request):
+                # Create user session
+                _record_user_session(request, user)
 
-        # Log the user in
-        login(request, user, backend='django.contrib.auth.backends.ModelBackend')
+                # Log the user in
+                login(request, user, backend='django.contrib.auth.backends.ModelBackend')
 
         return success_response({
             'user': UserProfileSerializer(user).data,
@@ -602,30 +727,24 @@ def password_login(request):
         )
 
     try:
-        # Get or create authentication token
-        token, created = Token.objects.get_or_create(user=user)
-
-        # Create user session
-        if not request.session.session_key:
-            request.session.create()
+        with transaction.atomic():
+            # Get or create authentication token
+            token = _get_auth_token(user)
 
-        UserSession.objects.update_or_create(
-            user=user,
-            session_key=request.session.session_key,
-            defaults={
-                'ip_address': request.META.get('REMOTE_ADDR'),
-                'user_agent': request.META.get('HTTP_USER_AGENT', ''),
-                'is_active': True
-            }
-        )
+            if not _skip_session(request):
+                # Create user session
+                _record_user_session(request, user)
 
-        # Log the user in
-        login(request, user)
+                # Log the user in
+                login(request, user)
 
-        # Update auth method
-        user.auth_method = 'permanent_password'
-        user.last_auth_at = timezone.now()
-        user.save(update_fields=['auth_method', 'last_auth_at'])
+            # Update auth method; only the two changed columns go over the wire
+            user.auth_method = 'permanent_password'
+            user.last_auth_at = timezone.now()
+            User.objects.filter(pk=user.pk).update(
+                auth_method=user.auth_method,
+                last_auth_at=user.last_auth_at
+            )
 
         return success_response({
             'user': UserProfileSerializer(user).data,
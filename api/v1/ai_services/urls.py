@@ -18,4 +18,5 @@ urlpatterns = [
     
     # Structured summary endpoint
     path('summary/structured/', views.StructuredSummaryView.as_view(), name='structured_summary'),
+    path('summary/structured/batch/', views.BatchStructuredSummaryView.as_view(), name='structured_summary_batch'),
 ] + router.urls
\ No newline at end of file
@@ -3,13 +3,22 @@ API v1 AI services views.
 """
 import asyncio
 from typing import Dict, Any, List
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse
+from pydantic import TypeAdapter
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 
 from core.ai_models import StructuredSummaryResult
-from apps.responses.services.structured_summary import StructuredSummaryService
+from apps.responses.services.structured_summary import structured_summary_service
+
+# Upper bound on documents per batch summary request
+MAX_SUMMARY_BATCH_SIZE = 10
+
+# Serializes result lists straight to JSON bytes in pydantic-core
+_SUMMARY_RESULTS_ADAPTER = TypeAdapter(List[StructuredSummaryResult])
 
 
 class AIServiceListView(APIView):
@@ -50,33 +59,68 @@ class StructuredSummaryView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Create service and generate summary
-            summary_service = StructuredSummaryService()
+            # Under ASGI this awaits on the server's event loop; under WSGI
+            # async_to_sync runs it on a new event loop for this call
+            result = async_to_sync(structured_summary_service.generate_structured_summary)(
+                content=content,
+                ai_service_name=ai_service,
+                use_enhanced=use_enhanced
+            )
             
-            # Run async method
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(
-                    summary_service.generate_structured_summary(
-                        content=content,
-                        ai_service_name=ai_service,
-                        use_enhanced=use_enhanced
-                    )
-                )
-            finally:
-                loop.close()
-            
-            return Response({
-                'success': result.success,
-                'enhanced_summary': result.enhanced_summary.model_dump(),
-                'legacy_summary': result.legacy_summary,
-                'metadata': result.metadata.model_dump(),
-                'error_message': result.error_message
-            })
+            # The result model matches the response envelope, so let pydantic-core write the JSON
+            return HttpResponse(result.model_dump_json(), content_type='application/json')
             
         except Exception as e:
             return Response(
                 {'error': f'Error generating structured summary: {str(e)}'}, 
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
\ No newline at end of file
+            )
+
+
+class BatchStructuredSummaryView(APIView):
+    """Generate structured summaries for several documents concurrently."""
+    permission_classes = [IsAuthenticated]
+    
+    def post(self, request):
+        items = request.data.get('items')
+        
+        if not isinstance(items, list) or not items:
+            return Response(
+                {'error': 'items must be a non-empty list'}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if len(items) > MAX_SUMMARY_BATCH_SIZE:
+            return Response(
+                {'error': f'At most {MAX_SUMMARY_BATCH_SIZE} items can be summarized per request'}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if not all(isinstance(item, dict) and item.get('content') for item in items):
+            return Response(
+                {'error': 'Content is required for every item'}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            results = async_to_sync(self._summarize_all)(items)
+            body = b'{"results":' + _SUMMARY_RESULTS_ADAPTER.dump_json(results) + b'}'
+            return HttpResponse(body, content_type='application/json')
+            
+        except Exception as e:
+            return Response(
+                {'error': f'Error generating structured summaries: {str(e)}'}, 
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+    
+    @staticmethod
+    async def _summarize_all(items: List[Dict[str, Any]]) -> List[StructuredSummaryResult]:
+        """Run every summary in one event loop pass so provider calls overlap."""
+        return await asyncio.gather(*[
+            structured_summary_service.generate_structured_summary(
+                content=item['content'],
+                ai_service_name=item.get('ai_service', 'openai'),
+                use_enhanced=item.get('use_enhanced', True)
+            )
+            for item in items
+        ])
@@ -1,11 +1,14 @@
-from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.conf import settings
-from rest_framework.decorators import api_view, permission_classes
+from django.core.cache import cache
+from rest_framework.decorators import api_view, parser_classes, permission_classes
 from rest_framework.permissions import IsAuthenticated
-import json
 import asyncio
+import hashlib
 import logging
+import re
+from itertools import islice
+import orjson
 from apps.ai_services.services.factory import AIServiceFactory
 from apps.ai_services.services.web_search_coordinator import WebSearchCoordinator
 from apps.ai_services.utils.token_extractor import extract_tokens, calculate_total_tokens
@@ -14,28 +17,128 @@ from apps.responses.models import AIResponse
 from apps.conversations.models import Conversation
 from django.utils import timezone
 from channels.db import database_sync_to_async
+from asgiref.sync import async_to_sync
+from core.decorators import cached_post, max_body_size
+from core.parsers import ORJSONParser
+from core.responses import json_response, ndjson_stream_response
 
 logger = logging.getLogger(__name__)
 
+# Consensus payloads are prompts plus chat history; anything larger is refused
+MAX_REQUEST_BODY_SIZE = 512 * 1024
+
 
 def check_consensus_endpoints_enabled():
     """
     Check if consensus endpoints are enabled.
-    Raises JsonResponse with 403 status if disabled.
+    Returns a JSON response with 403 status if disabled.
     """
     if not getattr(settings, 'ENABLE_CONSENSUS_ENDPOINTS', True):
-        return JsonResponse({
+        return json_response({
             'success': False,
             'error': 'Consensus endpoints are disabled. Enable ENABLE_CONSENSUS_ENDPOINTS in settings to use these endpoints.'
-        }, status=403)
-async def generate_synopsis_with_same_ai(content: str, ai_service_name: str, api_key: str, model: str) -> dict:
+        }, status_code=403)
+
+
+SYNOPSIS_MARKER = '===SYNOPSIS==='
+
+# Asks the provider for its synopsis in the same completion as the answer
+SYNOPSIS_INSTRUCTION = (
+    f'\n\nAfter your full answer, on a new line write "{SYNOPSIS_MARKER}" followed by '
+    'a concise, intelligent 35-45 word synopsis of your answer that captures the key insights.'
+)
+
+
+# Identical prompts from the same user to the same provider and model within
+# this window (UI retries, repeated evaluation runs) are answered from the cache
+RESPONSE_CACHE_TTL = 5 * 60
+
+
+def response_cache_key(user_id, service_name: str, model: str, prompt: str, context: dict = None) -> str:
+    """Build a cache key from the user, provider, model, prompt and service context."""
+    raw_key = orjson.dumps([str(user_id), service_name, model, prompt, context or {}], option=orjson.OPT_SORT_KEYS)
+    return f"consensus:{hashlib.blake2b(raw_key, digest_size=16).hexdigest()}"
+
+
+async def cached_generate_response(ai_service, service_name: str, model: str, prompt: str, context: dict = None, user_id=None) -> dict:
+    """
+    Generate a response, reusing a recent successful one for the same request.
+    Answers are sampled, so the cache is scoped to the requesting user: one
+    user's retry may see its own earlier answer, but never another user's.
+    Without a user_id nothing is cached. Cached copies carry no usage, since
+    the provider does not bill the repeat.
+    """
+    if user_id is None:
+        return await ai_service.generate_response(prompt, context)
+
+    try:
+        cache_key = response_cache_key(user_id, service_name, model, prompt, context)
+    except TypeError:
+        # Context that cannot be serialized is not worth caching
+        return await ai_service.generate_response(prompt, context)
+
+    cached_response = await cache.aget(cache_key)
+    if cached_response is not None:
+        return cached_response
+
+    response = await ai_service.generate_response(prompt, context)
+    if response.get('success'):
+        metadata = {key: value for key, value in response.get('metadata', {}).items() if key != 'usage'}
+        await cache.aset(cache_key, {**response, 'metadata': {**metadata, 'cached': True}}, RESPONSE_CACHE_TTL)
+    return response
+
+
+# Answers up to SYNOPSIS_MAX_WORDS are their own synopsis, and answers up to
+# LOCAL_SYNOPSIS_MAX_WORDS are summarized locally instead of asking the model
+SYNOPSIS_MAX_WORDS = 45
+LOCAL_SYNOPSIS_MAX_WORDS = 120
+
+# Generated synopses over 50 words are cut back to SYNOPSIS_MAX_WORDS; the
+# lookahead tests the length in one scan without splitting into a word list
+OVERLONG_SYNOPSIS_RE = re.compile(
+    rf'\S+(?:\s+\S+){{{SYNOPSIS_MAX_WORDS - 1}}}(?=(?:\s+\S+){{{50 - SYNOPSIS_MAX_WORDS + 1}}})'
+)
+
+SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def local_synopsis(content: str):
+    """
+    Return a synopsis for answers too short to be worth a model call.
+    Mid-length answers are summarized by their first and last sentences.
+    Returns None when the answer needs a generated synopsis.
+    """
+    words = content.split()
+    if len(words) <= SYNOPSIS_MAX_WORDS:
+        return content.strip()
+    if len(words) > LOCAL_SYNOPSIS_MAX_WORDS:
+        return None
+
+    sentences = SENTENCE_BOUNDARY_RE.split(' '.join(words))
+    extract = sentences[0] if len(sentences) == 1 else f"{sentences[0]} {sentences[-1]}"
+    overlong = OVERLONG_SYNOPSIS_RE.match(extract)
+    return overlong.group(0) + '...' if overlong else extract
+
+
+def split_synopsis(content: str):
+    """
+    Split a completion requested with SYNOPSIS_INSTRUCTION into answer and synopsis.
+    Returns (content, None) when the model did not emit a synopsis.
+    """
+    answer, marker, synopsis = content.rpartition(SYNOPSIS_MARKER)
+    if not marker or not synopsis.strip() or not answer.strip():
+        return content, None
+    return answer.rstrip(), synopsis.strip()
+
+
+async def generate_synopsis_with_same_ai(content: str, ai_service, ai_service_name: str, model: str, user_id=None) -> dict:
     """
     Use the same AI service that generated the response to create an intelligent synopsis.
+    ai_service is the instance that produced the response, reused rather than looked up again.
+    user_id scopes the response cache to the requesting user.
     Returns dict with 'synopsis' text and 'metadata' for token tracking.
     """
     try:
-        ai_service = AIServiceFactory.create_service(ai_service_name.lower(), api_key, model=model)
-
         synopsis_prompt = f"""Please provide a concise, intelligent 35-45 word synopsis of your previous response that captures the key insights and main points:
 
 {content[:800]}
@@ -47,13 +150,15 @@ Guidelines:
 - Make every word count
 - Aim for exactly 35-45 words"""
 
-        result = await ai_service.generate_response(synopsis_prompt)
+        result = await cached_generate_response(
+            ai_service, ai_service_name.lower(), model, synopsis_prompt, user_id=user_id
+        )
 
         if result.get('success'):
             synopsis = result.get('content', 'Unable to generate synopsis')
-            words = synopsis.strip().split()
-            if len(words) > 50:
-                synopsis = ' '.join(words[:45]) + '...'
+            overlong = OVERLONG_SYNOPSIS_RE.match(synopsis.strip())
+            if overlong:
+                synopsis = overlong.group(0) + '...'
             return {'synopsis': synopsis, 'metadata': result.get('metadata', {}), 'success': True}
         else:
             return {'synopsis': f"Synopsis generation failed: {result.get('error', 'Unknown error')}", 'metadata': {}, 'success': False}
@@ -63,435 +168,287 @@ Guidelines:
         return {'synopsis': "Synopsis generation failed", 'metadata': {}, 'success': False}
 
 
-async def process_claude(message: str, chat_history: str, web_search_context: str, search_result: dict, use_web_search: bool, ai_query, user=None):
-    """Process Claude request with main response and synopsis generation."""
-    try:
-        # Use user's preferred model or fallback to default
-        claude_model = 'claude-sonnet-4-5-20250929'  # Default
-        if user and hasattr(user, 'claude_model') and user.claude_model:
-            claude_model = user.claude_model
-
-        claude_service = AIServiceFactory.create_service(
-            'claude',
-            settings.CLAUDE_API_KEY,
-            model=claude_model
-        )
+async def reflect_with_synopsis(service, prompt: str, ai_service_name: str, model: str, user_id=None):
+    """
+    Generate a reflection with its synopsis in the same completion.
+    If the model skips the synopsis and the reflection is too long to summarize
+    locally, a separate synopsis call is chained per provider, so it starts as
+    soon as its own reflection finishes.
+    """
+    reflection = await service.generate_response(prompt + SYNOPSIS_INSTRUCTION)
+    if not reflection.get('success'):
+        return reflection, "Reflection failed"
 
-        # Prepare context
-        context = {}
-        enhanced_message = message
+    reflection['content'], inline_synopsis = split_synopsis(reflection.get('content') or '')
+    short_synopsis = inline_synopsis or local_synopsis(reflection['content'])
+    if short_synopsis:
+        return reflection, short_synopsis
 
-        if chat_history:
-            enhanced_message = f"Previous conversation:\n{chat_history}\n\n{'='*50}\n\nNew user question:\n{message}"
+    synopsis = await generate_synopsis_with_same_ai(reflection['content'], service, ai_service_name, model, user_id)
+    return reflection, synopsis
 
-        if web_search_context and use_web_search and search_result and search_result.get('success', False):
-            print(f"[AI] Adding web search context with {len(search_result.get('results', []))} sources")
-            context['web_search'] = {
-                'enabled': True,
-                'results': search_result['results']
-            }
-            if chat_history:
-                enhanced_message = f"Previous conversation:\n{chat_history}\n\n{'='*50}\n\nCurrent web information:\n{web_search_context}\n\n{'='*50}\n\nNew user question:\n{message}\n\nPlease provide a comprehensive response considering the conversation context and using both the current web information above and your knowledge. When referencing information from the web search results, use numbered citations like [1], [2], [3] that correspond to the source numbers above."
-            else:
-                enhanced_message = f"Current web information:\n{web_search_context}\n\n{'='*50}\n\nUser question:\n{message}\n\nPlease provide a comprehensive response using both the current web information above and your knowledge. When referencing information from the web search results, use numbered citations like [1], [2], [3] that correspond to the source numbers above."
-        else:
-            print(f"[AI] No web search context - web_search_context exists: {bool(web_search_context)}, use_web_search: {use_web_search}, search_result success: {search_result.get('success') if search_result else 'N/A'}")
 
-        # Get main response
-        claude_response = await claude_service.generate_response(enhanced_message, context)
+# Divides the history, web information and question sections of the prompt
+PROMPT_SEPARATOR = '\n\n' + '=' * 50 + '\n\n'
 
-        # Generate synopsis
-        synopsis = "No synopsis available"
-        synopsis_result = None
-        if claude_response['success'] and claude_response['content']:
-            synopsis_result = await generate_synopsis_with_same_ai(
-                claude_response['content'],
-                'claude',
-                settings.CLAUDE_API_KEY,
-                claude_model
-            )
-            synopsis = synopsis_result.get('synopsis', 'No synopsis available')
+# Client-supplied chat history is capped to roughly this many tokens (at ~4
+# characters per token) so long conversations don't inflate every provider prompt
+CHAT_HISTORY_MAX_TOKENS = 2000
+CHAT_HISTORY_MAX_CHARS = CHAT_HISTORY_MAX_TOKENS * 4
 
-        # Extract tokens
-        input_tokens, output_tokens = extract_tokens(
-            claude_response.get('metadata', {}),
-            'claude'
-        )
-        total_tokens = calculate_total_tokens(input_tokens, output_tokens)
 
-        # Create AIResponse records - only if we have valid content
-        if ai_query and claude_response['success'] and claude_response['content']:
-            try:
-                claude_service_obj = await database_sync_to_async(AIService.objects.get)(name='claude')
+def trim_chat_history(chat_history: str) -> str:
+    """Keep the most recent part of the chat history within the prompt budget."""
+    if len(chat_history) <= CHAT_HISTORY_MAX_CHARS:
+        return chat_history
+    recent = chat_history[-CHAT_HISTORY_MAX_CHARS:]
+    # Start at a line boundary rather than mid-message where possible
+    line_start = recent.find('\n') + 1
+    return recent[line_start:] if 0 < line_start < len(recent) else recent
 
-                # Main response record
-                await database_sync_to_async(AIResponse.objects.create)(
-                    query=ai_query,
-                    service=claude_service_obj,
-                    content=claude_response['content'],
-                    raw_response=claude_response.get('metadata', {}),
-                    summary=synopsis,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    tokens_used=total_tokens
-                )
 
-                # Synopsis generation record
-                if synopsis_result and synopsis_result.get('success'):
-                    synopsis_input_tokens, synopsis_output_tokens = extract_tokens(
-                        synopsis_result.get('metadata', {}),
-                        'claude'
-                    )
-                    synopsis_total_tokens = calculate_total_tokens(synopsis_input_tokens, synopsis_output_tokens)
-                    await database_sync_to_async(AIResponse.objects.create)(
-                        query=ai_query,
-                        service=claude_service_obj,
-                        content=synopsis,
-                        raw_response=synopsis_result.get('metadata', {}),
-                        summary='Synopsis generation call',
-                        input_tokens=synopsis_input_tokens,
-                        output_tokens=synopsis_output_tokens,
-                        tokens_used=synopsis_total_tokens
-                    )
-            except Exception as e:
-                print(f"Failed to create AIResponse for Claude: {e}")
-        elif ai_query and not claude_response['success']:
-            # Log failed requests for debugging
-            print(f"Skipping AIResponse creation for Claude - request failed: {claude_response.get('error')}")
-
-        return {
-            'service': 'Claude',
-            'success': claude_response['success'],
-            'content': claude_response['content'],
-            'synopsis': synopsis,
-            'input_tokens': input_tokens,
-            'output_tokens': output_tokens,
-            'tokens_used': total_tokens,
-            'error': claude_response.get('error')
+def build_enhanced_message(message: str, chat_history: str, web_search_context: str, search_result: dict, use_web_search: bool):
+    """
+    Build the prompt and service context shared by every provider.
+    Returns (enhanced_message, context).
+    """
+    context = {}
+    enhanced_message = message
+    chat_history = trim_chat_history(chat_history)
+
+    if chat_history:
+        enhanced_message = f"Previous conversation:\n{chat_history}{PROMPT_SEPARATOR}New user question:\n{message}"
+
+    if web_search_context and use_web_search and search_result and search_result.get('success', False):
+        print(f"[AI] Adding web search context with {len(search_result.get('results', []))} sources")
+        context['web_search'] = {
+            'enabled': True,
+            'results': search_result['results']
         }
+        if chat_history:
+            enhanced_message = f"Previous conversation:\n{chat_history}{PROMPT_SEPARATOR}Current web information:\n{web_search_context}{PROMPT_SEPARATOR}New user question:\n{message}\n\nPlease provide a comprehensive response considering the conversation context and using both the current web information above and your knowledge. When referencing information from the web search results, use numbered citations like [1], [2], [3] that correspond to the source numbers above."
+        else:
+            enhanced_message = f"Current web information:\n{web_search_context}{PROMPT_SEPARATOR}User question:\n{message}\n\nPlease provide a comprehensive response using both the current web information above and your knowledge. When referencing information from the web search results, use numbered citations like [1], [2], [3] that correspond to the source numbers above."
+    else:
+        print(f"[AI] No web search context - web_search_context exists: {bool(web_search_context)}, use_web_search: {use_web_search}, search_result success: {search_result.get('success') if search_result else 'N/A'}")
 
-    except Exception as e:
-        return {
-            'service': 'Claude',
-            'success': False,
-            'content': None,
-            'synopsis': 'Synopsis generation failed',
-            'error': str(e)
-        }
+    return enhanced_message, context
 
 
-async def process_openai(message: str, chat_history: str, web_search_context: str, search_result: dict, use_web_search: bool, ai_query, user=None):
-    """Process OpenAI request with main response and synopsis generation."""
-    try:
-        # Use user's preferred model or fallback to default
-        openai_model = 'gpt-4o'  # Default
-        if user and hasattr(user, 'openai_model') and user.openai_model:
-            openai_model = user.openai_model
-
-        openai_service = AIServiceFactory.create_service(
-            'openai',
-            settings.OPENAI_API_KEY,
-            model=openai_model
-        )
+# (service name, display label, settings key attribute, default model)
+PROVIDERS = (
+    ('claude', 'Claude', 'CLAUDE_API_KEY', 'claude-sonnet-4-5-20250929'),
+    ('openai', 'OpenAI', 'OPENAI_API_KEY', 'gpt-4o'),
+    ('gemini', 'Gemini', 'GEMINI_API_KEY', 'models/gemini-flash-latest'),
+)
 
-        # Prepare context
-        context = {}
-        enhanced_message = message
+# Synthesis, critique and cross-reflection use the same model as the main fan-out
+PROVIDER_MODELS = {service_name: model for service_name, _, _, model in PROVIDERS}
 
-        if chat_history:
-            enhanced_message = f"Previous conversation:\n{chat_history}\n\n{'='*50}\n\nNew user question:\n{message}"
 
-        if web_search_context and use_web_search and search_result and search_result.get('success', False):
-            print(f"[AI] Adding web search context with {len(search_result.get('results', []))} sources")
-            context['web_search'] = {
-                'enabled': True,
-                'results': search_result['results']
-            }
-            if chat_history:
-                enhanced_message = f"Previous conversation:\n{chat_history}\n\n{'='*50}\n\nCurrent web information:\n{web_search_context}\n\n{'='*50}\n\nNew user question:\n{message}\n\nPlease provide a comprehensive response considering the conversation context and using both the current web information above and your knowledge. When referencing information from the web search results, use numbered citations like [1], [2], [3] that correspond to the source numbers above."
-            else:
-                enhanced_message = f"Current web information:\n{web_search_context}\n\n{'='*50}\n\nUser question:\n{message}\n\nPlease provide a comprehensive response using both the current web information above and your knowledge. When referencing information from the web search results, use numbered citations like [1], [2], [3] that correspond to the source numbers above."
+async def process_provider(service_name: str, label: str, api_key: str, default_model: str, prompt: str, context: dict, ai_query, user=None, user_id=None):
+    """
+    Process one provider request with main response and synopsis generation.
+    prompt is shared by all providers and already asks for the inline synopsis.
+    user_id is the requesting user, which scopes the response cache.
+    Unexpected errors propagate to the caller, which reports them per provider.
+    """
+    # Use user's preferred model (e.g. user.claude_model) or fallback to default
+    model = getattr(user, f'{service_name}_model', None) or default_model
+
+    ai_service = AIServiceFactory.create_service(
+        service_name,
+        api_key,
+        model=model
+    )
+
+    # Get main response with its synopsis in the same completion
+    response = await cached_generate_response(ai_service, service_name, model, prompt, context, user_id)
+
+    # Fall back to a separate synopsis call if the model skipped it and
+    # the answer is too long to stand in for one
+    synopsis = "No synopsis available"
+    synopsis_result = None
+    if response['success'] and response['content']:
+        response['content'], inline_synopsis = split_synopsis(response['content'])
+        short_synopsis = inline_synopsis or local_synopsis(response['content'])
+        if short_synopsis:
+            synopsis = short_synopsis
         else:
-            print(f"[AI] No web search context - web_search_context exists: {bool(web_search_context)}, use_web_search: {use_web_search}, search_result success: {search_result.get('success') if search_result else 'N/A'}")
-
-        # Get main response
-        openai_response = await openai_service.generate_response(enhanced_message, context)
-
-        # Generate synopsis
-        synopsis = "No synopsis available"
-        synopsis_result = None
-        if openai_response['success'] and openai_response['content']:
             synopsis_result = await generate_synopsis_with_same_ai(
-                openai_response['content'],
-                'openai',
-                settings.OPENAI_API_KEY,
-                openai_model
+                response['content'],
+                ai_service,
+                service_name,
+                model,
+                user_id
             )
             synopsis = synopsis_result.get('synopsis', 'No synopsis available')
 
-        # Extract tokens
-        input_tokens, output_tokens = extract_tokens(
-            openai_response.get('metadata', {}),
-            'openai'
-        )
-        total_tokens = calculate_total_tokens(input_tokens, output_tokens)
+    # Extract tokens
+    input_tokens, output_tokens = extract_tokens(
+        response.get('metadata', {}),
+        service_name
+    )
+    total_tokens = calculate_total_tokens(input_tokens, output_tokens)
 
-        # Create AIResponse records - only if we have valid content
-        if ai_query and openai_response['success'] and openai_response['content']:
-            try:
-                openai_service_obj = await database_sync_to_async(AIService.objects.get)(name='openai')
+    # Create AIResponse records - only if we have valid content
+    if ai_query and response['success'] and response['content']:
+        try:
+            service_obj = await database_sync_to_async(AIService.objects.get)(name=service_name)
+
+            # Main response record
+            await database_sync_to_async(AIResponse.objects.create)(
+                query=ai_query,
+                service=service_obj,
+                content=response['content'],
+                raw_response=response.get('metadata', {}),
+                summary=synopsis,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                tokens_used=total_tokens
+            )
 
-                # Main response record
+            # Synopsis generation record
+            if synopsis_result and synopsis_result.get('success'):
+                synopsis_input_tokens, synopsis_output_tokens = extract_tokens(
+                    synopsis_result.get('metadata', {}),
+                    service_name
+                )
+                synopsis_total_tokens = calculate_total_tokens(synopsis_input_tokens, synopsis_output_tokens)
                 await database_sync_to_async(AIResponse.objects.create)(
                     query=ai_query,
-                    service=openai_service_obj,
-                    content=openai_response['content'],
-                    raw_response=openai_response.get('metadata', {}),
-                    summary=synopsis,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    tokens_used=total_tokens
+                    service=service_obj,
+                    content=synopsis,
+                    raw_response=synopsis_result.get('metadata', {}),
+                    summary='Synopsis generation call',
+                    input_tokens=synopsis_input_tokens,
+                    output_tokens=synopsis_output_tokens,
+                    tokens_used=synopsis_total_tokens
                 )
+        except Exception as e:
+            print(f"Failed to create AIResponse for {label}: {e}")
+    elif ai_query and not response['success']:
+        # Log failed requests for debugging
+        print(f"Skipping AIResponse creation for {label} - request failed: {response.get('error')}")
 
-                # Synopsis generation record
-                if synopsis_result and synopsis_result.get('success'):
-                    synopsis_input_tokens, synopsis_output_tokens = extract_tokens(
-                        synopsis_result.get('metadata', {}),
-                        'openai'
-                    )
-                    synopsis_total_tokens = calculate_total_tokens(synopsis_input_tokens, synopsis_output_tokens)
-                    await database_sync_to_async(AIResponse.objects.create)(
-                        query=ai_query,
-                        service=openai_service_obj,
-                        content=synopsis,
-                        raw_response=synopsis_result.get('metadata', {}),
-                        summary='Synopsis generation call',
-                        input_tokens=synopsis_input_tokens,
-                        output_tokens=synopsis_output_tokens,
-                        tokens_used=synopsis_total_tokens
-                    )
-            except Exception as e:
-                print(f"Failed to create AIResponse for OpenAI: {e}")
-        elif ai_query and not openai_response['success']:
-            # Log failed requests for debugging
-            print(f"Skipping AIResponse creation for OpenAI - request failed: {openai_response.get('error')}")
-
-        return {
-            'service': 'OpenAI',
-            'success': openai_response['success'],
-            'content': openai_response['content'],
-            'synopsis': synopsis,
-            'input_tokens': input_tokens,
-            'output_tokens': output_tokens,
-            'tokens_used': total_tokens,
-            'error': openai_response.get('error')
-        }
+    return {
+        'service': label,
+        'success': response['success'],
+        'content': response['content'],
+        'synopsis': synopsis,
+        'input_tokens': input_tokens,
+        'output_tokens': output_tokens,
+        'tokens_used': total_tokens,
+        'error': response.get('error')
+    }
 
-    except Exception as e:
-        return {
-            'service': 'OpenAI',
-            'success': False,
-            'content': None,
-            'synopsis': 'Synopsis generation failed',
-            'error': str(e)
-        }
 
 
-async def process_gemini(message: str, chat_history: str, web_search_context: str, search_result: dict, use_web_search: bool, ai_query, user=None):
-    """Process Gemini request with main response and synopsis generation."""
-    try:
-        # Use user's preferred model or fallback to default
-        gemini_model = 'models/gemini-flash-latest'  # Default
-        if user and hasattr(user, 'gemini_model') and user.gemini_model:
-            gemini_model = user.gemini_model
-
-        gemini_service = AIServiceFactory.create_service(
-            'gemini',
-            settings.GEMINI_API_KEY,
-            model=gemini_model
-        )
+# Only the top results are summarized into the prompt; all of them are still
+# passed to the services for citations
+SEARCH_CONTEXT_RESULTS = 5
 
-        # Prepare context
-        context = {}
-        enhanced_message = message
 
-        if chat_history:
-            enhanced_message = f"Previous conversation:\n{chat_history}\n\n{'='*50}\n\nNew user question:\n{message}"
+def format_search_result(index: int, result: dict) -> str:
+    """Render one web search result for the shared prompt context."""
+    return (
+        f"{index}. {result.get('title', 'No title')}\n"
+        f"   URL: {result.get('url', 'No URL')}\n"
+        f"   {result.get('content', 'No content')[:200]}...\n"
+    )
 
-        if web_search_context and use_web_search and search_result and search_result.get('success', False):
-            print(f"[AI] Adding web search context with {len(search_result.get('results', []))} sources")
-            context['web_search'] = {
-                'enabled': True,
-                'results': search_result['results']
-            }
-            if chat_history:
-                enhanced_message = f"Previous conversation:\n{chat_history}\n\n{'='*50}\n\nCurrent web information:\n{web_search_context}\n\n{'='*50}\n\nNew user question:\n{message}\n\nPlease provide a comprehensive response considering the conversation context and using both the current web information above and your knowledge. When referencing information from the web search results, use numbered citations like [1], [2], [3] that correspond to the source numbers above."
-            else:
-                enhanced_message = f"Current web information:\n{web_search_context}\n\n{'='*50}\n\nUser question:\n{message}\n\nPlease provide a comprehensive response using both the current web information above and your knowledge. When referencing information from the web search results, use numbered citations like [1], [2], [3] that correspond to the source numbers above."
-        else:
-            print(f"[AI] No web search context - web_search_context exists: {bool(web_search_context)}, use_web_search: {use_web_search}, search_result success: {search_result.get('success') if search_result else 'N/A'}")
 
-        # Get main response
-        gemini_response = await gemini_service.generate_response(enhanced_message, context)
+async def fetch_conversation(conversation_id: str):
+    """Load the conversation with its user (for model preferences), or None."""
+    if not conversation_id:
+        return None
+    try:
+        return await database_sync_to_async(Conversation.objects.select_related('user').get)(
+            id=conversation_id
+        )
+    except Exception as e:
+        print(f"Failed to get conversation: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
 
-        # Generate synopsis
-        synopsis = "No synopsis available"
-        synopsis_result = None
-        if gemini_response['success'] and gemini_response['content']:
-            synopsis_result = await generate_synopsis_with_same_ai(
-                gemini_response['content'],
-                'gemini',
-                settings.GEMINI_API_KEY,
-                gemini_model
-            )
-            synopsis = synopsis_result.get('synopsis', 'No synopsis available')
 
-        # Extract tokens
-        input_tokens, output_tokens = extract_tokens(
-            gemini_response.get('metadata', {}),
-            'gemini'
+async def run_web_search(message: str, user_location: dict = None):
+    """
+    Run the web search for a consensus request.
+    Returns (search_result, web_search_context); failures yield an unsuccessful result.
+    """
+    web_search_context = ""
+    try:
+        print(f"[WEB SEARCH] Web search enabled for query: {message[:50]}...")
+        print(f"[WEB SEARCH] User location: {user_location}")
+
+        # Wrap in timeout - fail gracefully if takes too long
+        # Set to 200s to allow for Reka's actual response time (~55s) + 2 retries × 95s = ~200s max
+        search_result = await asyncio.wait_for(
+            WebSearchCoordinator().search_for_query(
+                user_query=message,
+                user=None,
+                context={},
+                user_location=user_location
+            ),
+            timeout=200.0
         )
-        total_tokens = calculate_total_tokens(input_tokens, output_tokens)
 
-        # Create AIResponse records - only if we have valid content
-        if ai_query and gemini_response['success'] and gemini_response['content']:
-            try:
-                gemini_service_obj = await database_sync_to_async(AIService.objects.get)(name='gemini')
+        print(f"[WEB SEARCH] Search result success: {search_result.get('success')}")
+        print(f"[WEB SEARCH] Search result error: {search_result.get('error')}")
+        print(f"[WEB SEARCH] Results count: {len(search_result.get('results', []))}")
 
-                # Main response record
-                await database_sync_to_async(AIResponse.objects.create)(
-                    query=ai_query,
-                    service=gemini_service_obj,
-                    content=gemini_response['content'],
-                    raw_response=gemini_response.get('metadata', {}),
-                    summary=synopsis,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    tokens_used=total_tokens
-                )
-
-                # Synopsis generation record
-                if synopsis_result and synopsis_result.get('success'):
-                    synopsis_input_tokens, synopsis_output_tokens = extract_tokens(
-                        synopsis_result.get('metadata', {}),
-                        'gemini'
-                    )
-                    synopsis_total_tokens = calculate_total_tokens(synopsis_input_tokens, synopsis_output_tokens)
-                    await database_sync_to_async(AIResponse.objects.create)(
-                        query=ai_query,
-                        service=gemini_service_obj,
-                        content=synopsis,
-                        raw_response=synopsis_result.get('metadata', {}),
-                        summary='Synopsis generation call',
-                        input_tokens=synopsis_input_tokens,
-                        output_tokens=synopsis_output_tokens,
-                        tokens_used=synopsis_total_tokens
-                    )
-            except Exception as e:
-                print(f"Failed to create AIResponse for Gemini: {e}")
-        elif ai_query and not gemini_response['success']:
-            # Log failed requests for debugging
-            print(f"Skipping AIResponse creation for Gemini - request failed: {gemini_response.get('error')}")
-
-        return {
-            'service': 'Gemini',
-            'success': gemini_response['success'],
-            'content': gemini_response['content'],
-            'synopsis': synopsis,
-            'input_tokens': input_tokens,
-            'output_tokens': output_tokens,
-            'tokens_used': total_tokens,
-            'error': gemini_response.get('error')
+        if search_result.get('success', False) and search_result.get('results'):
+            top_results = islice(search_result['results'], SEARCH_CONTEXT_RESULTS)
+            web_search_context = '\n'.join(
+                format_search_result(idx, result) for idx, result in enumerate(top_results, 1)
+            )
+            print(f"[WEB SEARCH] Web search context created with {min(len(search_result['results']), SEARCH_CONTEXT_RESULTS)} results")
+        else:
+            print(f"[WEB SEARCH] No valid search results to process")
+    except asyncio.TimeoutError:
+        print(f"[WEB SEARCH] Web search timed out after 200 seconds - continuing without search")
+        search_result = {
+            'success': False,
+            'error': 'Search timed out',
+            'results': [],
+            'sources': [],
+            'search_calls_made': 1  # Count the attempt even if it timed out
         }
-
     except Exception as e:
-        return {
-            'service': 'Gemini',
+        print(f"[WEB SEARCH] Web search failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        search_result = {
             'success': False,
-            'content': None,
-            'synopsis': 'Synopsis generation failed',
-            'error': str(e)
+            'error': str(e),
+            'results': [],
+            'sources': [],
+            'search_calls_made': 1  # Count the attempt even if it failed
         }
 
+    return search_result, web_search_context
+
 
-async def process_all_services_async(message: str, services: list, use_web_search: bool, chat_history: str, conversation_id: str, user_location: dict = None):
+async def prepare_services_async(message: str, services: list, use_web_search: bool, chat_history: str, conversation_id: str, user_location: dict = None, user_id=None):
     """
-    Async helper that coordinates parallel LLM calls.
+    Run the web search and create the AIQuery for a consensus request.
+    Returns (tasks, ai_query, search_result) where tasks maps provider labels to coroutines.
     """
-    # Get conversation and user first (needed for both web search and AIQuery creation)
     ai_query = None
-    user = None
-    conversation = None
-    if conversation_id:
-        try:
-            conversation = await database_sync_to_async(Conversation.objects.select_related('user').get)(
-                id=conversation_id
-            )
-            user = conversation.user  # Store user for model preferences
-        except Exception as e:
-            print(f"Failed to get conversation: {e}")
-            import traceback
-            traceback.print_exc()
-
-    # Perform web search once if needed (BEFORE creating AIQuery)
     web_search_context = ""
     search_result = {}
 
+    # The conversation lookup doesn't depend on the search, so overlap the two
     if use_web_search:
-        try:
-            print(f"[WEB SEARCH] Web search enabled for query: {message[:50]}...")
-            print(f"[WEB SEARCH] User location: {user_location}")
-
-            # Add overall timeout for web search
-            async def search_with_timeout():
-                web_search_coordinator = WebSearchCoordinator()
-                return await web_search_coordinator.search_for_query(
-                    user_query=message,
-                    user=None,
-                    context={},
-                    user_location=user_location
-                )
-
-            # Wrap in timeout - fail gracefully if takes too long
-            # Set to 200s to allow for Reka's actual response time (~55s) + 2 retries × 95s = ~200s max
-            search_result = await asyncio.wait_for(search_with_timeout(), timeout=200.0)
-
-            print(f"[WEB SEARCH] Search result success: {search_result.get('success')}")
-            print(f"[WEB SEARCH] Search result error: {search_result.get('error')}")
-            print(f"[WEB SEARCH] Results count: {len(search_result.get('results', []))}")
-
-            if search_result.get('success', False) and search_result.get('results'):
-                search_summary = []
-                for idx, result in enumerate(search_result['results'][:5], 1):
-                    search_summary.append(
-                        f"{idx}. {result.get('title', 'No title')}\n"
-                        f"   URL: {result.get('url', 'No URL')}\n"
-                        f"   {result.get('content', 'No content')[:200]}...\n"
-                    )
-                web_search_context = '\n'.join(search_summary)
-                print(f"[WEB SEARCH] Web search context created with {len(search_summary)} results")
-            else:
-                print(f"[WEB SEARCH] No valid search results to process")
-        except asyncio.TimeoutError:
-            print(f"[WEB SEARCH] Web search timed out after 200 seconds - continuing without search")
-            search_result = {
-                'success': False,
-                'error': 'Search timed out',
-                'results': [],
-                'sources': [],
-                'search_calls_made': 1  # Count the attempt even if it timed out
-            }
-        except Exception as e:
-            print(f"[WEB SEARCH] Web search failed: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            search_result = {
-                'success': False,
-                'error': str(e),
-                'results': [],
-                'sources': [],
-                'search_calls_made': 1  # Count the attempt even if it failed
-            }
+        conversation, (search_result, web_search_context) = await asyncio.gather(
+            fetch_conversation(conversation_id),
+            run_web_search(message, user_location)
+        )
+    else:
+        conversation = await fetch_conversation(conversation_id)
+    user = conversation.user if conversation else None
 
     # Create AIQuery for cost tracking AFTER web search (so we can set web_search_calls directly)
     if conversation and user:
@@ -517,42 +474,47 @@ async def process_all_services_async(message: str, services: list, use_web_searc
             import traceback
             traceback.print_exc()
 
-    # Build list of coroutines for requested services
-    tasks = []
-
-    if 'claude' in services and settings.CLAUDE_API_KEY:
-        tasks.append(process_claude(message, chat_history, web_search_context, search_result, use_web_search, ai_query, user))
+    # The prompt is identical for every provider, so build it once
+    enhanced_message, context = build_enhanced_message(
+        message, chat_history, web_search_context, search_result, use_web_search
+    )
+    prompt = enhanced_message + SYNOPSIS_INSTRUCTION
+
+    # Build coroutines for requested services, keyed by provider label
+    tasks = {}
+    for service_name, label, key_setting, default_model in PROVIDERS:
+        api_key = getattr(settings, key_setting)
+        if service_name in services and api_key:
+            tasks[label] = process_provider(
+                service_name, label, api_key, default_model, prompt, context, ai_query, user, user_id
+            )
 
-    if 'openai' in services and settings.OPENAI_API_KEY:
-        tasks.append(process_openai(message, chat_history, web_search_context, search_result, use_web_search, ai_query, user))
+    return tasks, ai_query, search_result
 
-    if 'gemini' in services and settings.GEMINI_API_KEY:
-        tasks.append(process_gemini(message, chat_history, web_search_context, search_result, use_web_search, ai_query, user))
 
-    # Run all service requests concurrently
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+def failed_result(label: str, error: Exception) -> dict:
+    """Result entry for a provider task that raised instead of returning."""
+    print(f"Error in parallel execution for {label}: {error}")
+    return {
+        'service': label,
+        'success': False,
+        'content': None,
+        'synopsis': 'Error occurred',
+        'error': str(error)
+    }
 
-    # Handle any exceptions that occurred
-    processed_results = []
-    for result in results:
-        if isinstance(result, Exception):
-            print(f"Error in parallel execution: {result}")
-            processed_results.append({
-                'service': 'Unknown',
-                'success': False,
-                'content': None,
-                'synopsis': 'Error occurred',
-                'error': str(result)
-            })
-        else:
-            processed_results.append(result)
 
+async def finish_services_async(ai_query, total_responses: int, search_result: dict) -> list:
+    """
+    Complete the AIQuery for a consensus request.
+    Returns the web search sources for frontend citations.
+    """
     # Update AIQuery status
     if ai_query:
         try:
             ai_query.status = 'completed'
             ai_query.completed_at = timezone.now()
-            ai_query.total_responses = len(processed_results)
+            ai_query.total_responses = total_responses
             await database_sync_to_async(ai_query.save)()
 
             # Update conversation stats to recalculate costs
@@ -574,14 +536,64 @@ async def process_all_services_async(message: str, services: list, use_web_searc
             })
         print(f"[WEB SEARCH] Prepared {len(web_search_sources)} sources for frontend")
 
+    return web_search_sources
+
+
+async def process_all_services_async(message: str, services: list, use_web_search: bool, chat_history: str, conversation_id: str, user_location: dict = None, user_id=None):
+    """
+    Async helper that coordinates parallel LLM calls.
+    """
+    tasks, ai_query, search_result = await prepare_services_async(
+        message, services, use_web_search, chat_history, conversation_id, user_location, user_id
+    )
+
+    # Run all service requests concurrently; one provider failing doesn't
+    # affect the others
+    results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    processed_results = [
+        failed_result(label, result) if isinstance(result, Exception) else result
+        for label, result in zip(tasks, results)
+    ]
+
     return {
         'results': processed_results,
-        'web_search_sources': web_search_sources
+        'web_search_sources': await finish_services_async(ai_query, len(processed_results), search_result)
     }
 
 
+async def stream_all_services_async(message: str, services: list, use_web_search: bool, chat_history: str, conversation_id: str, user_location: dict = None, user_id=None):
+    """
+    Async generator variant of process_all_services_async for NDJSON streaming.
+    Yields one line per provider as soon as it finishes, then a final 'done' line.
+    """
+    tasks, ai_query, search_result = await prepare_services_async(
+        message, services, use_web_search, chat_history, conversation_id, user_location, user_id
+    )
+
+    pending = {asyncio.ensure_future(task): label for label, task in tasks.items()}
+    while pending:
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            label = pending.pop(task)
+            error = task.exception()
+            result = failed_result(label, error) if error else task.result()
+            yield orjson.dumps({'type': 'result', **result}) + b'\n'
+
+    web_search_sources = await finish_services_async(ai_query, len(tasks), search_result)
+    yield orjson.dumps({
+        'type': 'done',
+        'success': True,
+        'web_search_sources': web_search_sources,
+        'timestamp': timezone.now().isoformat()
+    }) + b'\n'
+
+
 @api_view(['POST'])
+@parser_classes([ORJSONParser])
 @permission_classes([IsAuthenticated])
+@max_body_size(MAX_REQUEST_BODY_SIZE)
+@cached_post(timeout=60, uncached_fields=('conversation_id',))
 def test_ai_services(request):
     """
     Parallel consensus query across multiple AI services.
@@ -589,6 +601,8 @@ def test_ai_services(request):
     Body: {"message": "query", "services": ["claude", "openai"], "use_web_search": true}
 
     Returns responses from all requested AI services with cost tracking.
+    With "stream": true the results are sent as NDJSON lines as each service
+    finishes, followed by a "done" line carrying the web search sources.
     Requires authentication.
     """
     # Check if consensus endpoints are enabled
@@ -608,19 +622,31 @@ def test_ai_services(request):
         # Debug logging
         print(f"[TEST_AI] Request received - use_web_search: {use_web_search}, user_location: {user_location}")
 
-        # Run async processing
-        response_data = asyncio.run(
-            process_all_services_async(
+        # Opt-in NDJSON stream: one line per provider as it completes
+        if data.get('stream'):
+            return ndjson_stream_response(request, stream_all_services_async(
                 message=message,
                 services=services,
                 use_web_search=use_web_search,
                 chat_history=chat_history,
                 conversation_id=conversation_id,
-                user_location=user_location
-            )
+                user_location=user_location,
+                user_id=request.user.pk
+            ))
+
+        # Run async processing; under ASGI this awaits on the server's event
+        # loop, under WSGI async_to_sync runs it on a new loop for this request
+        response_data = async_to_sync(process_all_services_async)(
+            message=message,
+            services=services,
+            use_web_search=use_web_search,
+            chat_history=chat_history,
+            conversation_id=conversation_id,
+            user_location=user_location,
+            user_id=request.user.pk
         )
 
-        return JsonResponse({
+        return json_response({
             'success': True,
             'results': response_data['results'],
             'web_search_sources': response_data.get('web_search_sources', []),
@@ -628,17 +654,88 @@ def test_ai_services(request):
         })
 
     except Exception as e:
-        return JsonResponse({
+        return json_response({
             'success': False,
             'error': str(e)
-        }, status=500)
+        }, status_code=500)
+
+
+def track_completion_cost(conversation_id: str, prompt: str, service_name: str, response: dict, summary: str):
+    """Record a single synthesis or critique call against the conversation for cost tracking."""
+    try:
+        from uuid import UUID
+        conversation = Conversation.objects.get(id=UUID(conversation_id))
+        ai_query = AIQuery.objects.create(
+            user=conversation.user,
+            conversation=conversation,
+            prompt=prompt,
+            status='completed',
+            started_at=timezone.now(),
+            completed_at=timezone.now()
+        )
+
+        service_obj = AIService.objects.get(name=service_name)
+        input_tokens, output_tokens = extract_tokens(response.get('metadata', {}), service_name)
+
+        AIResponse.objects.create(
+            query=ai_query,
+            service=service_obj,
+            content=response['content'],
+            raw_response=response.get('metadata', {}),
+            summary=summary,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            tokens_used=calculate_total_tokens(input_tokens, output_tokens)
+        )
+
+        # Refresh conversation aggregates so cost updates propagate to the UI
+        conversation.update_conversation_metadata()
+    except Exception as e:
+        print(f"Failed to track {summary.lower()} cost: {e}")
+
+
+async def stream_completion_async(service, prompt: str, result_key: str, provider_key: str, provider: str, track=None):
+    """
+    Async generator streaming one completion as NDJSON 'delta' lines while it
+    is generated, then a 'done' line with the full text in result_key.
+    track, if given, is called with the finished response for cost tracking.
+    """
+    response = None
+    async for chunk in service.generate_response_stream(prompt):
+        if isinstance(chunk, str):
+            yield orjson.dumps({'type': 'delta', 'content': chunk}) + b'\n'
+        else:
+            response = chunk
+
+    if response and response.get('success'):
+        if track:
+            await database_sync_to_async(track)(response)
+        yield orjson.dumps({
+            'type': 'done',
+            'success': True,
+            result_key: response['content'],
+            provider_key: provider
+        }) + b'\n'
+    else:
+        yield orjson.dumps({
+            'type': 'done',
+            'success': False,
+            'error': (response or {}).get('error') or 'Unknown error'
+        }) + b'\n'
+
+
 @api_view(['POST'])
+@parser_classes([ORJSONParser])
 @permission_classes([IsAuthenticated])
+@max_body_size(MAX_REQUEST_BODY_SIZE)
 def combine_responses(request):
     """
     Combine two LLM responses into a unified synthesis.
     POST /api/v1/consensus/synthesis/
 
+    With "stream": true the synthesis is sent as NDJSON 'delta' lines as it is
+    generated, followed by a 'done' line.
+
     Requires authentication.
     """
     # Check if consensus endpoints are enabled
@@ -657,10 +754,10 @@ def combine_responses(request):
         conversation_id = data.get('conversation_id')  # Optional for cost tracking
 
         if not all([user_query, llm1_name, llm1_response, llm2_name, llm2_response]):
-            return JsonResponse({
+            return json_response({
                 'success': False,
                 'error': 'Missing required fields'
-            }, status=400)
+            }, status_code=400)
 
         # Create the synthesis prompt
         synthesis_prompt = f"""Role:
@@ -713,143 +810,85 @@ Source 2 ({llm2_name}):
 Please provide your synthesis now:"""
 
         # Use Claude for synthesis (or OpenAI as fallback)
+        claude_api_key = settings.CLAUDE_API_KEY
+        openai_api_key = settings.OPENAI_API_KEY
         synthesis_service = None
         synthesis_provider = None
 
         # Try Claude first for high-quality synthesis
-        if settings.CLAUDE_API_KEY:
+        if claude_api_key:
             try:
                 synthesis_service = AIServiceFactory.create_service(
                     'claude',
-                    settings.CLAUDE_API_KEY,
-                    model='claude-sonnet-4-20250514'
+                    claude_api_key,
+                    model=PROVIDER_MODELS['claude']
                 )
                 synthesis_provider = 'Claude'
             except Exception:
                 synthesis_service = None
 
         # Fallback to OpenAI if Claude unavailable
-        if not synthesis_service and settings.OPENAI_API_KEY:
+        if not synthesis_service and openai_api_key:
             synthesis_service = AIServiceFactory.create_service(
                 'openai',
-                settings.OPENAI_API_KEY,
-                model='gpt-4o'
+                openai_api_key,
+                model=PROVIDER_MODELS['openai']
             )
             synthesis_provider = 'OpenAI'
 
-        if synthesis_service:
-            # Run async function
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                synthesis_response = loop.run_until_complete(
-                    synthesis_service.generate_response(synthesis_prompt)
+        if synthesis_service and data.get('stream'):
+            track = None
+            if conversation_id:
+                track = lambda response: track_completion_cost(
+                    conversation_id, f"Synthesis: {user_query[:100]}",
+                    synthesis_provider.lower(), response, 'Response synthesis'
                 )
-            finally:
-                loop.close()
+            return ndjson_stream_response(request, stream_completion_async(
+                synthesis_service, synthesis_prompt, 'synthesis', 'synthesis_provider', synthesis_provider, track
+            ))
+
+        if synthesis_service:
+            # Server's event loop under ASGI; a loop for this call under WSGI
+            synthesis_response = async_to_sync(cached_generate_response)(
+                synthesis_service,
+                synthesis_provider.lower(),
+                synthesis_service.model,
+                synthesis_prompt,
+                user_id=request.user.pk
+            )
 
             if synthesis_response['success']:
                 # Track cost if conversation_id provided
                 if conversation_id:
-                    try:
-                        from uuid import UUID
-                        conversation = Conversation.objects.get(id=UUID(conversation_id))
-                        ai_query = AIQuery.objects.create(
-                            user=conversation.user,
-                            conversation=conversation,
-                            prompt=f"Synthesis: {user_query[:100]}",
-                            status='completed',
-                            started_at=timezone.now(),
-                            completed_at=timezone.now()
-                        )
-
-                        # Get service object
-                        service_name = synthesis_provider.lower()
-                        service_obj = AIService.objects.get(name=service_name)
-
-                        # Extract tokens
-                        input_tokens, output_tokens = extract_tokens(
-                            synthesis_response.get('metadata', {}),
-                            service_name
-                        )
-                        total_tokens = calculate_total_tokens(input_tokens, output_tokens)
-
-                        # Create AIResponse record
-                        AIResponse.objects.create(
-                            query=ai_query,
-                            service=service_obj,
-                            content=synthesis_response['content'],
-                            raw_response=synthesis_response.get('metadata', {}),
-                            summary='Response synthesis',
-                            input_tokens=input_tokens,
-                            output_tokens=output_tokens,
-                            tokens_used=total_tokens
-                        )
-
-                        # Ensure conversation aggregates reflect the new cost entry
-                        conversation.update_conversation_metadata()
-                    except Exception as e:
-                        print(f"Failed to track synthesis cost: {e}")
+                    track_completion_cost(
+                        conversation_id, f"Synthesis: {user_query[:100]}",
+                        synthesis_provider.lower(), synthesis_response, 'Response synthesis'
+                    )
 
-                return JsonResponse({
+                return json_response({
                     'success': True,
                     'synthesis': synthesis_response['content'],
                     'synthesis_provider': synthesis_provider
                 })
             else:
-                return JsonResponse({
+                return json_response({
                     'success': False,
                     'error': f"Synthesis generation failed: {synthesis_response.get('error', 'Unknown error')}"
-                }, status=500)
+                }, status_code=500)
         else:
-            return JsonResponse({
+            return json_response({
                 'success': False,
                 'error': 'No AI service available for synthesis functionality (configure Claude or OpenAI API keys)'
-            }, status=500)
+            }, status_code=500)
 
     except Exception as e:
-        return JsonResponse({
+        return json_response({
             'success': False,
             'error': str(e)
-        }, status=500)
+        }, status_code=500)
 
 
-@api_view(['POST'])
-@permission_classes([IsAuthenticated])
-def critique_compare(request):
-    """
-    Compare two LLM responses using AI critique framework.
-    POST /api/v1/consensus/critique/
-
-    Requires authentication.
-    """
-    # Check if consensus endpoints are enabled
-    disabled_response = check_consensus_endpoints_enabled()
-    if disabled_response:
-        return disabled_response
-
-    try:
-        data = request.data
-        user_query = data.get('user_query', '')
-        llm1_name = data.get('llm1_name', '')
-        llm1_response = data.get('llm1_response', '')
-        llm2_name = data.get('llm2_name', '')
-        llm2_response = data.get('llm2_response', '')
-        chat_history = data.get('chat_history', '')
-        conversation_id = data.get('conversation_id')  # Optional for cost tracking
-
-        # DEBUG: Log received conversation_id
-        print(f"[CRITIQUE_COMPARE DEBUG] Received conversation_id: {conversation_id}")
-        print(f"[CRITIQUE_COMPARE DEBUG] Request data keys: {data.keys()}")
-
-        if not all([user_query, llm1_name, llm1_response, llm2_name, llm2_response]):
-            return JsonResponse({
-                'success': False,
-                'error': 'Missing required fields'
-            }, status=400)
-
-        # Create the critique prompt using the framework you provided
-        critique_prompt = f"""You are tasked with conducting a thorough, objective analysis comparing two LLM responses to the same user query. Your goal is to evaluate both responses fairly across multiple dimensions and provide actionable insights for improvement.
+CRITIQUE_PROMPT_TEMPLATE = """You are tasked with conducting a thorough, objective analysis comparing two LLM responses to the same user query. Your goal is to evaluate both responses fairly across multiple dimensions and provide actionable insights for improvement.
 
 Original User Query along with chat history: {user_query}
 
@@ -903,119 +942,161 @@ What would a superior response combine from both? What novel approaches could su
 
 Focus on helping improve future responses while maintaining objectivity in your evaluation."""
 
+
+@api_view(['POST'])
+@parser_classes([ORJSONParser])
+@permission_classes([IsAuthenticated])
+@max_body_size(MAX_REQUEST_BODY_SIZE)
+@cached_post(timeout=60, uncached_fields=('conversation_id',))
+def critique_compare(request):
+    """
+    Compare two LLM responses using AI critique framework.
+    POST /api/v1/consensus/critique/
+
+    With "stream": true the critique is sent as NDJSON 'delta' lines as it is
+    generated, followed by a 'done' line.
+
+    Requires authentication.
+    """
+    # Check if consensus endpoints are enabled
+    disabled_response = check_consensus_endpoints_enabled()
+    if disabled_response:
+        return disabled_response
+
+    try:
+        data = request.data
+        user_query = data.get('user_query', '')
+        llm1_name = data.get('llm1_name', '')
+        llm1_response = data.get('llm1_response', '')
+        llm2_name = data.get('llm2_name', '')
+        llm2_response = data.get('llm2_response', '')
+        chat_history = data.get('chat_history', '')
+        conversation_id = data.get('conversation_id')  # Optional for cost tracking
+
+        logger.debug("critique_compare conversation_id=%s keys=%s", conversation_id, list(data.keys()))
+
+        if not all([user_query, llm1_name, llm1_response, llm2_name, llm2_response]):
+            return json_response({
+                'success': False,
+                'error': 'Missing required fields'
+            }, status_code=400)
+
+        # Create the critique prompt using the framework you provided
+        critique_prompt = CRITIQUE_PROMPT_TEMPLATE.format(
+            user_query=user_query,
+            chat_history=chat_history,
+            llm1_name=llm1_name,
+            llm1_response=llm1_response,
+            llm2_name=llm2_name,
+            llm2_response=llm2_response
+        )
+
         # Use OpenAI for critique to avoid bias (if available), fallback to Claude
+        claude_api_key = settings.CLAUDE_API_KEY
+        openai_api_key = settings.OPENAI_API_KEY
         critique_service = None
         critique_provider = None
+        critique_service_name = None
 
         # Try OpenAI first to avoid self-evaluation bias when comparing Claude responses
-        if settings.OPENAI_API_KEY and 'claude' in [llm1_name.lower(), llm2_name.lower()]:
+        if openai_api_key and 'claude' in [llm1_name.lower(), llm2_name.lower()]:
             try:
                 critique_service = AIServiceFactory.create_service(
                     'openai',
-                    settings.OPENAI_API_KEY,
-                    model='gpt-4o'
+                    openai_api_key,
+                    model=PROVIDER_MODELS['openai']
                 )
                 critique_provider = 'OpenAI (unbiased)'
+                critique_service_name = 'openai'
             except Exception:
                 critique_service = None
 
         # Fallback to Claude if OpenAI unavailable or no Claude responses being compared
-        if not critique_service and settings.CLAUDE_API_KEY:
+        if not critique_service and claude_api_key:
             critique_service = AIServiceFactory.create_service(
                 'claude',
-                settings.CLAUDE_API_KEY,
-                model='claude-sonnet-4-20250514'
+                claude_api_key,
+                model=PROVIDER_MODELS['claude']
             )
             critique_provider = 'Claude'
+            critique_service_name = 'claude'
 
-        if critique_service:
-            # Run async function
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                critique_response = loop.run_until_complete(
-                    critique_service.generate_response(critique_prompt)
+        if critique_service and data.get('stream'):
+            track = None
+            if conversation_id:
+                track = lambda response: track_completion_cost(
+                    conversation_id, f"Critique: {user_query[:100]}",
+                    critique_service_name, response, 'Response comparison critique'
                 )
-            finally:
-                loop.close()
+            return ndjson_stream_response(request, stream_completion_async(
+                critique_service, critique_prompt, 'critique', 'critique_provider', critique_provider, track
+            ))
+
+        if critique_service:
+            # Server's event loop under ASGI; a loop for this call under WSGI
+            critique_response = async_to_sync(cached_generate_response)(
+                critique_service, critique_service_name, critique_service.model, critique_prompt,
+                user_id=request.user.pk
+            )
 
             if critique_response['success']:
                 # Track cost if conversation_id provided
-                print(f"[CRITIQUE_COMPARE DEBUG] About to check conversation_id: {conversation_id}")
                 if conversation_id:
-                    print(f"[CRITIQUE_COMPARE DEBUG] conversation_id is truthy, attempting to track cost")
-                    try:
-                        from uuid import UUID
-                        conversation = Conversation.objects.get(id=UUID(conversation_id))
-                        print(f"[CRITIQUE_COMPARE DEBUG] Found conversation: {conversation.id}")
-                        ai_query = AIQuery.objects.create(
-                            user=conversation.user,
-                            conversation=conversation,
-                            prompt=f"Critique: {user_query[:100]}",
-                            status='completed',
-                            started_at=timezone.now(),
-                            completed_at=timezone.now()
-                        )
-                        print(f"[CRITIQUE_COMPARE DEBUG] Created AIQuery: {ai_query.id}")
-
-                        # Get service object
-                        service_name = 'openai' if 'openai' in critique_provider.lower() else 'claude'
-                        service_obj = AIService.objects.get(name=service_name)
-
-                        # Extract tokens
-                        input_tokens, output_tokens = extract_tokens(
-                            critique_response.get('metadata', {}),
-                            service_name
-                        )
-                        total_tokens = calculate_total_tokens(input_tokens, output_tokens)
+                    track_completion_cost(
+                        conversation_id, f"Critique: {user_query[:100]}",
+                        critique_service_name, critique_response, 'Response comparison critique'
+                    )
 
-                        # Create AIResponse record
-                        AIResponse.objects.create(
-                            query=ai_query,
-                            service=service_obj,
-                            content=critique_response['content'],
-                            raw_response=critique_response.get('metadata', {}),
-                            summary='Response comparison critique',
-                            input_tokens=input_tokens,
-                            output_tokens=output_tokens,
-                            tokens_used=total_tokens
-                        )
-                        print(f"[CRITIQUE_COMPARE DEBUG] Created AIResponse for service: {service_name}")
-
-                        # Refresh conversation aggregates so cost updates propagate to the UI
-                        conversation.update_conversation_metadata()
-                    except Exception as e:
-                        print(f"[CRITIQUE_COMPARE DEBUG] Failed to track critique cost: {e}")
-                        import traceback
-                        traceback.print_exc()
-                else:
-                    print(f"[CRITIQUE_COMPARE DEBUG] conversation_id is falsy, skipping cost tracking")
-
-                return JsonResponse({
+                return json_response({
                     'success': True,
                     'critique': critique_response['content'],
                     'critique_provider': critique_provider
                 })
             else:
-                return JsonResponse({
+                return json_response({
                     'success': False,
                     'error': f"Critique generation failed: {critique_response.get('error', 'Unknown error')}"
-                }, status=500)
+                }, status_code=500)
         else:
-            return JsonResponse({
+            return json_response({
                 'success': False,
                 'error': 'No AI service available for critique functionality (configure OpenAI or Claude API keys)'
-            }, status=500)
+            }, status_code=500)
 
     except Exception as e:
-        return JsonResponse({
+        return json_response({
             'success': False,
             'error': str(e)
-        }, status=500)
+        }, status_code=500)
+
+
+REFLECTION_PROMPT_TEMPLATE = """You are {name}, and you previously provided a response to a user's query. Now you are given the opportunity to reflect on another AI's response to the same query.
+
+Original User Query: {user_query}
+
+Chat History: {chat_history}
+
+Your Original Response:
+{own_response}
+
+{peer_name}'s Response:
+{peer_response}
+
+Instructions:
+Please provide a thoughtful reflection on {peer_name}'s response. Consider:
+1. What insights or perspectives did {peer_name} offer that you may have missed or underemphasized?
+2. Are there any points where {peer_name}'s approach differs from yours? If so, evaluate the merits of their approach.
+3. What can you learn from {peer_name}'s response that could improve your future answers?
+4. If you were to revise your original response based on {peer_name}'s perspective, what would you change or add?
+5. Are there any areas where you still believe your approach was stronger? Explain why.
+
+Provide a balanced, constructive reflection that demonstrates intellectual honesty and a willingness to learn from other perspectives."""
 
 
 @api_view(['POST'])
+@parser_classes([ORJSONParser])
 @permission_classes([IsAuthenticated])
+@max_body_size(MAX_REQUEST_BODY_SIZE)
 def cross_reflect(request):
     """
     Generate cross-reflections where each LLM reflects on the other's response.
@@ -1040,24 +1121,24 @@ def cross_reflect(request):
         conversation_id = data.get('conversation_id')  # Optional for cost tracking
 
         if not all([user_query, llm1_name, llm1_response, llm2_name, llm2_response]):
-            return JsonResponse({
+            return json_response({
                 'success': False,
                 'error': 'Missing required fields'
-            }, status=400)
+            }, status_code=400)
 
         # Map service names to their configurations
         service_config = {
             'claude': {
                 'api_key': settings.CLAUDE_API_KEY,
-                'model': 'claude-sonnet-4-20250514'
+                'model': PROVIDER_MODELS['claude']
             },
             'openai': {
                 'api_key': settings.OPENAI_API_KEY,
-                'model': 'gpt-4o'
+                'model': PROVIDER_MODELS['openai']
             },
             'gemini': {
                 'api_key': settings.GEMINI_API_KEY,
-                'model': 'gemini-2.0-flash-exp'
+                'model': PROVIDER_MODELS['gemini']
             }
         }
 
@@ -1067,233 +1148,134 @@ def cross_reflect(request):
 
         # Validate that both services are available
         if llm1_key not in service_config or llm2_key not in service_config:
-            return JsonResponse({
+            return json_response({
                 'success': False,
                 'error': f'Invalid service names: {llm1_name}, {llm2_name}'
-            }, status=400)
+            }, status_code=400)
 
         if not service_config[llm1_key]['api_key'] or not service_config[llm2_key]['api_key']:
-            return JsonResponse({
+            return json_response({
                 'success': False,
                 'error': 'API keys not configured for the selected services'
-            }, status=400)
-
-        # Create reflection prompts
-        # LLM1 reflects on LLM2's response
-        llm1_reflection_prompt = f"""You are {llm1_name}, and you previously provided a response to a user's query. Now you are given the opportunity to reflect on another AI's response to the same query.
-
-Original User Query: {user_query}
-
-Chat History: {chat_history}
-
-Your Original Response:
-{llm1_response}
+            }, status_code=400)
 
-{llm2_name}'s Response:
-{llm2_response}
-
-Instructions:
-Please provide a thoughtful reflection on {llm2_name}'s response. Consider:
-1. What insights or perspectives did {llm2_name} offer that you may have missed or underemphasized?
-2. Are there any points where {llm2_name}'s approach differs from yours? If so, evaluate the merits of their approach.
-3. What can you learn from {llm2_name}'s response that could improve your future answers?
-4. If you were to revise your original response based on {llm2_name}'s perspective, what would you change or add?
-5. Are there any areas where you still believe your approach was stronger? Explain why.
-
-Provide a balanced, constructive reflection that demonstrates intellectual honesty and a willingness to learn from other perspectives."""
-
-        # LLM2 reflects on LLM1's response
-        llm2_reflection_prompt = f"""You are {llm2_name}, and you previously provided a response to a user's query. Now you are given the opportunity to reflect on another AI's response to the same query.
-
-Original User Query: {user_query}
-
-Chat History: {chat_history}
-
-Your Original Response:
-{llm2_response}
-
-{llm1_name}'s Response:
-{llm1_response}
-
-Instructions:
-Please provide a thoughtful reflection on {llm1_name}'s response. Consider:
-1. What insights or perspectives did {llm1_name} offer that you may have missed or underemphasized?
-2. Are there any points where {llm1_name}'s approach differs from yours? If so, evaluate the merits of their approach.
-3. What can you learn from {llm1_name}'s response that could improve your future answers?
-4. If you were to revise your original response based on {llm1_name}'s perspective, what would you change or add?
-5. Are there any areas where you still believe your approach was stronger? Explain why.
-
-Provide a balanced, constructive reflection that demonstrates intellectual honesty and a willingness to learn from other perspectives."""
-
-        # Create AI service instances
-        llm1_service = AIServiceFactory.create_service(
-            llm1_key,
-            service_config[llm1_key]['api_key'],
-            model=service_config[llm1_key]['model']
+        # Each LLM reflects on the other's response: (name, key, own response, peer name, peer response)
+        sides = (
+            (llm1_name, llm1_key, llm1_response, llm2_name, llm2_response),
+            (llm2_name, llm2_key, llm2_response, llm1_name, llm1_response),
         )
 
-        llm2_service = AIServiceFactory.create_service(
-            llm2_key,
-            service_config[llm2_key]['api_key'],
-            model=service_config[llm2_key]['model']
-        )
-
-        # Run both reflections in parallel for better performance
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            # Generate both reflections concurrently
-            llm1_reflection_response, llm2_reflection_response = loop.run_until_complete(
-                asyncio.gather(
-                    llm1_service.generate_response(llm1_reflection_prompt),
-                    llm2_service.generate_response(llm2_reflection_prompt)
+        # Run both reflection chains in parallel (on the server's event loop
+        # under ASGI, on a loop for this request under WSGI)
+        async def run_reflections():
+            return await asyncio.gather(*(
+                reflect_with_synopsis(
+                    AIServiceFactory.create_service(
+                        key,
+                        service_config[key]['api_key'],
+                        model=service_config[key]['model']
+                    ),
+                    REFLECTION_PROMPT_TEMPLATE.format(
+                        name=name,
+                        user_query=user_query,
+                        chat_history=chat_history,
+                        own_response=own_response,
+                        peer_name=peer_name,
+                        peer_response=peer_response
+                    ),
+                    key,
+                    service_config[key]['model'],
+                    request.user.pk
                 )
-            )
+                for name, key, own_response, peer_name, peer_response in sides
+            ), return_exceptions=True)
+
+        # A chain that raised is reported under its service name without
+        # discarding the other reflection
+        reflections = [
+            ({'success': False, 'error': str(result)}, None) if isinstance(result, Exception) else result
+            for result in async_to_sync(run_reflections)()
+        ]
+
+        # Only fail the request when neither side produced a reflection
+        errors = [
+            f"{name}: {reflection.get('error', 'Unknown error')}"
+            for (name, *_), (reflection, _) in zip(sides, reflections)
+            if not reflection.get('success')
+        ]
+        if len(errors) == len(sides):
+            return json_response({
+                'success': False,
+                'error': f"Cross-reflection failed: {'; '.join(errors)}"
+            }, status_code=500)
 
-            # Generate synopses for both reflections
-            llm1_synopsis, llm2_synopsis = loop.run_until_complete(
-                asyncio.gather(
-                    generate_synopsis_with_same_ai(
-                        llm1_reflection_response.get('content', ''),
-                        llm1_key,
-                        service_config[llm1_key]['api_key'],
-                        service_config[llm1_key]['model']
-                    ) if llm1_reflection_response.get('success') else asyncio.sleep(0, result="Reflection failed"),
-                    generate_synopsis_with_same_ai(
-                        llm2_reflection_response.get('content', ''),
-                        llm2_key,
-                        service_config[llm2_key]['api_key'],
-                        service_config[llm2_key]['model']
-                    ) if llm2_reflection_response.get('success') else asyncio.sleep(0, result="Reflection failed")
+        # Track cost if conversation_id provided
+        if conversation_id:
+            try:
+                from uuid import UUID
+                conversation = Conversation.objects.get(id=UUID(conversation_id))
+                ai_query = AIQuery.objects.create(
+                    user=conversation.user,
+                    conversation=conversation,
+                    prompt=f"Cross-reflection: {user_query[:100]}",
+                    status='completed',
+                    started_at=timezone.now(),
+                    completed_at=timezone.now()
                 )
-            )
-        finally:
-            loop.close()
-
-        # Check if both reflections succeeded
-        if llm1_reflection_response.get('success') and llm2_reflection_response.get('success'):
-            # Track cost if conversation_id provided
-            if conversation_id:
-                try:
-                    from uuid import UUID
-                    conversation = Conversation.objects.get(id=UUID(conversation_id))
-                    ai_query = AIQuery.objects.create(
-                        user=conversation.user,
-                        conversation=conversation,
-                        prompt=f"Cross-reflection: {user_query[:100]}",
-                        status='completed',
-                        started_at=timezone.now(),
-                        completed_at=timezone.now()
-                    )
-
-                    # Track LLM1's reflection
-                    llm1_service_obj = AIService.objects.get(name=llm1_key)
-                    llm1_input_tokens, llm1_output_tokens = extract_tokens(
-                        llm1_reflection_response.get('metadata', {}),
-                        llm1_key
-                    )
-                    llm1_total_tokens = calculate_total_tokens(llm1_input_tokens, llm1_output_tokens)
 
+                for (name, key, _, peer_name, _), (reflection, synopsis) in zip(sides, reflections):
+                    # A failed side produced nothing billable to record
+                    if not reflection.get('success'):
+                        continue
+                    service_obj = AIService.objects.get(name=key)
+                    input_tokens, output_tokens = extract_tokens(reflection.get('metadata', {}), key)
                     AIResponse.objects.create(
                         query=ai_query,
-                        service=llm1_service_obj,
-                        content=llm1_reflection_response.get('content', ''),
-                        raw_response=llm1_reflection_response.get('metadata', {}),
-                        summary=f'{llm1_name} reflecting on {llm2_name}',
-                        input_tokens=llm1_input_tokens,
-                        output_tokens=llm1_output_tokens,
-                        tokens_used=llm1_total_tokens
-                    )
-
-                    # Track LLM2's reflection
-                    llm2_service_obj = AIService.objects.get(name=llm2_key)
-                    llm2_input_tokens, llm2_output_tokens = extract_tokens(
-                        llm2_reflection_response.get('metadata', {}),
-                        llm2_key
-                    )
-                    llm2_total_tokens = calculate_total_tokens(llm2_input_tokens, llm2_output_tokens)
-
-                    AIResponse.objects.create(
-                        query=ai_query,
-                        service=llm2_service_obj,
-                        content=llm2_reflection_response.get('content', ''),
-                        raw_response=llm2_reflection_response.get('metadata', {}),
-                        summary=f'{llm2_name} reflecting on {llm1_name}',
-                        input_tokens=llm2_input_tokens,
-                        output_tokens=llm2_output_tokens,
-                        tokens_used=llm2_total_tokens
+                        service=service_obj,
+                        content=reflection.get('content', ''),
+                        raw_response=reflection.get('metadata', {}),
+                        summary=f'{name} reflecting on {peer_name}',
+                        input_tokens=input_tokens,
+                        output_tokens=output_tokens,
+                        tokens_used=calculate_total_tokens(input_tokens, output_tokens)
                     )
 
                     # Track synopsis costs if they were generated
-                    if isinstance(llm1_synopsis, dict) and llm1_synopsis.get('success'):
-                        llm1_syn_input, llm1_syn_output = extract_tokens(
-                            llm1_synopsis.get('metadata', {}),
-                            llm1_key
-                        )
+                    if isinstance(synopsis, dict) and synopsis.get('success'):
+                        syn_input, syn_output = extract_tokens(synopsis.get('metadata', {}), key)
                         AIResponse.objects.create(
                             query=ai_query,
-                            service=llm1_service_obj,
-                            content=llm1_synopsis.get('synopsis', ''),
-                            raw_response=llm1_synopsis.get('metadata', {}),
+                            service=service_obj,
+                            content=synopsis.get('synopsis', ''),
+                            raw_response=synopsis.get('metadata', {}),
                             summary='Synopsis generation for cross-reflection',
-                            input_tokens=llm1_syn_input,
-                            output_tokens=llm1_syn_output,
-                            tokens_used=calculate_total_tokens(llm1_syn_input, llm1_syn_output)
+                            input_tokens=syn_input,
+                            output_tokens=syn_output,
+                            tokens_used=calculate_total_tokens(syn_input, syn_output)
                         )
 
-                    if isinstance(llm2_synopsis, dict) and llm2_synopsis.get('success'):
-                        llm2_syn_input, llm2_syn_output = extract_tokens(
-                            llm2_synopsis.get('metadata', {}),
-                            llm2_key
-                        )
-                        AIResponse.objects.create(
-                            query=ai_query,
-                            service=llm2_service_obj,
-                            content=llm2_synopsis.get('synopsis', ''),
-                            raw_response=llm2_synopsis.get('metadata', {}),
-                            summary='Synopsis generation for cross-reflection',
-                            input_tokens=llm2_syn_input,
-                            output_tokens=llm2_syn_output,
-                            tokens_used=calculate_total_tokens(llm2_syn_input, llm2_syn_output)
-                        )
+                # Refresh conversation metadata so aggregated costs include these reflections
+                conversation.update_conversation_metadata()
+            except Exception as e:
+                print(f"Failed to track cross-reflection cost: {e}")
 
-                    # Refresh conversation metadata so aggregated costs include these reflections
-                    conversation.update_conversation_metadata()
-                except Exception as e:
-                    print(f"Failed to track cross-reflection cost: {e}")
-
-            return JsonResponse({
-                'success': True,
-                'reflections': [
-                    {
-                        'service': llm1_name,
-                        'content': llm1_reflection_response.get('content', ''),
-                        'synopsis': llm1_synopsis.get('synopsis', 'No synopsis available') if isinstance(llm1_synopsis, dict) else llm1_synopsis,
-                        'reflecting_on': llm2_name
-                    },
-                    {
-                        'service': llm2_name,
-                        'content': llm2_reflection_response.get('content', ''),
-                        'synopsis': llm2_synopsis.get('synopsis', 'No synopsis available') if isinstance(llm2_synopsis, dict) else llm2_synopsis,
-                        'reflecting_on': llm1_name
-                    }
-                ]
-            })
-        else:
-            # Handle partial or complete failure
-            errors = []
-            if not llm1_reflection_response.get('success'):
-                errors.append(f"{llm1_name}: {llm1_reflection_response.get('error', 'Unknown error')}")
-            if not llm2_reflection_response.get('success'):
-                errors.append(f"{llm2_name}: {llm2_reflection_response.get('error', 'Unknown error')}")
-
-            return JsonResponse({
-                'success': False,
-                'error': f"Cross-reflection failed: {'; '.join(errors)}"
-            }, status=500)
+        return json_response({
+            'success': True,
+            'reflections': [
+                {
+                    'service': name,
+                    'success': bool(reflection.get('success')),
+                    'error': None if reflection.get('success') else reflection.get('error', 'Unknown error'),
+                    'content': reflection.get('content', ''),
+                    'synopsis': synopsis.get('synopsis', 'No synopsis available') if isinstance(synopsis, dict) else synopsis,
+                    'reflecting_on': peer_name
+                }
+                for (name, _, _, peer_name, _), (reflection, synopsis) in zip(sides, reflections)
+            ]
+        })
 
     except Exception as e:
-        return JsonResponse({
+        return json_response({
             'success': False,
             'error': str(e)
-        }, status=500)
+        }, status_code=500)
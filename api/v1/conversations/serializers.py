@@ -2,6 +2,11 @@
 DRF serializers for conversations API.
 """
 from rest_framework import serializers
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.contrib.postgres.search import SearchVector, SearchQuery, SearchRank
 from django.db.models import Q, Count, F, Sum
 from django.db import models
@@ -36,13 +41,36 @@ class ConversationContextSerializer(serializers.ModelSerializer):
         read_only_fields = ['updated_at']
 
 
+class ConversationListPageSerializer(serializers.ListSerializer):
+    """List serializer that loads per-page lookups in bulk."""
+
+    def to_representation(self, data):
+        conversations = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        conversation_ids = [conversation.id for conversation in conversations]
+
+        services_by_conversation = {}
+        service_rows = AIResponse.objects.filter(
+            query__conversation_id__in=conversation_ids
+        ).order_by().values_list('query__conversation_id', 'service__name').distinct()
+        for conversation_id, service_name in service_rows:
+            services_by_conversation.setdefault(conversation_id, []).append(service_name)
+        self._context['ai_services_used'] = services_by_conversation
+
+        return super().to_representation(conversations)
+
+
 class ConversationListSerializer(serializers.ModelSerializer):
-    """Lightweight serializer for conversation list view."""
+    """
+    Lightweight serializer for conversation list view.
+
+    Expects a queryset annotated with ConversationQuerySet.with_list_stats().
+    """
 
     last_message_at = serializers.SerializerMethodField()
     last_message_excerpt = serializers.SerializerMethodField()
     ai_services_used = serializers.SerializerMethodField()
-    total_cost = serializers.SerializerMethodField()
+    # Stored by update_conversation_metadata() from conversation_cost_view on every write
+    total_cost = serializers.FloatField(read_only=True)
 
     class Meta:
         model = Conversation
@@ -52,40 +80,30 @@ class ConversationListSerializer(serializers.ModelSerializer):
             'last_message_excerpt', 'ai_services_used', 'total_cost'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'total_messages', 'total_tokens_used']
+        list_serializer_class = ConversationListPageSerializer
 
     def get_last_message_at(self, obj):
         """Get timestamp of the last message."""
-        last_message = obj.messages.order_by('-timestamp').first()
-        return last_message.timestamp if last_message else obj.updated_at
+        return obj.latest_message_at or obj.updated_at
 
     def get_last_message_excerpt(self, obj):
         """Get excerpt of last user message for preview."""
-        last_user_message = obj.messages.filter(role='user').order_by('-timestamp').first()
-        if last_user_message and last_user_message.content:
-            content = last_user_message.content.strip()
+        if obj.latest_user_message:
+            content = obj.latest_user_message.strip()
             return content[:100] + "..." if len(content) > 100 else content
         return ""
 
     def get_ai_services_used(self, obj):
         """Get list of AI services used in this conversation."""
+        services_by_conversation = self.context.get('ai_services_used')
+        if services_by_conversation is not None:
+            return services_by_conversation.get(obj.id, [])
+
         services = AIResponse.objects.filter(
             query__conversation=obj
-        ).values_list('service__name', flat=True).distinct()
+        ).order_by().values_list('service__name', flat=True).distinct()
         return list(services)
 
-    def get_total_cost(self, obj):
-        """Calculate total cost of this conversation from database view."""
-        from django.db import connection
-
-        # Format UUID based on database backend: SQLite uses 32-char strings without hyphens, PostgreSQL uses canonical format
-        conversation_id = str(obj.id).replace('-', '') if connection.vendor == 'sqlite' else str(obj.id)
-
-        sql = "SELECT total_cost FROM conversation_cost_view WHERE conversation_id = %s"
-        with connection.cursor() as cursor:
-            cursor.execute(sql, [conversation_id])
-            row = cursor.fetchone()
-            return float(row[0]) if row else 0.0
-
 
 class ConversationDetailSerializer(serializers.ModelSerializer):
     """Detailed serializer for conversation with messages and context."""
@@ -94,7 +112,8 @@ class ConversationDetailSerializer(serializers.ModelSerializer):
     context = ConversationContextSerializer(read_only=True)
     recent_queries = serializers.SerializerMethodField()
     ai_services_used = serializers.SerializerMethodField()
-    total_cost = serializers.SerializerMethodField()
+    # Stored by update_conversation_metadata() from conversation_cost_view on every write
+    total_cost = serializers.FloatField(read_only=True)
 
     class Meta:
         model = Conversation
@@ -109,20 +128,16 @@ class ConversationDetailSerializer(serializers.ModelSerializer):
 
     def get_recent_queries(self, obj):
         """Get recent AI queries for this conversation."""
-        queries = obj.ai_queries.order_by('-started_at')[:5]
-        return [
-            {
-                'id': str(q.id),
-                'status': q.status,
-                'started_at': q.started_at,
-                'completed_at': q.completed_at,
-                'total_responses': q.total_responses
-            }
-            for q in queries
-        ]
+        queries = obj.ai_queries.order_by('-started_at').values(
+            'id', 'status', 'started_at', 'completed_at', 'total_responses'
+        )[:5]
+        return [{**q, 'id': str(q['id'])} for q in queries]
 
     def get_ai_services_used(self, obj):
         """Get detailed AI services usage."""
+        if 'ai_queries' in getattr(obj, '_prefetched_objects_cache', {}):
+            return self._aggregate_prefetched_services(obj)
+
         services = AIResponse.objects.filter(
             query__conversation=obj
         ).values('service__name', 'service__display_name').annotate(
@@ -132,18 +147,49 @@ class ConversationDetailSerializer(serializers.ModelSerializer):
         )
         return list(services)
 
-    def get_total_cost(self, obj):
-        """Calculate total cost of this conversation from database view."""
-        from django.db import connection
-
-        # Format UUID based on database backend: SQLite uses 32-char strings without hyphens, PostgreSQL uses canonical format
-        conversation_id = str(obj.id).replace('-', '') if connection.vendor == 'sqlite' else str(obj.id)
-
-        sql = "SELECT total_cost FROM conversation_cost_view WHERE conversation_id = %s"
-        with connection.cursor() as cursor:
-            cursor.execute(sql, [conversation_id])
-            row = cursor.fetchone()
-            return float(row[0]) if row else 0.0
+    def _aggregate_prefetched_services(self, obj):
+        """Group prefetched responses by service, matching the GROUP BY query's rows."""
+        services = {}
+        for query in obj.ai_queries.all():
+            for response in query.responses.all():
+                entry = services.get(response.service_id)
+                if entry is None:
+                    entry = services[response.service_id] = {
+                        'service__name': response.service.name,
+                        'service__display_name': response.service.display_name,
+                        'response_count': 0,
+                        'total_tokens': 0,
+                        'total_cost': 0,
+                    }
+                entry['response_count'] += 1
+                entry['total_tokens'] += response.tokens_used
+                entry['total_cost'] += response.cost
+        return list(services.values())
+
+
+DEMO_USERNAME = 'testuser'
+_DEMO_USER_ID_CACHE_KEY = 'conversations:demo_user_id'
+_DEMO_USER_ID_CACHE_TTL = 300
+
+
+def get_demo_user_id():
+    """Return the demo user's primary key, cached briefly once it exists."""
+    demo_user_id = cache.get(_DEMO_USER_ID_CACHE_KEY)
+    if demo_user_id is None:
+        demo_user_id = get_user_model().objects.filter(
+            username=DEMO_USERNAME
+        ).values_list('pk', flat=True).first()
+        if demo_user_id is not None:
+            cache.set(_DEMO_USER_ID_CACHE_KEY, demo_user_id, _DEMO_USER_ID_CACHE_TTL)
+    return demo_user_id
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def _reset_demo_user_id_cache(instance, **kwargs):
+    """Drop the cached demo user id when that user is recreated or deleted."""
+    if getattr(instance, 'username', None) == DEMO_USERNAME:
+        cache.delete(_DEMO_USER_ID_CACHE_KEY)
 
 
 class ConversationCreateSerializer(serializers.ModelSerializer):
@@ -155,20 +201,13 @@ class ConversationCreateSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         """Create conversation with user from request context if authenticated."""
-        from django.contrib.auth import get_user_model
-
         request = self.context.get('request')
         if request and request.user and request.user.is_authenticated:
             validated_data['user'] = request.user
         else:
-            # Use default demo user for unauthenticated conversations (enables cost tracking)
-            User = get_user_model()
-            try:
-                demo_user = User.objects.get(username='testuser')
-                validated_data['user'] = demo_user
-            except User.DoesNotExist:
-                # Keep anonymous conversations unowned for privacy
-                validated_data['user'] = None
+            # Use default demo user for unauthenticated conversations (enables cost tracking);
+            # without one, anonymous conversations stay unowned for privacy
+            validated_data['user_id'] = get_demo_user_id()
         return super().create(validated_data)
 
 
@@ -213,12 +252,11 @@ class ConversationForkSerializer(serializers.Serializer):
 
         # Validate from_message_id belongs to this conversation
         if 'from_message_id' in data:
-            try:
-                message = Message.objects.get(
-                    id=data['from_message_id'],
-                    conversation_id=conversation_id
-                )
-            except Message.DoesNotExist:
+            message_exists = Message.objects.filter(
+                id=data['from_message_id'],
+                conversation_id=conversation_id
+            ).exists()
+            if not message_exists:
                 raise serializers.ValidationError("Message not found in this conversation")
 
         return data
@@ -5,13 +5,15 @@ from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.contrib.postgres.search import SearchVector, SearchQuery, SearchRank
-from django.db.models import Q, Prefetch
-from django.db import connection
+from django.db.models import Count, Exists, OuterRef, Prefetch, Subquery, Sum
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 import uuid
 
+from apps.ai_services.models import AIQuery
 from apps.conversations.models import Conversation, Message
+from apps.responses.models import AIResponse
+from core.pagination import CursorResultsSetPagination
 from .serializers import (
     ConversationListSerializer, ConversationDetailSerializer,
     ConversationCreateSerializer, ConversationUpdateSerializer,
@@ -27,6 +29,7 @@ class ConversationViewSet(viewsets.ModelViewSet):
     Provides CRUD operations, search, and conversation forking.
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = CursorResultsSetPagination
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['title', 'messages__content']
     ordering_fields = ['created_at', 'updated_at', 'total_tokens_used', 'title']
@@ -36,19 +39,33 @@ class ConversationViewSet(viewsets.ModelViewSet):
         """Return conversations for the authenticated user only."""
         queryset = Conversation.objects.filter(user=self.request.user)
 
-        # Optimize queries based on action
+        # Optimize queries based on action. Serializers never read obj.user,
+        # so the user row is not joined; the stored search vector is only
+        # used for filtering and is left out of list rows.
         if self.action == 'list':
-            # For list view, only show conversations with messages and prefetch related data
-            queryset = queryset.filter(total_messages__gt=0).prefetch_related(
-                Prefetch('messages', queryset=Message.objects.select_related().order_by('-timestamp'))
-            ).select_related('user')
+            # For list view, only show conversations with messages; the latest
+            # message fields come from annotations rather than a messages prefetch
+            queryset = queryset.filter(total_messages__gt=0).defer('search_vector').with_list_stats()
+        elif self.action == 'search':
+            queryset = queryset.defer('search_vector').with_list_stats()
         elif self.action == 'retrieve':
-            # For detail view, prefetch all related data
-            queryset = queryset.prefetch_related(
+            # For detail view, prefetch all related data. Queries and
+            # responses only feed the per-service usage totals, so their
+            # prompts, content and raw payloads are not loaded.
+            responses = AIResponse.objects.only(
+                'query', 'service', 'tokens_used', 'cost',
+                'service__name', 'service__display_name'
+            ).select_related('service')
+            queryset = queryset.defer('search_vector').prefetch_related(
                 'messages',
-                'ai_queries__responses__service',
+                Prefetch(
+                    'ai_queries',
+                    queryset=AIQuery.objects.only('conversation').prefetch_related(
+                        Prefetch('responses', queryset=responses)
+                    )
+                ),
                 'context'
-            ).select_related('user')
+            )
 
         return queryset
 
@@ -83,6 +100,15 @@ class ConversationViewSet(viewsets.ModelViewSet):
         """Create conversation for the authenticated user."""
         serializer.save(user=self.request.user)
 
+    def perform_update(self, serializer):
+        """Save the update, rebuilding the search vector if the title changed."""
+        title_changed = 'title' in serializer.validated_data and (
+            serializer.validated_data['title'] != serializer.instance.title
+        )
+        conversation = serializer.save()
+        if title_changed:
+            Conversation.objects.filter(pk=conversation.pk).refresh_search_vector()
+
     @action(detail=False, methods=['get'])
     def search(self, request):
         """
@@ -96,16 +122,7 @@ class ConversationViewSet(viewsets.ModelViewSet):
         # Apply search query
         search_query = serializer.validated_data.get('q')
         if search_query:
-            if connection.vendor == 'postgresql':
-                queryset = queryset.annotate(
-                    search=SearchVector('title', 'messages__content'),
-                    rank=SearchRank(SearchVector('title', 'messages__content'), SearchQuery(search_query))
-                ).filter(search=SearchQuery(search_query)).order_by('-rank', '-updated_at')
-            else:
-                queryset = queryset.filter(
-                    Q(title__icontains=search_query) |
-                    Q(messages__content__icontains=search_query)
-                ).distinct().order_by('-updated_at')
+            queryset = queryset.search(search_query)
 
         # Apply filters
         date_from = serializer.validated_data.get('date_from')
@@ -118,7 +135,10 @@ class ConversationViewSet(viewsets.ModelViewSet):
 
         service = serializer.validated_data.get('service')
         if service:
-            queryset = queryset.filter(ai_queries__responses__service__name=service).distinct()
+            queryset = queryset.filter(Exists(AIResponse.objects.filter(
+                query__conversation=OuterRef('pk'),
+                service__name=service
+            )))
 
         min_tokens = serializer.validated_data.get('min_tokens')
         if min_tokens:
@@ -154,48 +174,41 @@ class ConversationViewSet(viewsets.ModelViewSet):
 
         # Create new conversation
         title = serializer.validated_data.get('title') or f"Fork of {conversation.title}"
-        new_conversation = Conversation.objects.create(
-            user=request.user,
-            title=title,
-            agent_mode=conversation.agent_mode
-        )
-
-        # Copy messages up to specified point
-        from_message_id = serializer.validated_data.get('from_message_id')
-        if from_message_id:
-            # Copy messages up to and including the specified message
-            messages_to_copy = conversation.messages.filter(
-                timestamp__lte=Message.objects.get(id=from_message_id).timestamp
-            ).order_by('timestamp')
-        else:
-            # Copy all messages
-            messages_to_copy = conversation.messages.all().order_by('timestamp')
-
-        # Create new messages in the forked conversation
-        for message in messages_to_copy:
-            Message.objects.create(
-                conversation=new_conversation,
-                role=message.role,
-                content=message.content,
-                tokens_used=message.tokens_used,
-                metadata=message.metadata.copy() if message.metadata else {}
+        with transaction.atomic():
+            new_conversation = Conversation.objects.create(
+                user=request.user,
+                title=title,
+                agent_mode=conversation.agent_mode
             )
 
-        # Update conversation totals
-        total_messages = messages_to_copy.count()
-        total_tokens = sum(msg.tokens_used for msg in messages_to_copy)
-        new_conversation.total_messages = total_messages
-        new_conversation.total_tokens_used = total_tokens
-        new_conversation.save(update_fields=['total_messages', 'total_tokens_used'])
-
-        # Copy context if it exists
-        if hasattr(conversation, 'context'):
-            from apps.conversations.models import ConversationContext
-            ConversationContext.objects.create(
-                conversation=new_conversation,
-                selected_ai_service=conversation.context.selected_ai_service,
-                context_data=conversation.context.context_data.copy() if conversation.context.context_data else {}
-            )
+            # Copy messages up to specified point
+            from_message_id = serializer.validated_data.get('from_message_id')
+            if from_message_id:
+                # Copy messages up to and including the specified message
+                cutoff = Message.objects.filter(pk=from_message_id).values('timestamp')[:1]
+                messages_to_copy = conversation.messages.filter(timestamp__lte=Subquery(cutoff))
+            else:
+                # Copy all messages
+                messages_to_copy = conversation.messages.all()
+
+            # Copy the messages server-side into the forked conversation
+            messages_to_copy.copy_to(new_conversation)
+
+            # Update conversation totals
+            totals = messages_to_copy.aggregate(count=Count('id'), tokens=Sum('tokens_used'))
+            new_conversation.total_messages = totals['count']
+            new_conversation.total_tokens_used = totals['tokens'] or 0
+            new_conversation.save(update_fields=['total_messages', 'total_tokens_used'])
+            Conversation.objects.filter(pk=new_conversation.pk).refresh_search_vector()
+
+            # Copy context if it exists
+            if hasattr(conversation, 'context'):
+                from apps.conversations.models import ConversationContext
+                ConversationContext.objects.create(
+                    conversation=new_conversation,
+                    selected_ai_service=conversation.context.selected_ai_service,
+                    context_data=conversation.context.context_data.copy() if conversation.context.context_data else {}
+                )
 
         serializer = ConversationDetailSerializer(new_conversation)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -229,28 +242,28 @@ class MessageViewSet(viewsets.ModelViewSet):
         if not conversation_id:
             return Message.objects.none()
 
-        # Get the conversation and verify ownership
-        conversation = get_object_or_404(
-            Conversation,
+        # Verify ownership; only the key is needed, not the conversation row
+        conversation_id = get_object_or_404(
+            Conversation.objects.values_list('id', flat=True),
             id=conversation_id,
             user=self.request.user
         )
 
-        return Message.objects.filter(conversation=conversation)
+        return Message.objects.filter(conversation_id=conversation_id)
 
     def perform_create(self, serializer):
         """Create message for the conversation owned by the authenticated user."""
-        conversation_id = self.kwargs.get('conversation_pk')
         conversation = get_object_or_404(
-            Conversation,
-            id=conversation_id,
+            Conversation.objects.only('id'),
+            id=self.kwargs.get('conversation_pk'),
             user=self.request.user
         )
 
         # Save the message
         message = serializer.save(conversation=conversation)
 
-        # Update conversation metadata
-        conversation.update_conversation_metadata()
+        # Fold the message into the stored totals and search vector in place
+        # rather than recounting or re-reading every message in the conversation
+        Conversation.objects.filter(pk=conversation.pk).record_message(message)
 
         return message
@@ -63,7 +63,12 @@ class SocialAccountAdapter(DefaultSocialAccountAdapter):
         if access_token:
             user.encrypt_google_tokens(access_token, refresh_token or '')
 
-        user.save()
+        # The row was just saved by allauth; only write the Google-specific columns
+        user.save(update_fields=[
+            'google_id', 'google_email', 'google_profile_picture', 'auth_method',
+            'last_auth_at', 'avatar', 'display_name',
+            'google_access_token', 'google_refresh_token', 'updated_at',
+        ])
 
         return user
 
@@ -0,0 +1,42 @@
+"""
+Custom model managers for account models.
+"""
+from django.contrib.auth.models import UserManager as DjangoUserManager
+from django.db import models
+
+
+class UserManager(DjangoUserManager):
+    """
+    User manager that joins the DRF auth token on credential lookups.
+
+    authenticate() resolves users through get_by_natural_key, so every
+    password login gets its token in the same query.
+    """
+
+    def get_by_natural_key(self, username):
+        return self.select_related('auth_token').get(**{self.model.USERNAME_FIELD: username})
+
+
+class UserSessionManager(models.Manager):
+    """Manager for login session audit rows."""
+
+    def upsert_session(self, user_id, session_key, ip_address, user_agent):
+        """
+        Insert or refresh the row for session_key in a single statement.
+
+        Compiles to INSERT ... ON CONFLICT (session_key) DO UPDATE, so
+        concurrent logins cannot race between a SELECT and the write.
+        """
+        session = self.model(
+            user_id=user_id,
+            session_key=session_key,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            is_active=True,
+        )
+        self.bulk_create(
+            [session],
+            update_conflicts=True,
+            unique_fields=['session_key'],
+            update_fields=['user', 'ip_address', 'user_agent', 'is_active', 'last_activity'],
+        )
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.24 on 2026-10-16 20:01
+
+import apps.accounts.managers
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_backfill_has_permanent_password'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='user',
+            managers=[
+                ('objects', apps.accounts.managers.UserManager()),
+            ],
+        ),
+    ]
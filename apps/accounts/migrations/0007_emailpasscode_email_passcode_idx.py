@@ -0,0 +1,17 @@
+# Generated by Django 4.2.24 on 2026-10-16 20:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_user_manager'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emailpasscode',
+            index=models.Index(fields=['email', 'passcode'], name='email_passc_email_bfd208_idx'),
+        ),
+    ]
@@ -11,6 +11,20 @@ import base64
 import secrets
 import re
 from datetime import timedelta
+from functools import lru_cache
+from .managers import UserManager, UserSessionManager
+
+
+@lru_cache(maxsize=4)
+def get_fernet(encryption_key):
+    """
+    Return a Fernet cipher for the given ENCRYPTION_KEY, built once per key.
+
+    Fernet runs on cryptography's OpenSSL backend (AES-NI where available);
+    caching avoids re-deriving the key and cipher on every call.
+    """
+    key = base64.urlsafe_b64encode(encryption_key.encode()[:32])
+    return Fernet(key)
 
 
 class User(AbstractUser):
@@ -75,8 +89,7 @@ class User(AbstractUser):
 
     def _get_cipher(self):
         """Get Fernet cipher for token encryption (reuse existing pattern)."""
-        key = base64.urlsafe_b64encode(settings.ENCRYPTION_KEY.encode()[:32])
-        return Fernet(key)
+        return get_fernet(settings.ENCRYPTION_KEY)
 
     def encrypt_google_tokens(self, access_token, refresh_token):
         """Encrypt Google OAuth tokens using existing Fernet pattern."""
@@ -108,6 +121,8 @@ class User(AbstractUser):
 
         return access_token, refresh_token
     
+    objects = UserManager()
+
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']
     
@@ -170,18 +185,21 @@ class APIKey(models.Model):
         verbose_name = 'API Key'
         verbose_name_plural = 'API Keys'
     
+    @staticmethod
+    def encrypt_key(raw_key):
+        """Return the encrypted, storable form of a raw API key."""
+        cipher = get_fernet(settings.ENCRYPTION_KEY)
+        
+        # Encrypt the key
+        encrypted_key = cipher.encrypt(raw_key.encode())
+        return base64.urlsafe_b64encode(encrypted_key).decode()
+    
     def set_key(self, raw_key):
         """Encrypt and store the API key."""
         if not raw_key:
             return
         
-        # Create cipher
-        key = base64.urlsafe_b64encode(settings.ENCRYPTION_KEY.encode()[:32])
-        cipher = Fernet(key)
-        
-        # Encrypt the key
-        encrypted_key = cipher.encrypt(raw_key.encode())
-        self.encrypted_key = base64.urlsafe_b64encode(encrypted_key).decode()
+        self.encrypted_key = self.encrypt_key(raw_key)
     
     def get_key(self):
         """Decrypt and return the API key."""
@@ -189,9 +207,7 @@ class APIKey(models.Model):
             return None
         
         try:
-            # Create cipher
-            key = base64.urlsafe_b64encode(settings.ENCRYPTION_KEY.encode()[:32])
-            cipher = Fernet(key)
+            cipher = get_fernet(settings.ENCRYPTION_KEY)
             
             # Decrypt the key
             encrypted_key = base64.urlsafe_b64decode(self.encrypted_key.encode())
@@ -216,6 +232,8 @@ class UserSession(models.Model):
     last_activity = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
 
+    objects = UserSessionManager()
+
     class Meta:
         db_table = 'user_sessions'
         verbose_name = 'User Session'
@@ -243,6 +261,7 @@ class EmailPasscode(models.Model):
         verbose_name_plural = 'Email Passcodes'
         indexes = [
             models.Index(fields=['email', 'is_used']),
+            models.Index(fields=['email', 'passcode']),
             models.Index(fields=['expires_at']),
         ]
 
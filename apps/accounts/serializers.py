@@ -63,6 +63,10 @@ class UserLoginSerializer(serializers.Serializer):
 class UserProfileSerializer(serializers.ModelSerializer):
     """
     Serializer for user profile information.
+
+    Only reads columns of the user row itself, so serializing request.user
+    needs no further queries; add select_related/prefetch_related at the
+    call sites before exposing any relation here.
     """
     class Meta:
         model = User
@@ -142,12 +146,13 @@ class PasscodeVerifySerializer(serializers.Serializer):
         email = attrs.get('email')
         passcode = attrs.get('passcode')
 
-        # Find the most recent valid passcode for this email
+        # Find the most recent valid passcode for this email, loading only
+        # the columns is_valid()/increment_attempts()/mark_used() touch
         passcode_obj = EmailPasscode.objects.filter(
             email=email,
             passcode=passcode,
             is_used=False
-        ).order_by('-created_at').first()
+        ).only('id', 'expires_at', 'is_used', 'attempts').order_by('-created_at').first()
 
         if not passcode_obj:
             raise serializers.ValidationError({
@@ -167,9 +172,13 @@ class PasscodeVerifySerializer(serializers.Serializer):
         # Mark passcode as used
         passcode_obj.mark_used()
 
-        # Get or create user
+        # Returning users are served by a single lookup; username generation
+        # and get_or_create only run when the account does not exist yet
+        user = User.objects.select_related('auth_token').filter(email=email).first()
+        created = False
+
         attempts = 0
-        while True:
+        while user is None:
             defaults = {
                 'username': User.generate_unique_username(email),
                 'auth_method': 'temp_passcode',
@@ -177,16 +186,14 @@ class PasscodeVerifySerializer(serializers.Serializer):
             }
             try:
                 with transaction.atomic():
-                    user, created = User.objects.get_or_create(
+                    user, created = User.objects.select_related('auth_token').get_or_create(
                         email=email,
                         defaults=defaults
                     )
-                break
             except IntegrityError:
                 attempts += 1
                 if attempts >= 5:
                     raise serializers.ValidationError('Unable to create account at this time. Please try again.')
-                continue
 
         if not created and not user.is_active:
             raise serializers.ValidationError('User account is disabled.')
@@ -0,0 +1,46 @@
+"""
+Background tasks for account authentication flows.
+"""
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import send_mail
+import logging
+
+from .models import UserSession
+
+logger = logging.getLogger(__name__)
+
+PASSCODE_EMAIL_SUBJECT = 'Your AI Consensus Login Code'
+PASSCODE_EMAIL_BODY = (
+    "Your temporary login code is: {passcode}\n"
+    "\n"
+    "This code will expire in 15 minutes.\n"
+    "\n"
+    "If you didn't request this code, you can safely ignore this email.\n"
+)
+
+
+@shared_task
+def send_passcode_email(email: str, passcode: str):
+    """Deliver a login passcode off the request thread."""
+    try:
+        send_mail(
+            PASSCODE_EMAIL_SUBJECT,
+            PASSCODE_EMAIL_BODY.format(passcode=passcode),
+            settings.DEFAULT_FROM_EMAIL,
+            [email],
+            fail_silently=False,
+        )
+    except Exception as e:
+        logger.error(f"Error sending passcode email to {email}: {str(e)}")
+        raise
+
+    return f"Passcode email sent to {email}"
+
+
+@shared_task
+def record_user_session(user_id: int, session_key: str, ip_address: str, user_agent: str):
+    """Create or refresh the UserSession audit row for a login."""
+    UserSession.objects.upsert_session(user_id, session_key, ip_address, user_agent)
+
+    return f"Session recorded for user {user_id}"
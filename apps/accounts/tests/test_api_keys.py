@@ -0,0 +1,72 @@
+"""
+Tests for API key management endpoints.
+"""
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.accounts.models import APIKey, User
+
+
+class APIKeyManagementTests(TestCase):
+    """Validate API key create, update and list behaviour."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='keyuser',
+            email='keys@example.com',
+            password='testpass123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('api_v1:accounts:api_keys')
+
+    def test_post_creates_key(self):
+        """First POST for a service creates an encrypted key."""
+        response = self.client.post(
+            self.url,
+            {'service_name': 'openai', 'key': 'sk-first-key-1234'},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(response.data['data']['decrypted_key'], '****1234')
+
+        api_key = APIKey.objects.get(user=self.user, service_name='openai')
+        self.assertEqual(api_key.get_key(), 'sk-first-key-1234')
+
+    def test_post_updates_existing_key(self):
+        """A second POST for the same service updates in place."""
+        self.client.post(
+            self.url,
+            {'service_name': 'claude', 'key': 'sk-old-key-0000'},
+            format='json'
+        )
+        response = self.client.post(
+            self.url,
+            {'service_name': 'claude', 'key': 'sk-new-key-9999', 'is_active': False},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(APIKey.objects.filter(user=self.user, service_name='claude').count(), 1)
+
+        api_key = APIKey.objects.get(user=self.user, service_name='claude')
+        self.assertEqual(api_key.get_key(), 'sk-new-key-9999')
+        self.assertFalse(api_key.is_active)
+
+    def test_get_lists_masked_keys(self):
+        """Listing never exposes the raw key."""
+        api_key = APIKey(user=self.user, service_name='gemini')
+        api_key.set_key('gm-secret-key-4321')
+        api_key.save()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']), 1)
+        entry = response.data['data'][0]
+        self.assertEqual(entry['service_name'], 'gemini')
+        self.assertEqual(entry['decrypted_key'], '****4321')
+        self.assertNotIn('key', entry)
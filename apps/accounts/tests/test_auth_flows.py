@@ -4,14 +4,20 @@ Tests for authentication flows covering passcode login and Google OAuth linkage.
 from unittest.mock import patch
 from urllib.parse import urlparse, parse_qs
 
+from django.core import mail
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
+from kombu.exceptions import OperationalError as BrokerError
 from rest_framework import status
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 
-from apps.accounts.models import EmailPasscode, User
+from apps.accounts.models import EmailPasscode, User, UserSession
 from apps.accounts.serializers import PasscodeVerifySerializer
+from apps.accounts.tasks import record_user_session, send_passcode_email
+from api.v1.accounts.views import _get_google_certs
 
 
 class PasscodeAuthenticationTests(TestCase):
@@ -43,6 +49,69 @@ class PasscodeAuthenticationTests(TestCase):
         self.assertTrue(user.username.lower().startswith('alice'))
 
 
+    def test_passcode_verify_reuses_existing_user(self):
+        """Returning users are matched without creating a new account."""
+        existing = User.objects.create_user(
+            username='bob',
+            email='bob@example.com',
+            password='testpass123'
+        )
+        EmailPasscode.objects.create(
+            email='bob@example.com',
+            passcode='654321',
+            expires_at=timezone.now() + timezone.timedelta(minutes=15)
+        )
+
+        serializer = PasscodeVerifySerializer(data={
+            'email': 'bob@example.com',
+            'passcode': '654321'
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        self.assertEqual(serializer.validated_data['user'].pk, existing.pk)
+        self.assertEqual(User.objects.filter(email='bob@example.com').count(), 1)
+        existing.refresh_from_db()
+        self.assertEqual(existing.auth_method, 'temp_passcode')
+
+
+class PasscodeSendTests(TestCase):
+    """Ensure passcode delivery is handed off to the background worker."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.send_url = reverse('api_v1:accounts:passcode-send')
+
+    def test_passcode_send_queues_email(self):
+        """The email is queued with the freshly generated passcode."""
+        with patch('api.v1.accounts.views.send_passcode_email.delay') as mock_delay:
+            response = self.client.post(self.send_url, {'email': 'Queue@Example.com'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        passcode = EmailPasscode.objects.get(email='queue@example.com')
+        mock_delay.assert_called_once_with('queue@example.com', passcode.passcode)
+
+    def test_send_passcode_email_renders_template(self):
+        """The task sends the passcode using the shared template."""
+        send_passcode_email('mail@example.com', '424242')
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['mail@example.com'])
+        self.assertIn('Your temporary login code is: 424242', mail.outbox[0].body)
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_passcode_send_rejects_rapid_repeats(self):
+        """A second request inside the cooldown window is throttled."""
+        cache.clear()
+        with patch('api.v1.accounts.views.send_passcode_email.delay') as mock_delay:
+            first = self.client.post(self.send_url, {'email': 'repeat@example.com'}, format='json')
+            second = self.client.post(self.send_url, {'email': 'repeat@example.com'}, format='json')
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK, first.data)
+        self.assertEqual(second.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(mock_delay.call_count, 1)
+        self.assertEqual(EmailPasscode.objects.filter(email='repeat@example.com').count(), 1)
+
+
 class RegistrationPasswordTests(TestCase):
     """Ensure registration correctly flags password availability."""
 
@@ -76,6 +145,121 @@ class RegistrationPasswordTests(TestCase):
         self.assertEqual(login_response.status_code, status.HTTP_200_OK, login_response.data)
         self.assertTrue(login_response.data['success'])
 
+    def test_password_login_reuses_existing_token(self):
+        """Returning users get their existing token back."""
+        user = User.objects.create_user(
+            username='returning',
+            email='returning@example.com',
+            password='StrongPass!234',
+            has_permanent_password=True
+        )
+        credentials = {'email': 'returning@example.com', 'password': 'StrongPass!234'}
+
+        first = APIClient().post(self.password_login_url, credentials, format='json')
+        second = APIClient().post(self.password_login_url, credentials, format='json')
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK, first.data)
+        self.assertEqual(second.status_code, status.HTTP_200_OK, second.data)
+        self.assertEqual(first.data['data']['token'], second.data['data']['token'])
+        self.assertEqual(first.data['data']['token'], user.auth_token.key)
+
+
+class SessionRecordingTests(TestCase):
+    """Ensure login audit rows are written after the response path."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='sessionuser',
+            email='session@example.com',
+            password='StrongPass!234',
+            has_permanent_password=True
+        )
+
+    def test_password_login_queues_session_record_on_commit(self):
+        """The audit write is dispatched once the login transaction commits."""
+        client = APIClient()
+        with patch('api.v1.accounts.views.record_user_session.delay') as mock_delay, \
+                self.captureOnCommitCallbacks(execute=True):
+            response = client.post(
+                reverse('api_v1:accounts:password-login'),
+                {'email': 'session@example.com', 'password': 'StrongPass!234'},
+                format='json',
+                HTTP_USER_AGENT='test-agent'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        mock_delay.assert_called_once()
+        user_id, session_key, _, user_agent = mock_delay.call_args.args
+        self.assertEqual(user_id, self.user.pk)
+        self.assertEqual(session_key, client.session.session_key)
+        self.assertEqual(user_agent, 'test-agent')
+
+    def test_password_login_with_skip_session_only_issues_token(self):
+        """Token-only clients get a token without a Django session."""
+        client = APIClient()
+        with patch('api.v1.accounts.views.record_user_session.delay') as mock_delay, \
+                self.captureOnCommitCallbacks(execute=True):
+            response = client.post(
+                reverse('api_v1:accounts:password-login'),
+                {'email': 'session@example.com', 'password': 'StrongPass!234', 'skip_session': True},
+                format='json'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.data['data']['token'], Token.objects.get(user=self.user).key)
+        mock_delay.assert_not_called()
+        self.assertNotIn('sessionid', response.cookies)
+
+    def test_password_login_records_session_inline_when_broker_down(self):
+        """An unreachable broker falls back to a synchronous write instead of failing login."""
+        client = APIClient()
+        with patch('api.v1.accounts.views.record_user_session.delay',
+                   side_effect=BrokerError('connection refused')), \
+                self.captureOnCommitCallbacks(execute=True):
+            response = client.post(
+                reverse('api_v1:accounts:password-login'),
+                {'email': 'session@example.com', 'password': 'StrongPass!234'},
+                format='json',
+                HTTP_USER_AGENT='test-agent'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        session = UserSession.objects.get(user=self.user)
+        self.assertEqual(session.session_key, client.session.session_key)
+        self.assertEqual(session.user_agent, 'test-agent')
+
+    def test_record_user_session_refreshes_existing_row(self):
+        """Repeated records for the same session update a single row."""
+        record_user_session(self.user.pk, 'session-key-1', '127.0.0.1', 'agent-a')
+        record_user_session(self.user.pk, 'session-key-1', '10.0.0.1', 'agent-b')
+
+        sessions = UserSession.objects.filter(user=self.user)
+        self.assertEqual(sessions.count(), 1)
+        self.assertEqual(sessions.get().ip_address, '10.0.0.1')
+        self.assertEqual(sessions.get().user_agent, 'agent-b')
+
+
+class LogoutTests(TestCase):
+    """Ensure logout revokes the token and deactivates the session."""
+
+    def test_logout_revokes_token_and_session(self):
+        user = User.objects.create_user(
+            username='leaving',
+            email='leaving@example.com',
+            password='StrongPass!234'
+        )
+        client = APIClient()
+        client.force_login(user)
+        session_key = client.session.session_key
+        UserSession.objects.create(user=user, session_key=session_key)
+        Token.objects.create(user=user)
+
+        response = client.post(reverse('api_v1:accounts:logout'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertFalse(Token.objects.filter(user=user).exists())
+        self.assertFalse(UserSession.objects.get(session_key=session_key).is_active)
+
 
 @override_settings(
     SOCIALACCOUNT_PROVIDERS={
@@ -112,8 +296,8 @@ class GoogleOAuthLinkingTests(TestCase):
 
     def test_google_oauth_links_existing_email_user(self):
         """Users created without Google ID are linked instead of duplicated."""
-        with patch('api.v1.accounts.views.requests.post') as mock_post, \
-                patch('api.v1.accounts.views.requests.get') as mock_get:
+        with patch('api.v1.accounts.views._GOOGLE_HTTP.post') as mock_post, \
+                patch('api.v1.accounts.views._GOOGLE_HTTP.get') as mock_get:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = {
                 'access_token': 'token-123',
@@ -142,6 +326,62 @@ class GoogleOAuthLinkingTests(TestCase):
         self.assertEqual(self.user.google_id, 'google-123')
         self.assertEqual(User.objects.filter(email='linked@example.com').count(), 1)
 
+    def test_google_oauth_uses_id_token_claims_without_userinfo_call(self):
+        """An ID token in the token response replaces the userinfo round-trip."""
+        with patch('api.v1.accounts.views._GOOGLE_HTTP.post') as mock_post, \
+                patch('api.v1.accounts.views._GOOGLE_HTTP.get') as mock_get, \
+                patch('api.v1.accounts.views._get_google_certs', return_value={'kid': 'pem'}), \
+                patch('api.v1.accounts.views.google_jwt.decode') as mock_verify:
+            mock_post.return_value.status_code = 200
+            mock_post.return_value.json.return_value = {
+                'access_token': 'token-123',
+                'id_token': 'signed.jwt.value',
+            }
+            mock_verify.return_value = {
+                'iss': 'https://accounts.google.com',
+                'sub': 'google-789',
+                'email': 'Linked@Example.com',
+                'name': 'Linked User',
+                'picture': 'http://example.com/avatar.png',
+            }
+
+            response = self.client.post(
+                self.callback_url,
+                {'code': 'auth-code', 'state': self.state},
+                format='json'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        mock_get.assert_not_called()
+        self.assertEqual(mock_verify.call_args.kwargs['audience'], 'test-client')
+        self.assertEqual(mock_verify.call_args.kwargs['certs'], {'kid': 'pem'})
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.google_id, 'google-789')
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_google_certs_are_cached_between_logins(self):
+        """Signing certificates are fetched once and then served from cache."""
+        cache.clear()
+        with patch('api.v1.accounts.views._GOOGLE_HTTP.get') as mock_get:
+            mock_get.return_value.json.return_value = {'kid': 'pem'}
+            mock_get.return_value.headers = {'Cache-Control': 'public, max-age=120'}
+
+            self.assertEqual(_get_google_certs(), {'kid': 'pem'})
+            self.assertEqual(_get_google_certs(), {'kid': 'pem'})
+
+        mock_get.assert_called_once()
+
+    def test_google_oauth_init_reflects_current_settings(self):
+        """Cached authorization URL is rebuilt when OAuth settings change."""
+        with override_settings(FRONTEND_URL='https://app.example.com'):
+            response = self.client.get(self.init_url)
+
+        query = parse_qs(urlparse(response.data['data']['authorization_url']).query)
+        self.assertEqual(query['client_id'], ['test-client'])
+        self.assertEqual(query['redirect_uri'], ['https://app.example.com/auth/google/callback'])
+        self.assertTrue(query['state'][0])
+
     def test_google_oauth_callback_requires_state(self):
         """Missing state should be rejected."""
         response = self.client.post(self.callback_url, {'code': 'auth-code'}, format='json')
@@ -0,0 +1,35 @@
+"""
+Tests for the model preferences endpoint.
+"""
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+
+
+class ModelPreferencesTests(TestCase):
+    """Validate partial updates of per-provider model preferences."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='prefs',
+            email='prefs@example.com',
+            password='testpass123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('api_v1:accounts:model_preferences')
+
+    def test_put_updates_only_supplied_models(self):
+        """Omitted providers keep their current model."""
+        response = self.client.put(self.url, {'claude_model': 'claude-opus-test'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.data['data']['claude_model'], 'claude-opus-test')
+        self.assertEqual(response.data['data']['openai_model'], 'gpt-4o')
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.claude_model, 'claude-opus-test')
+        self.assertEqual(self.user.openai_model, 'gpt-4o')
@@ -0,0 +1,29 @@
+"""
+Tests for the profile endpoint.
+"""
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+
+
+class ProfileViewTests(TestCase):
+    """Guard the profile endpoint against lazy relation loading."""
+
+    def test_get_profile_serializes_without_extra_queries(self):
+        """The authenticated user is serialized without touching the database."""
+        user = User.objects.create_user(
+            username='profile',
+            email='profile@example.com',
+            password='testpass123'
+        )
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        with self.assertNumQueries(0):
+            response = client.get(reverse('api_v1:accounts:profile'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['email'], 'profile@example.com')
@@ -1,11 +1,72 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Union
+import asyncio
+import json
 import logging
 
+import aiohttp
+
 logger = logging.getLogger(__name__)
 
+# One aiohttp session per event loop, shared by every provider call on it.
+# Under ASGI the server's loop lives for the whole process, so connections are
+# reused across requests. Under WSGI async_to_sync starts a new loop per call,
+# so the session only spans that call's provider requests (the concurrent
+# provider and synopsis calls of one consensus request).
+_sessions: Dict[asyncio.AbstractEventLoop, tuple] = {}
+
+
+async def _close_with_loop(registry: dict, key, client):
+    """Async generator that loop.shutdown_asyncgens() finalizes, closing the client."""
+    try:
+        yield
+    finally:
+        # The client references its loop, so the entry must be dropped explicitly
+        registry.pop(key, None)
+        await client.close()
+
+
+async def loop_scoped(registry: dict, key, create: Callable[[], Any]):
+    """
+    Return the client stored under key, creating it with create() on first use.
+
+    The client lives as long as the running event loop and is closed when the
+    loop shuts down, so keys should include the loop.
+    """
+    entry = registry.get(key)
+    if entry is None:
+        client = create()
+        closer = _close_with_loop(registry, key, client)
+        await closer.__anext__()
+        entry = registry[key] = (client, closer)
+    return entry[0]
+
+
+@asynccontextmanager
+async def shared_session():
+    """
+    Yield the aiohttp session shared by all AI services on the running loop.
+
+    Reusing one session keeps provider connections alive across calls on the
+    same loop instead of paying a TCP/TLS handshake per provider request.
+    Unlike a per-call session it is not closed on exit; it is closed when its
+    event loop shuts down, which under WSGI is the end of the async_to_sync call.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _sessions.get(loop)
+    if entry is not None and entry[0].closed:
+        del _sessions[loop]
+    yield await loop_scoped(_sessions, loop, aiohttp.ClientSession)
+
 
 class BaseAIService(ABC):
+    # Sliding window of prior turns sent with each prompt, so prompt size stays
+    # flat as conversations grow; callers may override via context['max_history_messages']
+    MAX_HISTORY_MESSAGES = 20
+    # Web search results written into the prompt text
+    WEB_SEARCH_PROMPT_RESULTS = 6
+    
     def __init__(self, api_key: str, **kwargs):
         self.api_key = api_key
         self.config = kwargs
@@ -14,6 +75,42 @@ class BaseAIService(ABC):
     async def generate_response(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         pass
     
+    async def generate_response_stream(
+        self, prompt: str, context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Union[str, Dict[str, Any]]]:
+        """
+        Yield the response text in chunks as it is generated, then the full
+        response dict in the same shape generate_response returns.
+
+        Services without streaming support send the whole text as one chunk.
+        """
+        response = await self.generate_response(prompt, context)
+        if response.get('success') and response.get('content'):
+            yield response['content']
+        yield response
+
+    def format_web_search_results(self, results: list) -> str:
+        """Render the top web search results as numbered entries for the prompt."""
+        return '\n\n'.join(
+            f"\n{index}. {result.get('title', 'No title')}\n\n"
+            f"   Source: {result.get('source', 'Unknown source')}\n\n"
+            + (f"   Published: {result['published_date']}\n\n" if result.get('published_date') else '')
+            + f"   Content: {result.get('snippet', 'No content preview')}"
+            for index, result in enumerate(results[:self.WEB_SEARCH_PROMPT_RESULTS], 1)
+        )
+
+    @staticmethod
+    async def iter_sse_data(response) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the decoded JSON payload of each server-sent event data line."""
+        async for raw_line in response.content:
+            line = raw_line.decode('utf-8').strip()
+            if not line.startswith('data:'):
+                continue
+            data = line[len('data:'):].strip()
+            if data == '[DONE]':
+                break
+            yield json.loads(data)
+
     @abstractmethod
     def validate_api_key(self) -> bool:
         pass
@@ -32,8 +129,11 @@ class BaseAIService(ABC):
         if not context:
             return {}
         
+        history_limit = context.get('max_history_messages', self.MAX_HISTORY_MESSAGES)
+        conversation_history = context.get('conversation_history', [])
+        
         prepared_context = {
-            'conversation_history': context.get('conversation_history', []),
+            'conversation_history': conversation_history[-history_limit:] if history_limit > 0 else [],
             'system_prompt': context.get('system_prompt', ''),
             'temperature': context.get('temperature', 0.7),
             'max_tokens': context.get('max_tokens', self.max_tokens)
@@ -1,7 +1,7 @@
 import aiohttp
 import json
 from typing import Dict, Any, Optional
-from .base import BaseAIService
+from .base import BaseAIService, shared_session
 
 
 class ClaudeService(BaseAIService):
@@ -28,27 +28,9 @@ class ClaudeService(BaseAIService):
             return self.format_error_response(Exception("Invalid Claude API key"))
         
         try:
-            headers = {
-                'x-api-key': self.api_key,
-                'anthropic-version': '2023-06-01',
-                'anthropic-beta': 'pdfs-2024-09-25,prompt-caching-2024-07-31,computer-use-2024-10-22',
-                'content-type': 'application/json'
-            }
-            
-            prepared_context = self.prepare_context(context)
-            messages = self._build_messages(prompt, prepared_context)
-            
-            payload = {
-                'model': self.model,
-                'max_tokens': prepared_context.get('max_tokens', self.max_tokens),
-                'temperature': prepared_context.get('temperature', 0),
-                'messages': messages
-            }
-            
-            if prepared_context.get('system_prompt'):
-                payload['system'] = prepared_context['system_prompt']
-            
-            async with aiohttp.ClientSession() as session:
+            headers, payload = self._build_request(prompt, context)
+
+            async with shared_session() as session:
                 async with session.post(self.BASE_URL, headers=headers, json=payload) as response:
                     # Try to parse JSON response
                     try:
@@ -73,6 +55,75 @@ class ClaudeService(BaseAIService):
                     
         except Exception as e:
             return self.format_error_response(e)
+
+    async def generate_response_stream(self, prompt: str, context: Optional[Dict[str, Any]] = None):
+        if not self.validate_api_key():
+            yield self.format_error_response(Exception("Invalid Claude API key"))
+            return
+
+        try:
+            headers, payload = self._build_request(prompt, context)
+            payload['stream'] = True
+
+            async with shared_session() as session:
+                async with session.post(self.BASE_URL, headers=headers, json=payload) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        yield self.format_error_response(Exception(f"Claude API error (status {response.status}): {error_text[:200]}"))
+                        return
+
+                    chunks = []
+                    usage = {}
+                    stop_reason = None
+                    async for event in self.iter_sse_data(response):
+                        event_type = event.get('type')
+                        if event_type == 'content_block_delta':
+                            text = event.get('delta', {}).get('text')
+                            if text:
+                                chunks.append(text)
+                                yield text
+                        elif event_type == 'message_start':
+                            usage.update(event.get('message', {}).get('usage', {}))
+                        elif event_type == 'message_delta':
+                            usage.update(event.get('usage', {}))
+                            stop_reason = event.get('delta', {}).get('stop_reason')
+                        elif event_type == 'error':
+                            error_msg = event.get('error', {}).get('message', 'Unknown error')
+                            yield self.format_error_response(Exception(f"Claude API error: {error_msg}"))
+                            return
+
+            yield self.format_success_response(''.join(chunks), {
+                'model': self.model,
+                'usage': usage,
+                'stop_reason': stop_reason
+            })
+
+        except Exception as e:
+            yield self.format_error_response(e)
+
+    def _build_request(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> tuple:
+        """Build the headers and payload for a Messages API call."""
+        headers = {
+            'x-api-key': self.api_key,
+            'anthropic-version': '2023-06-01',
+            'anthropic-beta': 'pdfs-2024-09-25,prompt-caching-2024-07-31,computer-use-2024-10-22',
+            'content-type': 'application/json'
+        }
+
+        prepared_context = self.prepare_context(context)
+        messages = self._build_messages(prompt, prepared_context)
+
+        payload = {
+            'model': self.model,
+            'max_tokens': prepared_context.get('max_tokens', self.max_tokens),
+            'temperature': prepared_context.get('temperature', 0),
+            'messages': messages
+        }
+
+        if prepared_context.get('system_prompt'):
+            payload['system'] = prepared_context['system_prompt']
+
+        return headers, payload
     
     def _build_messages(self, prompt: str, context: Dict[str, Any]) -> list:
         messages = []
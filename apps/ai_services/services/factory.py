@@ -1,3 +1,5 @@
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 from .base import BaseAIService
 from .claude_service import ClaudeService
@@ -11,14 +13,42 @@ class AIServiceFactory:
         'openai': OpenAIService,
         'gemini': GeminiService,
     }
+
+    # Service instances are immutable after construction, so one instance per
+    # (type, key, options) is shared across requests. Per-user keys make the
+    # key space open-ended, so only the most recently used are kept.
+    MAX_CACHED_INSTANCES = 32
+    _instances: 'OrderedDict[tuple, BaseAIService]' = OrderedDict()
+    _instances_lock = threading.Lock()
     
     @classmethod
     def create_service(cls, service_type: str, api_key: str, **kwargs) -> BaseAIService:
         service_class = cls._services.get(service_type.lower())
         if not service_class:
             raise ValueError(f"Unsupported AI service type: {service_type}")
-        
-        return service_class(api_key=api_key, **kwargs)
+
+        try:
+            cache_key = (service_class, api_key, frozenset(kwargs.items()))
+            hash(cache_key)
+        except TypeError:
+            # Unhashable options (e.g. dicts) are not worth caching
+            return service_class(api_key=api_key, **kwargs)
+
+        with cls._instances_lock:
+            service = cls._instances.get(cache_key)
+            if service is not None:
+                cls._instances.move_to_end(cache_key)
+                return service
+
+        # Construct outside the lock; a concurrent miss for the same key keeps
+        # whichever instance was stored first
+        service = service_class(api_key=api_key, **kwargs)
+        with cls._instances_lock:
+            service = cls._instances.setdefault(cache_key, service)
+            cls._instances.move_to_end(cache_key)
+            while len(cls._instances) > cls.MAX_CACHED_INSTANCES:
+                cls._instances.popitem(last=False)
+        return service
     
     @classmethod
     def get_available_services(cls) -> list:
@@ -28,4 +58,10 @@ class AIServiceFactory:
     def register_service(cls, service_type: str, service_class: type):
         if not issubclass(service_class, BaseAIService):
             raise ValueError("Service class must inherit from BaseAIService")
-        cls._services[service_type.lower()] = service_class
\ No newline at end of file
+        cls._services[service_type.lower()] = service_class
+        cls.clear_cache()
+
+    @classmethod
+    def clear_cache(cls):
+        with cls._instances_lock:
+            cls._instances.clear()
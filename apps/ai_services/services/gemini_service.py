@@ -2,7 +2,7 @@ import aiohttp
 import json
 import logging
 from typing import Dict, Any
-from .base import BaseAIService
+from .base import BaseAIService, shared_session
 
 logger = logging.getLogger(__name__)
 
@@ -81,7 +81,7 @@ class GeminiService(BaseAIService):
                 'key': self.api_key
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 async with session.post(
                     url, 
                     headers=headers, 
@@ -197,29 +197,15 @@ class GeminiService(BaseAIService):
         # Check for new web search format
         web_search = context.get('web_search', {})
         if web_search.get('enabled', False) and web_search.get('results'):
-            # Build enhanced prompt with search context
-            enhanced_parts = []
-
-            # Add web search context
-            enhanced_parts.append("Current web information:")
-
-            for i, result in enumerate(web_search['results'][:6], 1):
-                enhanced_parts.append(f"\n{i}. {result.get('title', 'No title')}")
-                enhanced_parts.append(f"   Source: {result.get('source', 'Unknown source')}")
-                if result.get('published_date'):
-                    enhanced_parts.append(f"   Published: {result['published_date']}")
-                enhanced_parts.append(f"   Content: {result.get('snippet', 'No content preview')}")
-
-            enhanced_parts.append("\n" + "="*50 + "\n")
-
-            # Add original user query
-            enhanced_parts.append("User question:")
-            enhanced_parts.append(prompt)
-
-            # Add instruction for using web data
-            enhanced_parts.append("\nPlease provide a comprehensive response using both the current web information above and your knowledge. When referencing specific information from the sources, use numbered citations in brackets like [1], [2], [3] etc. that correspond to the source numbers provided above.")
-
-            return "\n\n".join(enhanced_parts)
+            # Web search context, original user query, then the instruction for using web data
+            return "\n\n".join((
+                "Current web information:",
+                self.format_web_search_results(web_search['results']),
+                "\n" + "="*50 + "\n",
+                "User question:",
+                prompt,
+                "\nPlease provide a comprehensive response using both the current web information above and your knowledge. When referencing specific information from the sources, use numbered citations in brackets like [1], [2], [3] etc. that correspond to the source numbers provided above."
+            ))
 
         # Fallback to old format for compatibility
         if not context.get('has_web_search', False):
@@ -1,8 +1,7 @@
-import aiohttp
 import json
 from typing import Dict, Any, Optional, List, Type
 from pydantic import BaseModel
-from .base import BaseAIService
+from .base import BaseAIService, shared_session
 from core.ai_utils import convert_pydantic_to_openai_function, JsonOutputFunctionsParser
 
 
@@ -81,20 +80,7 @@ class OpenAIService(BaseAIService):
             return self.format_error_response(Exception("Invalid OpenAI API key"))
         
         try:
-            headers = {
-                'Authorization': f'Bearer {self.api_key}',
-                'Content-Type': 'application/json'
-            }
-            
-            prepared_context = self.prepare_context(context)
-            messages = self._build_messages(prompt, prepared_context)
-            
-            payload = {
-                'model': self.model,
-                'messages': messages,
-                'max_tokens': prepared_context.get('max_tokens', self.max_tokens),
-                'temperature': prepared_context.get('temperature', 0)
-            }
+            headers, payload = self._build_request(prompt, context)
             
             # Add function calling parameters if provided
             if functions:
@@ -102,7 +88,7 @@ class OpenAIService(BaseAIService):
                 if function_call:
                     payload['function_call'] = function_call
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 async with session.post(self.BASE_URL, headers=headers, json=payload) as response:
                     response_data = await response.json()
                     
@@ -135,6 +121,64 @@ class OpenAIService(BaseAIService):
                     
         except Exception as e:
             return self.format_error_response(e)
+
+    async def generate_response_stream(self, prompt: str, context: Optional[Dict[str, Any]] = None):
+        if not self.validate_api_key():
+            yield self.format_error_response(Exception("Invalid OpenAI API key"))
+            return
+
+        try:
+            headers, payload = self._build_request(prompt, context)
+            payload['stream'] = True
+            # Usage arrives in a final chunk with no choices
+            payload['stream_options'] = {'include_usage': True}
+
+            async with shared_session() as session:
+                async with session.post(self.BASE_URL, headers=headers, json=payload) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        yield self.format_error_response(Exception(f"OpenAI API error (status {response.status}): {error_text[:200]}"))
+                        return
+
+                    chunks = []
+                    usage = {}
+                    finish_reason = None
+                    async for event in self.iter_sse_data(response):
+                        usage = event.get('usage') or usage
+                        for choice in event.get('choices', []):
+                            text = choice.get('delta', {}).get('content')
+                            if text:
+                                chunks.append(text)
+                                yield text
+                            finish_reason = choice.get('finish_reason') or finish_reason
+
+            yield self.format_success_response(''.join(chunks), {
+                'model': self.model,
+                'usage': usage,
+                'finish_reason': finish_reason
+            })
+
+        except Exception as e:
+            yield self.format_error_response(e)
+
+    def _build_request(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> tuple:
+        """Build the headers and payload for a chat completions call."""
+        headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json'
+        }
+
+        prepared_context = self.prepare_context(context)
+        messages = self._build_messages(prompt, prepared_context)
+
+        payload = {
+            'model': self.model,
+            'messages': messages,
+            'max_tokens': prepared_context.get('max_tokens', self.max_tokens),
+            'temperature': prepared_context.get('temperature', 0)
+        }
+
+        return headers, payload
     
     def _build_messages(self, prompt: str, context: Dict[str, Any]) -> list:
         messages = []
@@ -169,29 +213,15 @@ class OpenAIService(BaseAIService):
         # Check for new web search format
         web_search = context.get('web_search', {})
         if web_search.get('enabled', False) and web_search.get('results'):
-            # Build enhanced prompt with search context
-            enhanced_parts = []
-
-            # Add web search context
-            enhanced_parts.append("Current web information:")
-
-            for i, result in enumerate(web_search['results'][:6], 1):
-                enhanced_parts.append(f"\n{i}. {result.get('title', 'No title')}")
-                enhanced_parts.append(f"   Source: {result.get('source', 'Unknown source')}")
-                if result.get('published_date'):
-                    enhanced_parts.append(f"   Published: {result['published_date']}")
-                enhanced_parts.append(f"   Content: {result.get('snippet', 'No content preview')}")
-
-            enhanced_parts.append("\n" + "="*50 + "\n")
-
-            # Add original user query
-            enhanced_parts.append("User question:")
-            enhanced_parts.append(prompt)
-
-            # Add instruction for using web data
-            enhanced_parts.append("\nPlease provide a comprehensive response using both the current web information above and your knowledge. When referencing specific information from the sources, use numbered citations in brackets like [1], [2], [3] etc. that correspond to the source numbers provided above.")
-
-            return "\n\n".join(enhanced_parts)
+            # Web search context, original user query, then the instruction for using web data
+            return "\n\n".join((
+                "Current web information:",
+                self.format_web_search_results(web_search['results']),
+                "\n" + "="*50 + "\n",
+                "User question:",
+                prompt,
+                "\nPlease provide a comprehensive response using both the current web information above and your knowledge. When referencing specific information from the sources, use numbered citations in brackets like [1], [2], [3] etc. that correspond to the source numbers provided above."
+            ))
 
         # Fallback to old format for compatibility
         if not context.get('has_web_search', False):
@@ -4,16 +4,27 @@ Manual implementation without pydantic-ai dependency for compatibility.
 """
 import json
 import asyncio
-from typing import Dict, Any, Optional, Type
+import hashlib
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, Optional, Type
 from pydantic import BaseModel
 import logging
 from django.conf import settings
-from openai import AsyncOpenAI
-import aiohttp
+from django.core.cache import cache
+from .base import shared_session
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _schema_json(response_model: Type[BaseModel]) -> str:
+    """Render a response model's JSON schema once per model class."""
+    return json.dumps(response_model.model_json_schema(), indent=2)
+
+
 class UnifiedStructuredService:
     """
     Unified service for structured AI outputs across all providers.
@@ -27,12 +38,18 @@ class UnifiedStructuredService:
         'gemini': 'gemini-flash-latest'
     }
     
+    # Successful structured outputs are deterministic (temperature 0), so reuse them for a day
+    CACHE_TTL = 24 * 60 * 60
+    
     def __init__(self):
         self._openai_client = None
     
-    def get_openai_client(self) -> AsyncOpenAI:
+    def get_openai_client(self) -> 'AsyncOpenAI':
         """Get or create OpenAI client."""
         if not self._openai_client:
+            # Deferred so URL loading doesn't pay the openai SDK import
+            from openai import AsyncOpenAI
+
             self._openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
         return self._openai_client
     
@@ -56,14 +73,23 @@ class UnifiedStructuredService:
             Dict with success, structured_data, and error information
         """
         try:
+            cache_key = self._generate_cache_key(provider, prompt, response_model)
+            cached_result = await cache.aget(cache_key)
+            if cached_result is not None:
+                return cached_result
+            
             if provider.lower() == 'openai':
-                return await self._generate_openai_structured(prompt, response_model)
+                result = await self._generate_openai_structured(prompt, response_model)
             elif provider.lower() == 'claude':
-                return await self._generate_claude_structured(prompt, response_model)
+                result = await self._generate_claude_structured(prompt, response_model)
             elif provider.lower() == 'gemini':
-                return await self._generate_gemini_structured(prompt, response_model)
+                result = await self._generate_gemini_structured(prompt, response_model)
             else:
                 raise ValueError(f"Unsupported provider: {provider}")
+            
+            if result['success']:
+                await cache.aset(cache_key, result, self.CACHE_TTL)
+            return result
                 
         except Exception as e:
             logger.error(f"Error generating structured response with {provider}: {str(e)}")
@@ -76,18 +102,21 @@ class UnifiedStructuredService:
                 'error': str(e)
             }
     
+    def _generate_cache_key(self, provider: str, prompt: str, response_model: Type[BaseModel]) -> str:
+        """Build a cache key from the provider model, response schema and prompt."""
+        provider = provider.lower()
+        raw_key = f"{provider}|{self.PROVIDER_MODELS.get(provider)}|{response_model.__name__}|{prompt}"
+        return f"structured:{hashlib.blake2b(raw_key.encode(), digest_size=16).hexdigest()}"
+    
     async def _generate_openai_structured(self, prompt: str, response_model: Type[BaseModel]) -> Dict[str, Any]:
         """Generate structured response using OpenAI's JSON mode."""
         try:
             client = self.get_openai_client()
             
-            # Create JSON schema from Pydantic model
-            schema = response_model.model_json_schema()
-            
             enhanced_prompt = f"""{prompt}
 
 Please respond with a JSON object that matches this schema:
-{json.dumps(schema, indent=2)}
+{_schema_json(response_model)}
 
 Make sure the response is valid JSON only."""
 
@@ -99,10 +128,9 @@ Make sure the response is valid JSON only."""
             )
             
             content = response.choices[0].message.content
-            parsed_data = json.loads(content)
             
-            # Validate with Pydantic
-            validated_data = response_model(**parsed_data)
+            # Parse and validate in one pass with pydantic-core
+            validated_data = response_model.model_validate_json(content)
             
             return {
                 'success': True,
@@ -127,12 +155,10 @@ Make sure the response is valid JSON only."""
     async def _generate_claude_structured(self, prompt: str, response_model: Type[BaseModel]) -> Dict[str, Any]:
         """Generate structured response using Claude API."""
         try:
-            schema = response_model.model_json_schema()
-            
             enhanced_prompt = f"""{prompt}
 
 Please respond with a JSON object that matches this schema:
-{json.dumps(schema, indent=2)}
+{_schema_json(response_model)}
 
 Return only valid JSON, no additional text."""
 
@@ -149,7 +175,7 @@ Return only valid JSON, no additional text."""
                 'temperature': 0
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 async with session.post(
                     'https://api.anthropic.com/v1/messages',
                     headers=headers,
@@ -159,9 +185,8 @@ Return only valid JSON, no additional text."""
                         result = await response.json()
                         content = result['content'][0]['text']
                         
-                        # Parse and validate JSON
-                        parsed_data = json.loads(content)
-                        validated_data = response_model(**parsed_data)
+                        # Parse and validate in one pass with pydantic-core
+                        validated_data = response_model.model_validate_json(content)
                         
                         return {
                             'success': True,
@@ -189,12 +214,10 @@ Return only valid JSON, no additional text."""
     async def _generate_gemini_structured(self, prompt: str, response_model: Type[BaseModel]) -> Dict[str, Any]:
         """Generate structured response using Gemini API."""
         try:
-            schema = response_model.model_json_schema()
-            
             enhanced_prompt = f"""{prompt}
 
 Please respond with a JSON object that matches this schema:
-{json.dumps(schema, indent=2)}
+{_schema_json(response_model)}
 
 Return only valid JSON, no additional text."""
 
@@ -209,15 +232,14 @@ Return only valid JSON, no additional text."""
                 }
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 async with session.post(url, headers=headers, json=data) as response:
                     if response.status == 200:
                         result = await response.json()
                         content = result['candidates'][0]['content']['parts'][0]['text']
                         
-                        # Parse and validate JSON
-                        parsed_data = json.loads(content)
-                        validated_data = response_model(**parsed_data)
+                        # Parse and validate in one pass with pydantic-core
+                        validated_data = response_model.model_validate_json(content)
                         
                         return {
                             'success': True,
@@ -4,10 +4,16 @@ import re
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from django.conf import settings
-from openai import AsyncOpenAI
+
+from .base import loop_scoped
 
 logger = logging.getLogger(__name__)
 
+# Reka clients keyed by (event loop, API key), so repeated searches on a loop
+# reuse the client's connection pool instead of opening a new one per query.
+# That spans requests under ASGI; under WSGI each request's loop gets its own.
+_clients: Dict[tuple, Any] = {}
+
 
 class RekaSearchClient:
     """
@@ -28,16 +34,19 @@ class RekaSearchClient:
     async def __aenter__(self):
         """Async context manager entry"""
         if self.api_key:
-            self.client = AsyncOpenAI(
-                api_key=self.api_key,
-                base_url=self.BASE_URL
+            # Deferred so URL loading doesn't pay the openai SDK import
+            from openai import AsyncOpenAI
+
+            self.client = await loop_scoped(
+                _clients,
+                (asyncio.get_running_loop(), self.api_key),
+                lambda: AsyncOpenAI(api_key=self.api_key, base_url=self.BASE_URL)
             )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.client:
-            await self.client.close()
+        """Async context manager exit; the shared client closes with its loop"""
+        self.client = None
 
     def is_configured(self) -> bool:
         """Check if the client is properly configured"""
@@ -1,7 +1,7 @@
+from asgiref.sync import async_to_sync
 from celery import shared_task
 from django.core.exceptions import ObjectDoesNotExist
 from typing import Dict, Any, Optional
-import asyncio
 import logging
 
 from .models import AIService, AIQuery, AIServiceTask
@@ -82,15 +82,7 @@ def process_single_ai_service(service_task_id: str):
             **service_config
         )
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            response = loop.run_until_complete(
-                ai_service_instance.generate_response(query.prompt, context)
-            )
-        finally:
-            loop.close()
+        response = async_to_sync(ai_service_instance.generate_response)(query.prompt, context)
         
         if response['success']:
             ai_response = AIResponse.objects.create(
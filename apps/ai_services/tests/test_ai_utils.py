@@ -0,0 +1,44 @@
+"""
+Tests for the function-calling schema helpers.
+"""
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from core.ai_models import Overview
+from core.ai_utils import _build_function_schema, convert_pydantic_to_openai_function
+
+
+class FunctionSchemaTests(SimpleTestCase):
+    """Validate memoized function schema generation."""
+
+    def setUp(self):
+        _build_function_schema.cache_clear()
+        self.addCleanup(_build_function_schema.cache_clear)
+
+    def test_schema_generated_once_per_model(self):
+        """Repeated conversions reuse the generated schema."""
+        with patch.object(Overview, 'model_json_schema', wraps=Overview.model_json_schema) as mock_schema:
+            first = convert_pydantic_to_openai_function(Overview)
+            second = convert_pydantic_to_openai_function(Overview)
+
+        self.assertEqual(mock_schema.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(first['name'], 'Overview')
+        self.assertEqual(first['parameters']['required'], ['summary'])
+
+    def test_callers_cannot_mutate_cached_schema(self):
+        """Top-level edits by one caller do not leak into the next."""
+        convert_pydantic_to_openai_function(Overview)['name'] = 'Changed'
+
+        self.assertEqual(convert_pydantic_to_openai_function(Overview)['name'], 'Overview')
+
+    def test_callers_cannot_mutate_nested_schema(self):
+        """Edits to nested parameters do not leak into the next caller."""
+        schema = convert_pydantic_to_openai_function(Overview)
+        schema['parameters']['required'].append('extra')
+        schema['parameters']['properties'].clear()
+
+        fresh = convert_pydantic_to_openai_function(Overview)
+        self.assertEqual(fresh['parameters']['required'], ['summary'])
+        self.assertIn('summary', fresh['parameters']['properties'])
@@ -0,0 +1,190 @@
+"""
+Tests for shared AI service behaviour.
+"""
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, override_settings
+
+from apps.ai_services.services.base import shared_session
+from apps.ai_services.services.claude_service import ClaudeService
+from apps.ai_services.services.openai_service import OpenAIService
+from apps.ai_services.services.reka_search_client import RekaSearchClient
+
+
+class PrepareContextTests(SimpleTestCase):
+    """Validate conversation history windowing."""
+
+    def setUp(self):
+        self.service = ClaudeService(api_key='sk-ant-test')
+        self.history = [
+            {'role': 'user' if index % 2 == 0 else 'assistant', 'content': f'Turn {index}'}
+            for index in range(30)
+        ]
+
+    def test_history_trimmed_to_latest_window(self):
+        """Only the most recent turns are forwarded to the provider."""
+        prepared = self.service.prepare_context({'conversation_history': self.history})
+
+        self.assertEqual(len(prepared['conversation_history']), ClaudeService.MAX_HISTORY_MESSAGES)
+        self.assertEqual(prepared['conversation_history'][-1]['content'], 'Turn 29')
+
+    def test_history_window_overridable(self):
+        """Callers can narrow the window or drop history entirely."""
+        prepared = self.service.prepare_context({
+            'conversation_history': self.history,
+            'max_history_messages': 4
+        })
+        self.assertEqual(
+            [message['content'] for message in prepared['conversation_history']],
+            ['Turn 26', 'Turn 27', 'Turn 28', 'Turn 29']
+        )
+
+        prepared = self.service.prepare_context({
+            'conversation_history': self.history,
+            'max_history_messages': 0
+        })
+        self.assertEqual(prepared['conversation_history'], [])
+
+
+class WebSearchPromptTests(SimpleTestCase):
+    """Validate how web search results are written into the prompt."""
+
+    def test_results_rendered_as_numbered_entries(self):
+        """Each result is numbered with its source, optional date and snippet."""
+        service = OpenAIService('sk-test')
+        results = [
+            {'title': 'First', 'source': 'example.com', 'published_date': '2024-01-01', 'snippet': 'One'},
+            {'title': 'Second'},
+        ]
+
+        prompt = service._enhance_prompt_with_web_search('Question?', {
+            'web_search': {'enabled': True, 'results': results}
+        })
+
+        self.assertTrue(prompt.startswith(
+            "Current web information:\n\n"
+            "\n1. First\n\n   Source: example.com\n\n   Published: 2024-01-01\n\n   Content: One\n\n"
+            "\n2. Second\n\n   Source: Unknown source\n\n   Content: No content preview\n\n"
+            "\n" + "=" * 50 + "\n\n\nUser question:\n\nQuestion?\n\n"
+        ))
+
+    def test_results_capped(self):
+        """Only the top results are written into the prompt."""
+        service = OpenAIService('sk-test')
+        results = [{'title': f'Result {index}'} for index in range(10)]
+
+        rendered = service.format_web_search_results(results)
+
+        self.assertIn(f'{service.WEB_SEARCH_PROMPT_RESULTS}. Result', rendered)
+        self.assertNotIn(f'{service.WEB_SEARCH_PROMPT_RESULTS + 1}. Result', rendered)
+
+
+class SharedSessionTests(SimpleTestCase):
+    """Validate HTTP session reuse across provider calls."""
+
+    async def get_sessions(self):
+        async with shared_session() as first, shared_session() as second:
+            return first, second
+
+    def test_session_shared_within_loop_and_closed_with_it(self):
+        """Calls on one loop share a session that closes when the loop shuts down."""
+        first, second = asyncio.run(self.get_sessions())
+        other, _ = asyncio.run(self.get_sessions())
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertTrue(first.closed)
+        self.assertTrue(other.closed)
+
+    async def get_reka_clients(self):
+        async with RekaSearchClient() as first, RekaSearchClient() as second:
+            return first.client, second.client
+
+    @override_settings(REKA_API_KEY='test-key')
+    def test_reka_client_shared_within_loop_and_closed_with_it(self):
+        """Searches on one loop share a Reka client that closes when the loop shuts down."""
+        first, second = asyncio.run(self.get_reka_clients())
+        other, _ = asyncio.run(self.get_reka_clients())
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertTrue(first.is_closed())
+        self.assertTrue(other.is_closed())
+
+
+class FakeStreamResponse:
+    """Minimal stand-in for an aiohttp response streaming server-sent events."""
+
+    status = 200
+
+    def __init__(self, events):
+        self.content = self.lines(events)
+
+    async def lines(self, events):
+        for event in events:
+            yield f"data: {json.dumps(event)}\n".encode()
+            yield b"\n"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def fake_session(events):
+    """Build a shared_session replacement whose post() streams events."""
+    session = MagicMock()
+    session.post.return_value = FakeStreamResponse(events)
+
+    @asynccontextmanager
+    async def shared_session():
+        yield session
+
+    return shared_session
+
+
+class ResponseStreamTests(SimpleTestCase):
+    """Validate token streaming from provider server-sent events."""
+
+    async def collect(self, service):
+        return [chunk async for chunk in service.generate_response_stream('Hi')]
+
+    def test_claude_stream_yields_text_then_response(self):
+        """Text deltas are yielded as they arrive and usage is merged into the final response."""
+        events = [
+            {'type': 'message_start', 'message': {'usage': {'input_tokens': 12}}},
+            {'type': 'content_block_delta', 'delta': {'type': 'text_delta', 'text': 'Hello '}},
+            {'type': 'content_block_delta', 'delta': {'type': 'text_delta', 'text': 'world'}},
+            {'type': 'message_delta', 'delta': {'stop_reason': 'end_turn'}, 'usage': {'output_tokens': 2}},
+            {'type': 'message_stop'},
+        ]
+        service = ClaudeService('sk-ant-test', model='claude-test')
+        with patch('apps.ai_services.services.claude_service.shared_session', fake_session(events)):
+            chunks = asyncio.run(self.collect(service))
+
+        self.assertEqual(chunks[:2], ['Hello ', 'world'])
+        self.assertTrue(chunks[2]['success'])
+        self.assertEqual(chunks[2]['content'], 'Hello world')
+        self.assertEqual(chunks[2]['metadata']['usage'], {'input_tokens': 12, 'output_tokens': 2})
+        self.assertEqual(chunks[2]['metadata']['stop_reason'], 'end_turn')
+
+    def test_openai_stream_yields_text_then_response(self):
+        """Content deltas are yielded as they arrive and the trailing usage chunk is kept."""
+        events = [
+            {'choices': [{'delta': {'role': 'assistant', 'content': ''}}]},
+            {'choices': [{'delta': {'content': 'Hello '}}]},
+            {'choices': [{'delta': {'content': 'world'}, 'finish_reason': 'stop'}]},
+            {'choices': [], 'usage': {'prompt_tokens': 12, 'completion_tokens': 2}},
+        ]
+        service = OpenAIService('sk-test', model='gpt-test')
+        with patch('apps.ai_services.services.openai_service.shared_session', fake_session(events)):
+            chunks = asyncio.run(self.collect(service))
+
+        self.assertEqual(chunks[:2], ['Hello ', 'world'])
+        self.assertEqual(chunks[2]['content'], 'Hello world')
+        self.assertEqual(chunks[2]['metadata']['usage'], {'prompt_tokens': 12, 'completion_tokens': 2})
+        self.assertEqual(chunks[2]['metadata']['finish_reason'], 'stop')
@@ -0,0 +1,69 @@
+"""
+Tests for the AI service factory.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from apps.ai_services.services.claude_service import ClaudeService
+from apps.ai_services.services.factory import AIServiceFactory
+
+
+class AIServiceFactoryTests(SimpleTestCase):
+    """Validate reuse of service instances across requests."""
+
+    def setUp(self):
+        AIServiceFactory.clear_cache()
+        self.addCleanup(AIServiceFactory.clear_cache)
+
+    def test_same_configuration_reuses_instance(self):
+        """Identical type, key and options share one instance."""
+        first = AIServiceFactory.create_service('claude', 'sk-ant-key', model='claude-a')
+        second = AIServiceFactory.create_service('Claude', 'sk-ant-key', model='claude-a')
+
+        self.assertIsInstance(first, ClaudeService)
+        self.assertIs(first, second)
+
+    def test_different_configuration_gets_new_instance(self):
+        """Keys and options are part of the cache key."""
+        base = AIServiceFactory.create_service('claude', 'sk-ant-key', model='claude-a')
+
+        self.assertIsNot(base, AIServiceFactory.create_service('claude', 'sk-ant-other', model='claude-a'))
+        self.assertIsNot(base, AIServiceFactory.create_service('claude', 'sk-ant-key', model='claude-b'))
+        self.assertEqual(AIServiceFactory.create_service('claude', 'sk-ant-key', model='claude-b').model, 'claude-b')
+
+    def test_unhashable_options_are_not_cached(self):
+        """Options that cannot be hashed still build a service."""
+        first = AIServiceFactory.create_service('openai', 'sk-key', extra={'a': 1})
+        second = AIServiceFactory.create_service('openai', 'sk-key', extra={'a': 1})
+
+        self.assertIsNot(first, second)
+
+    def test_least_recently_used_instance_evicted(self):
+        """The cache is bounded and evicts the least recently used instance."""
+        with patch.object(AIServiceFactory, 'MAX_CACHED_INSTANCES', 2):
+            first = AIServiceFactory.create_service('claude', 'sk-ant-one')
+            second = AIServiceFactory.create_service('claude', 'sk-ant-two')
+            self.assertIs(AIServiceFactory.create_service('claude', 'sk-ant-one'), first)
+            AIServiceFactory.create_service('claude', 'sk-ant-three')
+
+            self.assertIs(AIServiceFactory.create_service('claude', 'sk-ant-one'), first)
+            self.assertIsNot(AIServiceFactory.create_service('claude', 'sk-ant-two'), second)
+
+    def test_concurrent_use_stays_bounded(self):
+        """Concurrent lookups and evictions neither raise nor overfill the cache."""
+        def churn(worker):
+            for i in range(200):
+                AIServiceFactory.create_service('claude', f'sk-ant-{(worker + i) % 5}')
+
+        with patch.object(AIServiceFactory, 'MAX_CACHED_INSTANCES', 3):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(churn, range(8)))
+
+            self.assertLessEqual(len(AIServiceFactory._instances), 3)
+
+    def test_unsupported_service_rejected(self):
+        """Unknown service types raise ValueError."""
+        with self.assertRaises(ValueError):
+            AIServiceFactory.create_service('unknown', 'key')
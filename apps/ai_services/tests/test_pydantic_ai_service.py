@@ -0,0 +1,92 @@
+"""
+Tests for the unified structured output service.
+"""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from apps.ai_services.services.pydantic_ai_service import (
+    UnifiedStructuredService,
+    _schema_json,
+)
+from core.ai_models import Overview
+
+
+def make_openai_client(content='{"summary": "Short."}'):
+    """Build a mocked AsyncOpenAI client returning content."""
+    message = MagicMock()
+    message.content = content
+    completion = MagicMock()
+    completion.choices = [MagicMock(message=message)]
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(return_value=completion)
+    return client
+
+
+class SchemaPromptTests(SimpleTestCase):
+    """Validate schema rendering reuse across structured calls."""
+
+    def setUp(self):
+        _schema_json.cache_clear()
+        self.addCleanup(_schema_json.cache_clear)
+
+    def test_schema_rendered_once_per_model(self):
+        """Repeated structured calls reuse the rendered schema."""
+        client = make_openai_client()
+        service = UnifiedStructuredService()
+        service._openai_client = client
+
+        with patch.object(Overview, 'model_json_schema', wraps=Overview.model_json_schema) as mock_schema:
+            for _ in range(2):
+                result = async_to_sync(service.generate_structured_response)(
+                    provider='openai',
+                    prompt='Summarize this.',
+                    response_model=Overview
+                )
+                self.assertTrue(result['success'])
+                self.assertEqual(result['structured_data'], {'summary': 'Short.'})
+
+        self.assertEqual(mock_schema.call_count, 1)
+        prompt = client.chat.completions.create.call_args.kwargs['messages'][0]['content']
+        self.assertIn(_schema_json(Overview), prompt)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class StructuredResponseCacheTests(SimpleTestCase):
+    """Validate caching of successful structured responses."""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.service = UnifiedStructuredService()
+
+    def generate(self, prompt='Summarize this.'):
+        return async_to_sync(self.service.generate_structured_response)(
+            provider='openai',
+            prompt=prompt,
+            response_model=Overview
+        )
+
+    def test_repeated_prompt_served_from_cache(self):
+        """An identical prompt skips the provider call."""
+        client = make_openai_client()
+        self.service._openai_client = client
+
+        first = self.generate()
+        second = self.generate()
+        self.generate(prompt='Summarize something else.')
+
+        self.assertEqual(first, second)
+        self.assertEqual(client.chat.completions.create.await_count, 2)
+
+    def test_failures_are_not_cached(self):
+        """A failed provider call is retried on the next request."""
+        client = make_openai_client(content='not json')
+        self.service._openai_client = client
+
+        self.assertFalse(self.generate()['success'])
+        self.assertFalse(self.generate()['success'])
+
+        self.assertEqual(client.chat.completions.create.await_count, 2)
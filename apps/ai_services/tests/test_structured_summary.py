@@ -0,0 +1,136 @@
+"""
+Tests for the structured summary endpoint.
+"""
+from unittest.mock import AsyncMock, patch
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from api.v1.ai_services.views import MAX_SUMMARY_BATCH_SIZE
+from apps.accounts.models import User
+from core.ai_models import (
+    EnhancedSummaryResponse,
+    KeyPoint,
+    StructuredSummaryResult,
+    SummaryMetadata,
+)
+
+
+def make_summary_result(summary='A short summary.'):
+    """Build a StructuredSummaryResult suitable for mocking the service."""
+    return StructuredSummaryResult(
+        enhanced_summary=EnhancedSummaryResponse(
+            summary=summary,
+            key_points=[KeyPoint(point='Main point', importance='high')],
+            complexity_level='basic',
+            confidence_score=0.9,
+            primary_topics=['testing'],
+            tone='informal',
+            actionability='none',
+            follow_up_questions=[],
+            related_concepts=[],
+            content_type='informational'
+        ),
+        legacy_summary=summary,
+        metadata=SummaryMetadata(
+            model_used='openai',
+            processing_time=0.1,
+            word_count_original=10,
+            word_count_summary=3,
+            compression_ratio=0.3
+        ),
+        success=True,
+        error_message=None
+    )
+
+
+class StructuredSummaryViewTests(TestCase):
+    """Validate the structured summary endpoint."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='summaryuser',
+            email='summary@example.com',
+            password='testpass123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('api_v1:ai_services:structured_summary')
+
+    def test_requires_content(self):
+        """Missing content is rejected before any AI call."""
+        response = self.client.post(self.url, {}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch(
+        'apps.responses.services.structured_summary.StructuredSummaryService.generate_structured_summary',
+        new_callable=AsyncMock
+    )
+    def test_returns_summary(self, mock_generate):
+        """The async service is awaited and its result rendered."""
+        mock_generate.return_value = make_summary_result()
+
+        response = self.client.post(
+            self.url,
+            {'content': 'Some content to summarize.', 'ai_service': 'claude'},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['enhanced_summary']['summary'], 'A short summary.')
+        self.assertEqual(payload['metadata']['model_used'], 'openai')
+        self.assertIsNone(payload['error_message'])
+        mock_generate.assert_awaited_once_with(
+            content='Some content to summarize.',
+            ai_service_name='claude',
+            use_enhanced=True
+        )
+
+
+class BatchStructuredSummaryViewTests(TestCase):
+    """Validate the batch structured summary endpoint."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='batchuser',
+            email='batch@example.com',
+            password='testpass123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('api_v1:ai_services:structured_summary_batch')
+
+    def test_rejects_invalid_batches(self):
+        """Empty, oversized and content-less batches are rejected."""
+        for items in ([], [{'content': 'x'}] * (MAX_SUMMARY_BATCH_SIZE + 1), [{'ai_service': 'claude'}]):
+            response = self.client.post(self.url, {'items': items}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch(
+        'apps.responses.services.structured_summary.StructuredSummaryService.generate_structured_summary',
+        new_callable=AsyncMock
+    )
+    def test_returns_results_in_request_order(self, mock_generate):
+        """Each item is summarized and returned in the order submitted."""
+        mock_generate.side_effect = lambda content, **kwargs: make_summary_result(f'Summary of {content}')
+
+        response = self.client.post(
+            self.url,
+            {'items': [
+                {'content': 'first'},
+                {'content': 'second', 'ai_service': 'gemini', 'use_enhanced': False},
+            ]},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result['enhanced_summary']['summary'] for result in response.json()['results']],
+            ['Summary of first', 'Summary of second']
+        )
+        mock_generate.assert_any_await(content='second', ai_service_name='gemini', use_enhanced=False)
@@ -0,0 +1,199 @@
+"""
+Custom querysets for conversation models.
+"""
+from itertools import islice
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchQuery, SearchVector, SearchVectorField
+from django.db import DataError, OperationalError, connections, models, transaction
+from django.db.models import Exists, F, Func, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Left
+from django.utils import timezone
+
+# PostgreSQL rejects tsvectors over 1MB, so message text is capped first
+SEARCH_TEXT_MAX_LENGTH = 1_000_000
+
+# Rows per round trip when messages are copied through Python
+COPY_BATCH_SIZE = 500
+
+# SQL generating a primary key for rows copied with INSERT ... SELECT
+NEW_UUID_SQL = {
+    'postgresql': 'gen_random_uuid()',
+    'sqlite': 'lower(hex(randomblob(16)))',
+}
+
+
+def appended_search_vector(text):
+    """
+    Expression for the stored search vector with text appended at weight B.
+
+    A conversation without a vector yet starts from its title at weight A,
+    matching what refresh_search_vector() builds.
+    """
+    return Func(
+        Coalesce(F('search_vector'), SearchVector('title', weight='A', config='english')),
+        SearchVector(Value(text[:SEARCH_TEXT_MAX_LENGTH]), weight='B', config='english'),
+        template='%(expressions)s',
+        arg_joiner=' || ',
+        output_field=SearchVectorField(),
+    )
+
+
+class ConversationQuerySet(models.QuerySet):
+    """QuerySet helpers for conversation listings."""
+
+    def with_list_stats(self):
+        """
+        Annotate the per-row fields rendered by the conversation list.
+
+        Both values are correlated subqueries on the (conversation,
+        timestamp) message index, so a page of conversations is read in a
+        single query instead of two extra lookups per row.
+        """
+        from .models import Message
+
+        latest_messages = Message.objects.filter(
+            conversation=OuterRef('pk')
+        ).order_by('-timestamp')
+
+        return self.annotate(
+            latest_message_at=Subquery(latest_messages.values('timestamp')[:1]),
+            latest_user_message=Subquery(
+                latest_messages.filter(role='user').values('content')[:1]
+            ),
+        )
+
+    def search(self, query):
+        """
+        Filter to conversations whose title or messages match query.
+
+        On PostgreSQL this matches the stored, GIN-indexed search vector, plus
+        substring matches served by the trigram indexes for the partial words
+        and proper nouns that stemming misses. Other backends use substring
+        matching only. Message matches use EXISTS so conversations are not
+        multiplied by a messages join and de-duplicated afterwards.
+        """
+        from .models import Message
+
+        matches = Q(title__icontains=query) | Exists(Message.objects.filter(
+            conversation=OuterRef('pk'),
+            content__icontains=query
+        ))
+        if connections[self.db].vendor == 'postgresql':
+            matches |= Q(search_vector=SearchQuery(query, config='english'))
+        return self.filter(matches)
+
+    def record_message(self, message):
+        """
+        Fold a newly created message into the stored conversation totals.
+
+        A single UPDATE with F() expressions replaces recounting every
+        message, and concurrent writers cannot overwrite each other's counts.
+        Cost is untouched since it only changes with AI responses. On
+        PostgreSQL the same UPDATE appends the message to the search vector,
+        so the write does not depend on the conversation's length.
+        """
+        updates = {
+            'total_messages': F('total_messages') + 1,
+            'total_tokens_used': F('total_tokens_used') + message.tokens_used,
+            'last_message_at': message.timestamp,
+            'updated_at': timezone.now(),
+        }
+        if message.role == 'user' and message.content:
+            updates['last_user_message_excerpt'] = message.content.strip()[:200]
+
+        if connections[self.db].vendor != 'postgresql' or not message.content:
+            return self.update(**updates)
+        try:
+            with transaction.atomic(using=self.db):
+                return self.update(**updates, search_vector=appended_search_vector(message.content))
+        except (DataError, OperationalError):
+            # The vector has hit PostgreSQL's 1MB tsvector limit; keep it as is
+            return self.update(**updates)
+
+    def refresh_search_vector(self):
+        """
+        Rebuild the stored full-text vector from title and message content.
+
+        The vector backs the GIN-indexed search path and is only maintained
+        on PostgreSQL; other backends fall back to substring matching. This
+        reads every message, so it is for title changes and bulk copies;
+        single messages are appended by record_message().
+        """
+        if connections[self.db].vendor != 'postgresql':
+            return 0
+
+        from .models import Message
+
+        message_text = Message.objects.filter(
+            conversation=OuterRef('pk')
+        ).order_by().values('conversation').annotate(
+            text=StringAgg('content', delimiter=' ', ordering='timestamp')
+        ).values('text')
+
+        return self.update(
+            search_vector=(
+                SearchVector('title', weight='A', config='english') +
+                SearchVector(
+                    Left(Subquery(message_text), SEARCH_TEXT_MAX_LENGTH),
+                    weight='B',
+                    config='english'
+                )
+            )
+        )
+
+
+class MessageQuerySet(models.QuerySet):
+    """QuerySet helpers for conversation messages."""
+
+    COPY_FIELDS = ('role', 'content', 'timestamp', 'tokens_used', 'metadata')
+
+    def copy_to(self, conversation):
+        """
+        Copy these messages into another conversation.
+
+        Rows are copied with a single INSERT ... SELECT so message content
+        never passes through Python. Original timestamps are kept, which
+        preserves ordering. Returns the number of messages copied.
+        """
+        connection = connections[self.db]
+        new_id_sql = NEW_UUID_SQL.get(connection.vendor)
+        if new_id_sql is None:
+            # Stream the source rows so memory stays bounded by one batch
+            messages = self.iterator(chunk_size=COPY_BATCH_SIZE)
+            copied = 0
+            while batch := [
+                self.model(
+                    conversation=conversation,
+                    role=message.role,
+                    content=message.content,
+                    tokens_used=message.tokens_used,
+                    metadata=message.metadata.copy() if message.metadata else {}
+                )
+                for message in islice(messages, COPY_BATCH_SIZE)
+            ]:
+                self.model.objects.bulk_create(batch)
+                copied += len(batch)
+            return copied
+
+        opts = self.model._meta
+        quote = connection.ops.quote_name
+        conversation_field = opts.get_field('conversation')
+        copy_columns = [quote(opts.get_field(name).column) for name in self.COPY_FIELDS]
+
+        select_sql, select_params = self.order_by().values(
+            *self.COPY_FIELDS
+        ).query.get_compiler(self.db).as_sql()
+        sql = 'INSERT INTO {table} ({pk}, {conversation}, {columns}) SELECT {new_id}, %s, {columns} FROM ({select}) source'.format(
+            table=quote(opts.db_table),
+            pk=quote(opts.pk.column),
+            conversation=quote(conversation_field.column),
+            columns=', '.join(copy_columns),
+            new_id=new_id_sql,
+            select=select_sql,
+        )
+        conversation_id = conversation_field.get_db_prep_value(conversation.pk, connection)
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [conversation_id, *select_params])
+            return cursor.rowcount
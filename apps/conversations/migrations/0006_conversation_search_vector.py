@@ -0,0 +1,52 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_INDEX = django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='conv_search_idx')
+
+BACKFILL_SQL = """
+    UPDATE conversations c SET search_vector =
+        setweight(to_tsvector('english', coalesce(c.title, '')), 'A') ||
+        setweight(to_tsvector('english', left(coalesce((
+            SELECT string_agg(m.content, ' ' ORDER BY m.timestamp)
+            FROM messages m WHERE m.conversation_id = c.id
+        ), ''), 1000000)), 'B')
+"""
+
+
+def create_search_index(apps, schema_editor):
+    # GIN indexes and tsvector only exist on PostgreSQL
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.add_index(apps.get_model('conversations', 'Conversation'), SEARCH_INDEX)
+    schema_editor.execute(BACKFILL_SQL)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.remove_index(apps.get_model('conversations', 'Conversation'), SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conversations', '0005_backfill_is_archived'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='conversation',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Full-text vector of title and messages (PostgreSQL only)', null=True),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='conversation', index=SEARCH_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(create_search_index, drop_search_index),
+            ],
+        ),
+    ]
@@ -0,0 +1,51 @@
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+TRIGRAM_INDEXES = [
+    ('conversation', django.contrib.postgres.indexes.GinIndex(
+        django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('title'), name='gin_trgm_ops'),
+        name='conv_title_trgm_idx'
+    )),
+    ('message', django.contrib.postgres.indexes.GinIndex(
+        django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('content'), name='gin_trgm_ops'),
+        name='msg_content_trgm_idx'
+    )),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # gin_trgm_ops only exists on PostgreSQL with pg_trgm installed
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for model_name, index in TRIGRAM_INDEXES:
+        schema_editor.add_index(apps.get_model('conversations', model_name), index)
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for model_name, index in TRIGRAM_INDEXES:
+        schema_editor.remove_index(apps.get_model('conversations', model_name), index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conversations', '0006_conversation_search_vector'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name=model_name, index=index)
+                for model_name, index in TRIGRAM_INDEXES
+            ],
+            database_operations=[
+                migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+            ],
+        ),
+    ]
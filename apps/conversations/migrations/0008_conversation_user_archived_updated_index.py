@@ -0,0 +1,21 @@
+# Generated by Django 4.2.24 on 2026-10-16 20:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conversations', '0007_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='conversation',
+            name='conv_user_archived_idx',
+        ),
+        migrations.AddIndex(
+            model_name='conversation',
+            index=models.Index(fields=['user', 'is_archived', '-updated_at'], name='conv_user_arch_updated_idx'),
+        ),
+    ]
@@ -1,9 +1,14 @@
 """Conversation and message models for ChatAI."""
 from decimal import Decimal
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import connection, models
+from django.db.models.functions import Upper
 import uuid
 
+from .managers import ConversationQuerySet, MessageQuerySet
+
 
 class Conversation(models.Model):
     """
@@ -34,6 +39,9 @@ class Conversation(models.Model):
     last_user_message_excerpt = models.CharField(max_length=200, blank=True, help_text='Excerpt of last user message for preview')
     total_cost = models.DecimalField(max_digits=10, decimal_places=6, default=0, help_text='Total cost of this conversation')
     is_archived = models.BooleanField(default=False, help_text='Whether conversation is archived')
+    search_vector = SearchVectorField(null=True, editable=False, help_text='Full-text vector of title and messages (PostgreSQL only)')
+
+    objects = ConversationQuerySet.as_manager()
 
     class Meta:
         db_table = 'conversations'
@@ -44,9 +52,12 @@ class Conversation(models.Model):
             models.Index(fields=['user', '-updated_at'], name='conv_user_updated_idx'),
             models.Index(fields=['user', '-created_at'], name='conv_user_created_idx'),
             models.Index(fields=['user', 'is_active'], name='conv_user_active_idx'),
-            models.Index(fields=['user', 'is_archived'], name='conv_user_archived_idx'),
+            models.Index(fields=['user', 'is_archived', '-updated_at'], name='conv_user_arch_updated_idx'),
             models.Index(fields=['-total_cost'], name='conv_cost_idx'),
             models.Index(fields=['-total_tokens_used'], name='conv_tokens_idx'),
+            GinIndex(fields=['search_vector'], name='conv_search_idx'),
+            # Matches the UPPER(...) LIKE that icontains compiles to
+            GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'), name='conv_title_trgm_idx'),
         ]
     
     def __str__(self):
@@ -62,6 +73,7 @@ class Conversation(models.Model):
                 title += "..."
             self.title = title
             self.save(update_fields=['title'])
+            Conversation.objects.filter(pk=self.pk).refresh_search_vector()
     
     
     def is_structured_mode(self):
@@ -105,11 +117,7 @@ class Conversation(models.Model):
         )['total'] or 0
 
         # Update total cost using SQL view for accurate pricing aggregation
-        conversation_id = (
-            str(self.id).replace('-', '')
-            if connection.vendor == 'sqlite'
-            else str(self.id)
-        )
+        conversation_id = self._meta.pk.get_db_prep_value(self.id, connection)
 
         with connection.cursor() as cursor:
             cursor.execute(
@@ -148,7 +156,9 @@ class Message(models.Model):
     
     # For multi-AI responses, this links to the query that generated multiple responses
     query_session = models.UUIDField(null=True, blank=True)
-    
+
+    objects = MessageQuerySet.as_manager()
+
     class Meta:
         db_table = 'messages'
         ordering = ['timestamp']
@@ -157,6 +167,7 @@ class Message(models.Model):
         indexes = [
             models.Index(fields=['conversation', 'timestamp']),
             models.Index(fields=['query_session']),
+            GinIndex(OpClass(Upper('content'), name='gin_trgm_ops'), name='msg_content_trgm_idx'),
         ]
     
     def __str__(self):
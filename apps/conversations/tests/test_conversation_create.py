@@ -0,0 +1,67 @@
+"""
+Tests for conversation creation.
+"""
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory
+
+from api.v1.conversations import serializers as conversation_serializers
+from api.v1.conversations.serializers import ConversationCreateSerializer
+
+User = get_user_model()
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ConversationCreateSerializerTests(TestCase):
+    """Validate ownership of conversations created without a logged-in user."""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        request = APIRequestFactory().post('/')
+        request.user = AnonymousUser()
+        self.context = {'request': request}
+
+    def create(self, title):
+        serializer = ConversationCreateSerializer(data={'title': title}, context=self.context)
+        serializer.is_valid(raise_exception=True)
+        return serializer.save()
+
+    def test_anonymous_conversation_unowned_without_demo_user(self):
+        """Without a demo user, anonymous conversations have no owner."""
+        self.assertIsNone(self.create('Anonymous').user_id)
+
+    def test_demo_user_looked_up_once(self):
+        """The demo user id is cached after the first lookup."""
+        demo_user = User.objects.create_user(
+            username=conversation_serializers.DEMO_USERNAME,
+            email='demo@example.com',
+            password='testpass123'
+        )
+
+        self.assertEqual(self.create('First').user_id, demo_user.pk)
+
+        # Only the conversation INSERT remains
+        with self.assertNumQueries(1):
+            second = self.create('Second')
+        self.assertEqual(second.user_id, demo_user.pk)
+
+    def test_recreated_demo_user_not_stale(self):
+        """Deleting and recreating the demo user invalidates the cached id."""
+        old_user = User.objects.create_user(
+            username=conversation_serializers.DEMO_USERNAME,
+            email='demo@example.com',
+            password='testpass123'
+        )
+        self.assertEqual(self.create('First').user_id, old_user.pk)
+
+        old_user.delete()
+        new_user = User.objects.create_user(
+            username=conversation_serializers.DEMO_USERNAME,
+            email='demo@example.com',
+            password='testpass123'
+        )
+
+        self.assertEqual(self.create('Second').user_id, new_user.pk)
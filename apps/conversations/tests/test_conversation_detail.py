@@ -0,0 +1,93 @@
+"""
+Tests for the conversation detail endpoint.
+"""
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from api.v1.conversations.serializers import ConversationDetailSerializer
+from apps.ai_services.models import AIQuery, AIService
+from apps.conversations.models import Conversation, Message
+from apps.responses.models import AIResponse
+
+User = get_user_model()
+
+
+class ConversationDetailTests(TestCase):
+    """Validate detail payloads built from prefetched relations."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='detailtester',
+            email='detail@example.com',
+            password='testpass123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.conversation = Conversation.objects.create(user=self.user, title='Detail', total_messages=1)
+        Message.objects.create(conversation=self.conversation, role='user', content='Hello')
+
+        services = [
+            AIService.objects.create(
+                name=name,
+                display_name=name.title(),
+                api_base_url='https://example.com',
+                model_name=f'{name}-model'
+            )
+            for name in ('claude', 'openai')
+        ]
+        for prompt in ('First', 'Second'):
+            query = AIQuery.objects.create(user=self.user, conversation=self.conversation, prompt=prompt)
+            for service in services:
+                AIResponse.objects.create(
+                    query=query,
+                    service=service,
+                    content='Answer',
+                    tokens_used=100,
+                    cost=Decimal('0.010000')
+                )
+        self.url = reverse('api_v1:conversations:conversation-detail', args=[self.conversation.id])
+
+    def test_services_used_matches_aggregate_query(self):
+        """Prefetched service usage matches the database GROUP BY result."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+        expected = ConversationDetailSerializer(
+            Conversation.objects.get(pk=self.conversation.pk)
+        ).data['ai_services_used']
+
+        key = lambda entry: entry['service__name']
+        self.assertEqual(
+            sorted(response.data['ai_services_used'], key=key),
+            sorted(expected, key=key)
+        )
+        self.assertEqual(
+            [(entry['response_count'], entry['total_tokens']) for entry in expected],
+            [(2, 200), (2, 200)]
+        )
+
+    def test_recent_queries_newest_first(self):
+        """Recent queries are listed newest first with string ids."""
+        response = self.client.get(self.url)
+
+        queries = list(self.conversation.ai_queries.order_by('-started_at'))
+        self.assertEqual(
+            [entry['id'] for entry in response.data['recent_queries']],
+            [str(query.id) for query in queries]
+        )
+        self.assertEqual(
+            set(response.data['recent_queries'][0]),
+            {'id', 'status', 'started_at', 'completed_at', 'total_responses'}
+        )
+
+    def test_detail_query_count(self):
+        """Usage totals come from narrowed prefetches without per-row loads."""
+        # Conversation, messages, queries, responses with services, context
+        # and recent queries
+        with self.assertNumQueries(6):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data['ai_services_used']), 2)
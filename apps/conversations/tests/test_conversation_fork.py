@@ -0,0 +1,112 @@
+"""
+Tests for the conversation fork action.
+"""
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.conversations import managers
+from apps.conversations.models import Conversation, Message
+
+User = get_user_model()
+
+
+class ConversationForkTests(TestCase):
+    """Validate forking whole conversations and partial histories."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='forktester',
+            email='fork@example.com',
+            password='testpass123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.conversation = Conversation.objects.create(user=self.user, title='Original')
+        self.messages = [
+            Message.objects.create(
+                conversation=self.conversation,
+                role='user' if index % 2 == 0 else 'assistant',
+                content=f'Message {index}',
+                tokens_used=10 * (index + 1),
+                metadata={'index': index}
+            )
+            for index in range(4)
+        ]
+        self.url = reverse('api_v1:conversations:conversation-fork', args=[self.conversation.id])
+
+    def test_fork_copies_all_messages(self):
+        """Without a cut-off, every message is copied in order."""
+        response = self.client.post(self.url, {}, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        fork = Conversation.objects.get(pk=response.data['id'])
+        self.assertEqual(fork.title, 'Fork of Original')
+        self.assertEqual(
+            list(fork.messages.order_by('timestamp').values_list('content', flat=True)),
+            ['Message 0', 'Message 1', 'Message 2', 'Message 3']
+        )
+        self.assertEqual(fork.total_messages, 4)
+        self.assertEqual(fork.total_tokens_used, 100)
+
+    def test_fork_up_to_message(self):
+        """A cut-off message limits the copy to it and everything before."""
+        response = self.client.post(
+            self.url,
+            {'title': 'Partial', 'from_message_id': str(self.messages[1].id)},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, 201)
+        fork = Conversation.objects.get(pk=response.data['id'])
+        self.assertEqual(fork.title, 'Partial')
+        self.assertEqual(
+            list(fork.messages.order_by('timestamp').values_list('content', 'metadata')),
+            [('Message 0', {'index': 0}), ('Message 1', {'index': 1})]
+        )
+        self.assertEqual(fork.total_messages, 2)
+        self.assertEqual(fork.total_tokens_used, 30)
+
+    def test_fork_query_count_independent_of_length(self):
+        """Copied messages are inserted in bulk rather than one per row."""
+        with CaptureQueriesContext(connection) as short_fork:
+            self.client.post(self.url, {}, format='json')
+
+        for index in range(4, 12):
+            Message.objects.create(conversation=self.conversation, role='user', content=f'Message {index}')
+        with CaptureQueriesContext(connection) as long_fork:
+            response = self.client.post(self.url, {}, format='json')
+
+        self.assertEqual(len(long_fork), len(short_fork))
+        self.assertEqual(Conversation.objects.get(pk=response.data['id']).total_messages, 12)
+
+    def test_fork_copies_in_batches_without_insert_select(self):
+        """Backends without INSERT ... SELECT support copy in streamed batches."""
+        with patch.dict(managers.NEW_UUID_SQL, clear=True), patch.object(managers, 'COPY_BATCH_SIZE', 3):
+            response = self.client.post(self.url, {}, format='json')
+
+        fork = Conversation.objects.get(pk=response.data['id'])
+        self.assertEqual(
+            sorted(fork.messages.values_list('content', flat=True)),
+            [f'Message {index}' for index in range(4)]
+        )
+        self.assertEqual(fork.total_messages, 4)
+
+    def test_fork_rejects_message_from_other_conversation(self):
+        """A cut-off message must belong to the forked conversation."""
+        other = Conversation.objects.create(user=self.user, title='Other')
+        foreign_message = Message.objects.create(conversation=other, role='user', content='Elsewhere')
+
+        response = self.client.post(
+            self.url,
+            {'from_message_id': str(foreign_message.id)},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Conversation.objects.filter(user=self.user).count(), 2)
@@ -0,0 +1,128 @@
+"""
+Tests for the conversation list endpoint.
+"""
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.ai_services.models import AIQuery, AIService
+from apps.conversations.models import Conversation, Message
+from apps.responses.models import AIResponse
+
+User = get_user_model()
+
+
+class ConversationListTests(TestCase):
+    """Validate list payloads and their query budget."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='listtester',
+            email='list@example.com',
+            password='testpass123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('api_v1:conversations:conversation-list')
+        self.service = AIService.objects.create(
+            name='claude',
+            display_name='Claude',
+            api_base_url='https://api.anthropic.com',
+            model_name='claude-sonnet-4-20250514',
+            input_cost_per_1k=Decimal('0.003'),
+            output_cost_per_1k=Decimal('0.015')
+        )
+
+    def create_conversation(self, title, user_message):
+        conversation = Conversation.objects.create(user=self.user, title=title, total_messages=2)
+        Message.objects.create(conversation=conversation, role='user', content=user_message)
+        Message.objects.create(conversation=conversation, role='assistant', content='Answer')
+        query = AIQuery.objects.create(user=self.user, conversation=conversation, prompt=user_message)
+        AIResponse.objects.create(
+            query=query,
+            service=self.service,
+            content='Answer',
+            input_tokens=1000,
+            output_tokens=1000
+        )
+        conversation.update_conversation_metadata()
+        return conversation
+
+    def results(self, response):
+        data = response.json()
+        return data['results'] if isinstance(data, dict) and 'results' in data else data
+
+    def test_list_includes_message_and_service_fields(self):
+        """Annotated fields match the latest messages and services used."""
+        conversation = self.create_conversation('First', '  ' + 'x' * 120 + '  ')
+        last_message = conversation.messages.order_by('-timestamp').first()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        entry = self.results(response)[0]
+        self.assertEqual(entry['last_message_excerpt'], 'x' * 100 + '...')
+        self.assertEqual(entry['ai_services_used'], ['claude'])
+        self.assertEqual(
+            entry['last_message_at'].replace('Z', '+00:00'),
+            last_message.timestamp.isoformat()
+        )
+
+    def test_list_query_count_is_constant(self):
+        """Rows do not trigger per-conversation message, service or cost lookups."""
+        self.create_conversation('First', 'Hello')
+
+        # Page and services batch; cursor pagination runs no COUNT(*)
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
+        self.create_conversation('Second', 'Hi again')
+        self.create_conversation('Third', 'Hello once more')
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        results = self.results(response)
+        self.assertEqual(len(results), 3)
+        for entry in results:
+            self.assertAlmostEqual(entry['total_cost'], 0.018)
+
+    def test_list_pages_with_cursor(self):
+        """Pages follow opaque cursors, newest first, without totals."""
+        titles = ['First', 'Second', 'Third']
+        for title in titles:
+            self.create_conversation(title, 'Hello')
+
+        first_page = self.client.get(self.url, {'page_size': 2}).json()
+        self.assertNotIn('count', first_page['pagination'])
+        self.assertIn('cursor=', first_page['pagination']['next'])
+
+        second_page = self.client.get(first_page['pagination']['next']).json()
+        self.assertIsNone(second_page['pagination']['next'])
+        self.assertEqual(
+            [entry['title'] for entry in first_page['results'] + second_page['results']],
+            titles[::-1]
+        )
+
+    def test_cursor_pages_through_duplicate_titles(self):
+        """Ordering by a non-unique field neither skips nor repeats rows."""
+        created = {self.create_conversation('Same title', 'Hello').pk for _ in range(5)}
+
+        seen = []
+        url, params = self.url, {'page_size': 2, 'ordering': 'title'}
+        while url:
+            page = self.client.get(url, params).json()
+            seen.extend(entry['id'] for entry in page['results'])
+            url, params = page['pagination']['next'], None
+
+        self.assertEqual(len(seen), 5)
+        self.assertEqual({str(pk) for pk in created}, set(seen))
+
+    def test_page_numbers_rejected(self):
+        """Stale page-number clients get an error instead of the first page again."""
+        self.create_conversation('First', 'Hello')
+
+        self.assertEqual(self.client.get(self.url, {'page': 2}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'page': 1}).status_code, 200)
@@ -0,0 +1,67 @@
+"""
+Tests for the conversation messages endpoint.
+"""
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.conversations.models import Conversation, Message
+
+User = get_user_model()
+
+
+class ConversationMessagesTests(TestCase):
+    """Validate listing and adding messages within a conversation."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='messagetester',
+            email='messages@example.com',
+            password='testpass123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.conversation = Conversation.objects.create(user=self.user, title='Messages')
+        self.url = reverse(
+            'api_v1:conversations:conversation-messages',
+            kwargs={'conversation_pk': self.conversation.id}
+        )
+
+    def test_list_messages_in_order(self):
+        """Messages are listed oldest first with their metadata."""
+        for index in range(3):
+            Message.objects.create(
+                conversation=self.conversation,
+                role='user',
+                content=f'Message {index}',
+                metadata={'index': index}
+            )
+
+        # Ownership check, count and page
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual([entry['content'] for entry in results], ['Message 0', 'Message 1', 'Message 2'])
+        self.assertEqual(results[2]['metadata'], {'index': 2})
+
+    def test_create_message_updates_totals(self):
+        """New messages are folded into the stored conversation totals."""
+        Message.objects.create(conversation=self.conversation, role='assistant', content='Earlier', tokens_used=5)
+        self.conversation.update_conversation_metadata()
+
+        response = self.client.post(
+            self.url,
+            {'role': 'user', 'content': '  Follow-up question  ', 'tokens_used': 7},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.conversation.refresh_from_db()
+        message = Message.objects.get(pk=response.data['id'])
+        self.assertEqual(self.conversation.total_messages, 2)
+        self.assertEqual(self.conversation.total_tokens_used, 12)
+        self.assertEqual(self.conversation.last_message_at, message.timestamp)
+        self.assertEqual(self.conversation.last_user_message_excerpt, 'Follow-up question')
@@ -0,0 +1,58 @@
+"""
+Tests for the conversation search action.
+"""
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.conversations.models import Conversation, Message
+
+User = get_user_model()
+
+
+class ConversationSearchTests(TestCase):
+    """Validate search matching and pagination."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='searchtester',
+            email='search@example.com',
+            password='testpass123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('api_v1:conversations:conversation-search')
+
+    def create_conversation(self, title, *contents):
+        conversation = Conversation.objects.create(user=self.user, title=title)
+        for content in contents:
+            Message.objects.create(conversation=conversation, role='user', content=content)
+        return conversation
+
+    def test_search_does_not_count_matches(self):
+        """Search pages through a cursor without a COUNT(*) over the matches."""
+        self.create_conversation('Django tips', 'How do I write a queryset?')
+        self.create_conversation('Cooking', 'Best pasta recipe')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {'q': 'django'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([entry['title'] for entry in response.json()['results']], ['Django tips'])
+        self.assertNotIn('count', response.json()['pagination'])
+        self.assertFalse(any('COUNT(' in query['sql'].upper() for query in queries))
+
+    def test_matches_are_not_duplicated(self):
+        """A conversation with several matching messages is returned once."""
+        self.create_conversation('Notes', 'Django models', 'More on django views', 'Unrelated')
+        self.create_conversation('Django in the title')
+
+        response = self.client.get(self.url, {'q': 'django'})
+
+        self.assertEqual(
+            sorted(entry['title'] for entry in response.json()['results']),
+            ['Django in the title', 'Notes']
+        )
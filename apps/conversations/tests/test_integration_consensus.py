@@ -3,14 +3,28 @@ Integration tests for consensus endpoints.
 
 Tests the full flow from HTTP request through service layer to database storage.
 """
+import json
 from decimal import Decimal
 from unittest.mock import patch, AsyncMock, MagicMock
-from django.test import TestCase, TransactionTestCase, override_settings
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
 
+from api.v1.consensus_ai import (
+    CHAT_HISTORY_MAX_CHARS,
+    MAX_REQUEST_BODY_SIZE,
+    PROVIDER_MODELS,
+    SYNOPSIS_INSTRUCTION,
+    generate_synopsis_with_same_ai,
+    local_synopsis,
+    response_cache_key,
+    trim_chat_history,
+)
 from apps.conversations.models import Conversation
 from apps.ai_services.models import AIService, AIQuery
 from apps.responses.models import AIResponse
@@ -82,7 +96,7 @@ class ConsensusIntegrationTests(TransactionTestCase):
         mock_claude = MagicMock()
         mock_claude.generate_response = AsyncMock(return_value={
             'success': True,
-            'content': 'Claude response about Django testing',
+            'content': 'Claude response about Django testing. ' * 30,
             'metadata': {
                 'usage': {
                     'input_tokens': 100,
@@ -94,7 +108,7 @@ class ConsensusIntegrationTests(TransactionTestCase):
         mock_openai = MagicMock()
         mock_openai.generate_response = AsyncMock(return_value={
             'success': True,
-            'content': 'OpenAI response about Django testing',
+            'content': 'OpenAI response about Django testing. ' * 30,
             'metadata': {
                 'usage': {
                     'prompt_tokens': 110,
@@ -106,7 +120,7 @@ class ConsensusIntegrationTests(TransactionTestCase):
         mock_gemini = MagicMock()
         mock_gemini.generate_response = AsyncMock(return_value={
             'success': True,
-            'content': 'Gemini response about Django testing',
+            'content': 'Gemini response about Django testing. ' * 30,
             'metadata': {
                 'usage': {
                     'promptTokenCount': 90,
@@ -115,7 +129,7 @@ class ConsensusIntegrationTests(TransactionTestCase):
             }
         })
 
-        # Mock synopsis generation (same services called again)
+        # Synopses are generated by the same service instances
         def mock_create_service(service_name, api_key, model=None):
             if 'claude' in service_name:
                 return mock_claude
@@ -174,6 +188,9 @@ class ConsensusIntegrationTests(TransactionTestCase):
         synopsis_responses = ai_responses.filter(summary='Synopsis generation call')
         self.assertEqual(synopsis_responses.count(), 3)
 
+        # One service lookup per provider; the synopsis call reuses it
+        self.assertEqual(mock_factory.call_count, 3)
+
         # Note: Conversation.total_tokens_used is aggregated from Message records, not AIResponse records
         # The consensus endpoint creates AIResponse records for tracking AI service costs
         # Message records (which update conversation.total_tokens_used) are created separately
@@ -196,14 +213,14 @@ class ConsensusIntegrationTests(TransactionTestCase):
         mock_openai = MagicMock()
         mock_openai.generate_response = AsyncMock(return_value={
             'success': True,
-            'content': 'OpenAI response',
+            'content': 'OpenAI response. ' * 70,
             'metadata': {'usage': {'prompt_tokens': 100, 'completion_tokens': 200}}
         })
 
         mock_gemini = MagicMock()
         mock_gemini.generate_response = AsyncMock(return_value={
             'success': True,
-            'content': 'Gemini response',
+            'content': 'Gemini response. ' * 70,
             'metadata': {'usageMetadata': {'promptTokenCount': 90, 'candidatesTokenCount': 180}}
         })
 
@@ -252,6 +269,202 @@ class ConsensusIntegrationTests(TransactionTestCase):
         # Should have 4 records (2 main + 2 synopsis for successful services)
         self.assertEqual(ai_responses.count(), 4)
 
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_provider_exception_reported_under_its_name(self, mock_factory):
+        """
+        Test: 1 LLM raises → its result names the service → others unaffected
+        """
+        mock_openai = MagicMock()
+        mock_openai.generate_response = AsyncMock(return_value={
+            'success': True,
+            'content': 'OpenAI response',
+            'metadata': {'usage': {'prompt_tokens': 100, 'completion_tokens': 20}}
+        })
+
+        def mock_create_service(service_name, api_key, model=None):
+            if service_name == 'claude':
+                raise ValueError('Claude client misconfigured')
+            return mock_openai
+
+        mock_factory.side_effect = mock_create_service
+
+        url = reverse('api_v1:consensus')
+        data = {'message': 'Test query', 'services': ['claude', 'openai'], 'use_web_search': False}
+
+        results = self.client.post(url, data, format='json').json()['results']
+
+        self.assertEqual([result['service'] for result in results], ['Claude', 'OpenAI'])
+        self.assertFalse(results[0]['success'])
+        self.assertEqual(results[0]['error'], 'Claude client misconfigured')
+        self.assertTrue(results[1]['success'])
+
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_inline_synopsis_skips_second_call(self, mock_factory):
+        """
+        Test: answer and synopsis in one completion → one call per LLM, no synopsis records
+        """
+        mock_service = MagicMock()
+        mock_service.generate_response = AsyncMock(side_effect=lambda *args: {
+            'success': True,
+            'content': 'Full answer\n===SYNOPSIS===\nShort synopsis',
+            'metadata': {'usage': {'input_tokens': 100, 'output_tokens': 200}}
+        })
+        mock_factory.return_value = mock_service
+
+        url = reverse('api_v1:consensus')
+        data = {
+            'message': 'Test query',
+            'services': ['claude', 'openai'],
+            'use_web_search': False,
+            'conversation_id': str(self.conversation.id)
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for result in response.json()['results']:
+            self.assertEqual(result['content'], 'Full answer')
+            self.assertEqual(result['synopsis'], 'Short synopsis')
+        self.assertEqual(mock_service.generate_response.await_count, 2)
+
+        # Every provider is sent the same prompt object, built once per request
+        first_prompt, second_prompt = (call.args[0] for call in mock_service.generate_response.await_args_list)
+        self.assertIs(first_prompt, second_prompt)
+        self.assertTrue(first_prompt.endswith(SYNOPSIS_INSTRUCTION))
+
+        ai_responses = AIResponse.objects.filter(query__conversation=self.conversation)
+        self.assertEqual(
+            list(ai_responses.values_list('content', 'summary')),
+            [('Full answer', 'Short synopsis')] * 2
+        )
+
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_short_answer_is_its_own_synopsis(self, mock_factory):
+        """
+        Test: answer shorter than a synopsis → no synopsis call, answer reused
+        """
+        mock_service = MagicMock()
+        mock_service.generate_response = AsyncMock(return_value={
+            'success': True,
+            'content': 'Use TestCase for database tests.',
+            'metadata': {'usage': {'input_tokens': 100, 'output_tokens': 20}}
+        })
+        mock_factory.return_value = mock_service
+
+        url = reverse('api_v1:consensus')
+        data = {
+            'message': 'Test query',
+            'services': ['claude'],
+            'use_web_search': False,
+            'conversation_id': str(self.conversation.id)
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['results'][0]['synopsis'], 'Use TestCase for database tests.')
+        self.assertEqual(mock_service.generate_response.await_count, 1)
+        self.assertEqual(AIResponse.objects.filter(query__conversation=self.conversation).count(), 1)
+
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_streamed_consensus_emits_ndjson_lines(self, mock_factory):
+        """
+        Test: stream=true → one NDJSON line per LLM, then a done line → records tracked
+        """
+        mock_service = MagicMock()
+        mock_service.generate_response = AsyncMock(return_value={
+            'success': True,
+            'content': 'Streamed answer',
+            'metadata': {'usage': {'input_tokens': 100, 'output_tokens': 20}}
+        })
+        mock_factory.return_value = mock_service
+
+        url = reverse('api_v1:consensus')
+        data = {
+            'message': 'Test query',
+            'services': ['claude', 'openai'],
+            'use_web_search': False,
+            'conversation_id': str(self.conversation.id),
+            'stream': True
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = [json.loads(line) for line in b''.join(response).splitlines()]
+        self.assertEqual([line['type'] for line in lines], ['result', 'result', 'done'])
+        self.assertEqual({line['service'] for line in lines[:2]}, {'Claude', 'OpenAI'})
+        self.assertEqual(lines[2]['web_search_sources'], [])
+
+        ai_query = AIQuery.objects.get(conversation=self.conversation)
+        self.assertEqual(ai_query.status, 'completed')
+        self.assertEqual(ai_query.total_responses, 2)
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_repeated_query_served_from_cache(self, mock_factory):
+        """
+        Test: identical query twice → one provider call → repeat tracked without tokens
+        """
+        cache.clear()
+        self.addCleanup(cache.clear)
+        mock_service = MagicMock()
+        mock_service.generate_response = AsyncMock(return_value={
+            'success': True,
+            'content': 'Cached answer',
+            'metadata': {'usage': {'input_tokens': 100, 'output_tokens': 20}}
+        })
+        mock_factory.return_value = mock_service
+
+        url = reverse('api_v1:consensus')
+        data = {
+            'message': 'Test query',
+            'services': ['claude'],
+            'use_web_search': False,
+            'conversation_id': str(self.conversation.id)
+        }
+
+        first = self.client.post(url, data, format='json').json()
+        second = self.client.post(url, data, format='json').json()
+
+        self.assertEqual(first['results'][0]['content'], second['results'][0]['content'])
+        self.assertEqual(mock_service.generate_response.await_count, 1)
+        self.assertEqual(
+            sorted(AIResponse.objects.filter(query__conversation=self.conversation).values_list('tokens_used', flat=True)),
+            [0, 120]
+        )
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_cached_answers_not_shared_between_users(self, mock_factory):
+        """
+        Test: two users send the same query → each gets their own provider call
+        """
+        cache.clear()
+        self.addCleanup(cache.clear)
+        mock_service = MagicMock()
+        mock_service.generate_response = AsyncMock(return_value={
+            'success': True,
+            'content': 'Sampled answer',
+            'metadata': {'usage': {'input_tokens': 100, 'output_tokens': 20}}
+        })
+        mock_factory.return_value = mock_service
+        other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+
+        url = reverse('api_v1:consensus')
+        data = {'message': 'Test query', 'services': ['claude'], 'use_web_search': False}
+
+        self.client.post(url, data, format='json')
+        self.client.force_authenticate(user=other_user)
+        self.client.post(url, data, format='json')
+
+        self.assertEqual(mock_service.generate_response.await_count, 2)
+
     @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
     def test_synthesis_endpoint_combines_responses(self, mock_factory):
         """
@@ -293,6 +506,9 @@ class ConsensusIntegrationTests(TransactionTestCase):
         self.assertIn('synthesis', response_data)
         self.assertIn('synthesis_provider', response_data)
         self.assertEqual(response_data['synthesis_provider'], 'Claude')
+        mock_factory.assert_called_once_with(
+            'claude', 'test-claude-key', model=PROVIDER_MODELS['claude']
+        )
 
         # Assert cost tracked
         ai_query = AIQuery.objects.filter(
@@ -307,6 +523,123 @@ class ConsensusIntegrationTests(TransactionTestCase):
         self.assertEqual(ai_response.summary, 'Response synthesis')
         self.assertGreater(ai_response.tokens_used, 0)
 
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_repeated_synthesis_served_from_cache(self, mock_factory):
+        """
+        Test: identical synthesis twice → one provider call → repeat tracked without tokens
+        """
+        cache.clear()
+        self.addCleanup(cache.clear)
+        mock_claude = MagicMock()
+        mock_claude.model = 'claude-sonnet-4-20250514'
+        mock_claude.generate_response = AsyncMock(return_value={
+            'success': True,
+            'content': 'Synthesized response',
+            'metadata': {'usage': {'input_tokens': 500, 'output_tokens': 300}}
+        })
+        mock_factory.return_value = mock_claude
+
+        url = reverse('api_v1:consensus_synthesis')
+        data = {
+            'user_query': 'What is Django ORM?',
+            'llm1_name': 'Claude',
+            'llm1_response': 'Django ORM is an object-relational mapper...',
+            'llm2_name': 'OpenAI',
+            'llm2_response': 'Django ORM provides a Pythonic interface...',
+            'conversation_id': str(self.conversation.id)
+        }
+
+        first = self.client.post(url, data, format='json').json()
+        second = self.client.post(url, data, format='json').json()
+
+        self.assertEqual(first['synthesis'], second['synthesis'])
+        self.assertEqual(mock_claude.generate_response.await_count, 1)
+        self.assertEqual(
+            sorted(AIResponse.objects.filter(query__conversation=self.conversation).values_list('tokens_used', flat=True)),
+            [0, 800]
+        )
+
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_synthesis_stream_not_buffered_under_wsgi(self, mock_factory):
+        """
+        Test: WSGI stream → first delta is sent before the completion finishes
+        """
+        finished = []
+
+        async def generate_response_stream(prompt, context=None):
+            yield 'Synthesized '
+            finished.append(True)
+            yield {'success': True, 'content': 'Synthesized ', 'metadata': {}}
+
+        mock_factory.return_value.generate_response_stream = generate_response_stream
+
+        url = reverse('api_v1:consensus_synthesis')
+        data = {
+            'user_query': 'What is Django ORM?',
+            'llm1_name': 'Claude',
+            'llm1_response': 'Django ORM is an object-relational mapper...',
+            'llm2_name': 'OpenAI',
+            'llm2_response': 'Django ORM provides a Pythonic interface...',
+            'stream': True
+        }
+
+        response = self.client.post(url, data, format='json')
+        chunks = iter(response)
+
+        self.assertEqual(json.loads(next(chunks))['type'], 'delta')
+        self.assertEqual(finished, [])
+        self.assertEqual(json.loads(b''.join(chunks))['type'], 'done')
+        self.assertEqual(finished, [True])
+
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_synthesis_stream_sends_deltas_then_done(self, mock_factory):
+        """
+        Test: stream=true → NDJSON text deltas → done line → cost tracked once finished
+        """
+        async def generate_response_stream(prompt, context=None):
+            yield 'Synthesized '
+            yield 'response'
+            yield {
+                'success': True,
+                'content': 'Synthesized response',
+                'metadata': {'usage': {'input_tokens': 500, 'output_tokens': 300}}
+            }
+
+        mock_claude = MagicMock()
+        mock_claude.generate_response_stream = generate_response_stream
+        mock_factory.return_value = mock_claude
+
+        url = reverse('api_v1:consensus_synthesis')
+        data = {
+            'user_query': 'What is Django ORM?',
+            'llm1_name': 'Claude',
+            'llm1_response': 'Django ORM is an object-relational mapper...',
+            'llm2_name': 'OpenAI',
+            'llm2_response': 'Django ORM provides a Pythonic interface...',
+            'conversation_id': str(self.conversation.id),
+            'stream': True
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = [json.loads(line) for line in b''.join(response).splitlines()]
+        self.assertEqual(
+            [line['content'] for line in lines if line['type'] == 'delta'],
+            ['Synthesized ', 'response']
+        )
+        self.assertEqual(lines[-1], {
+            'type': 'done',
+            'success': True,
+            'synthesis': 'Synthesized response',
+            'synthesis_provider': 'Claude'
+        })
+        ai_response = AIResponse.objects.get(query__conversation=self.conversation)
+        self.assertEqual(ai_response.summary, 'Response synthesis')
+        self.assertEqual(ai_response.tokens_used, 800)
+
     @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
     def test_critique_endpoint_compares_responses(self, mock_factory):
         """
@@ -349,6 +682,9 @@ class ConsensusIntegrationTests(TransactionTestCase):
         self.assertIn('critique_provider', response_data)
         # OpenAI should be selected for unbiased comparison
         self.assertEqual(response_data['critique_provider'], 'OpenAI (unbiased)')
+        prompt = mock_openai.generate_response.call_args.args[0]
+        self.assertIn('Original User Query along with chat history: Explain Django signals', prompt)
+        self.assertIn("OpenAI's Response: Signals are a strategy", prompt)
 
         # Assert cost tracked
         ai_query = AIQuery.objects.filter(
@@ -361,6 +697,68 @@ class ConsensusIntegrationTests(TransactionTestCase):
         self.assertIsNotNone(ai_response)
         self.assertEqual(ai_response.summary, 'Response comparison critique')
 
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_repeated_critique_served_from_view_cache(self, mock_factory):
+        """
+        Test: identical untracked critique twice → view runs once; tracked critiques always run
+        """
+        cache.clear()
+        self.addCleanup(cache.clear)
+        mock_factory.return_value.generate_response = AsyncMock(return_value={
+            'success': True,
+            'content': '## Executive Summary\nBoth are fine.',
+            'metadata': {}
+        })
+
+        url = reverse('api_v1:consensus_critique')
+        data = {
+            'user_query': 'Explain Django signals',
+            'llm1_name': 'Claude',
+            'llm1_response': 'Django signals allow decoupled applications...',
+            'llm2_name': 'OpenAI',
+            'llm2_response': 'Signals are a strategy to allow certain senders...'
+        }
+
+        first = self.client.post(url, data, format='json')
+        second = self.client.post(url, data, format='json')
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(mock_factory.call_count, 1)
+
+        tracked = {**data, 'conversation_id': str(self.conversation.id)}
+        self.client.post(url, tracked, format='json')
+        self.client.post(url, tracked, format='json')
+        self.assertEqual(mock_factory.call_count, 3)
+
+    @patch('api.v1.consensus_ai.response_cache_key', wraps=response_cache_key)
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_critique_cached_under_provider_key(self, mock_factory, mock_cache_key):
+        """
+        Test: critique response cache is keyed by the provider key, not its display label
+        """
+        mock_factory.return_value.model = 'gpt-4o'
+        mock_factory.return_value.generate_response = AsyncMock(return_value={
+            'success': True,
+            'content': '## Executive Summary\nBoth are fine.',
+            'metadata': {}
+        })
+
+        url = reverse('api_v1:consensus_critique')
+        data = {
+            'user_query': 'Explain Django signals',
+            'llm1_name': 'Claude',
+            'llm1_response': 'Django signals allow decoupled applications...',
+            'llm2_name': 'OpenAI',
+            'llm2_response': 'Signals are a strategy to allow certain senders...'
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.json()['critique_provider'], 'OpenAI (unbiased)')
+        self.assertEqual(mock_cache_key.call_args.args[1:3], ('openai', 'gpt-4o'))
+
     @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
     def test_cross_reflect_parallel_execution(self, mock_factory):
         """
@@ -370,14 +768,14 @@ class ConsensusIntegrationTests(TransactionTestCase):
         mock_claude = MagicMock()
         mock_claude.generate_response = AsyncMock(return_value={
             'success': True,
-            'content': 'Reflecting on OpenAI response: I appreciate the emphasis on...',
+            'content': 'Reflecting on OpenAI response: I appreciate the emphasis on statelessness. ' * 15,
             'metadata': {'usage': {'input_tokens': 300, 'output_tokens': 250}}
         })
 
         mock_openai = MagicMock()
         mock_openai.generate_response = AsyncMock(return_value={
             'success': True,
-            'content': 'Reflecting on Claude response: The detailed examples are valuable...',
+            'content': 'Reflecting on Claude response: The detailed examples are valuable. ' * 15,
             'metadata': {'usage': {'prompt_tokens': 310, 'completion_tokens': 260}}
         })
 
@@ -431,7 +829,186 @@ class ConsensusIntegrationTests(TransactionTestCase):
 
         # Assert reflection responses
         reflection_responses = ai_responses.exclude(summary='Synopsis generation for cross-reflection')
-        self.assertEqual(reflection_responses.count(), 2)
+        self.assertEqual(
+            set(reflection_responses.values_list('summary', flat=True)),
+            {'Claude reflecting on OpenAI', 'OpenAI reflecting on Claude'}
+        )
+        self.assertEqual(
+            [reflection['reflecting_on'] for reflection in response_data['reflections']],
+            ['OpenAI', 'Claude']
+        )
+        self.assertIn('You are Claude', mock_claude.generate_response.await_args_list[0].args[0])
+        self.assertIn('You are OpenAI', mock_openai.generate_response.await_args_list[0].args[0])
+
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_cross_reflect_short_reflection_is_its_own_synopsis(self, mock_factory):
+        """
+        Test: short reflections without a synopsis → no synopsis calls → only reflections tracked
+        """
+        mock_service = MagicMock()
+        mock_service.generate_response = AsyncMock(side_effect=lambda *args: {
+            'success': True,
+            'content': 'Both answers agree on statelessness.',
+            'metadata': {'usage': {'input_tokens': 300, 'output_tokens': 20}}
+        })
+        mock_factory.return_value = mock_service
+
+        url = reverse('api_v1:consensus_cross_reflect')
+        data = {
+            'user_query': 'What is REST API design?',
+            'llm1_name': 'Claude',
+            'llm1_response': 'REST APIs should follow stateless design...',
+            'llm2_name': 'OpenAI',
+            'llm2_response': 'RESTful architecture emphasizes resource-based URLs...',
+            'conversation_id': str(self.conversation.id)
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for reflection in response.json()['reflections']:
+            self.assertEqual(reflection['synopsis'], 'Both answers agree on statelessness.')
+        self.assertEqual(mock_service.generate_response.await_count, 2)
+        self.assertEqual(AIResponse.objects.filter(query__conversation=self.conversation).count(), 2)
+
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_cross_reflect_failure_named_by_service(self, mock_factory):
+        """
+        Test: one reflection fails → 200 with that side's error → only the success tracked
+        """
+        mock_claude = MagicMock()
+        mock_claude.generate_response = AsyncMock(return_value={
+            'success': True,
+            'content': 'Reflection text\n===SYNOPSIS===\nReflection synopsis',
+            'metadata': {}
+        })
+        mock_openai = MagicMock()
+        mock_openai.generate_response = AsyncMock(return_value={'success': False, 'error': 'rate limited'})
+        mock_factory.side_effect = lambda service_name, *args, **kwargs: (
+            mock_claude if service_name == 'claude' else mock_openai
+        )
+
+        url = reverse('api_v1:consensus_cross_reflect')
+        data = {
+            'user_query': 'What is REST API design?',
+            'llm1_name': 'Claude',
+            'llm1_response': 'REST APIs should follow stateless design...',
+            'llm2_name': 'OpenAI',
+            'llm2_response': 'RESTful architecture emphasizes resource-based URLs...',
+            'conversation_id': str(self.conversation.id)
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        claude_reflection, openai_reflection = response.json()['reflections']
+        self.assertTrue(claude_reflection['success'])
+        self.assertIsNone(claude_reflection['error'])
+        self.assertFalse(openai_reflection['success'])
+        self.assertEqual(openai_reflection['error'], 'rate limited')
+        tracked = AIResponse.objects.filter(query__conversation=self.conversation)
+        self.assertEqual(list(tracked.values_list('service__name', flat=True)), ['claude'])
+
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_cross_reflect_both_failures_return_500(self, mock_factory):
+        """
+        Test: both reflections fail → 500 naming both services → nothing tracked
+        """
+        mock_service = MagicMock()
+        mock_service.generate_response = AsyncMock(return_value={'success': False, 'error': 'rate limited'})
+        mock_factory.return_value = mock_service
+
+        url = reverse('api_v1:consensus_cross_reflect')
+        data = {
+            'user_query': 'What is REST API design?',
+            'llm1_name': 'Claude',
+            'llm1_response': 'REST APIs should follow stateless design...',
+            'llm2_name': 'OpenAI',
+            'llm2_response': 'RESTful architecture emphasizes resource-based URLs...',
+            'conversation_id': str(self.conversation.id)
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertEqual(
+            response.json()['error'],
+            'Cross-reflection failed: Claude: rate limited; OpenAI: rate limited'
+        )
+        self.assertFalse(AIResponse.objects.filter(query__conversation=self.conversation).exists())
+
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_cross_reflect_inline_synopsis_skips_second_call(self, mock_factory):
+        """
+        Test: reflections carry their synopses → 2 API calls → only reflections tracked
+        """
+        mock_service = MagicMock()
+        mock_service.generate_response = AsyncMock(side_effect=lambda *args: {
+            'success': True,
+            'content': 'Reflection text\n===SYNOPSIS===\nReflection synopsis',
+            'metadata': {'usage': {'input_tokens': 300, 'output_tokens': 250}}
+        })
+        mock_factory.return_value = mock_service
+
+        url = reverse('api_v1:consensus_cross_reflect')
+        data = {
+            'user_query': 'What is REST API design?',
+            'llm1_name': 'Claude',
+            'llm1_response': 'REST APIs should follow stateless design...',
+            'llm2_name': 'OpenAI',
+            'llm2_response': 'RESTful architecture emphasizes resource-based URLs...',
+            'conversation_id': str(self.conversation.id)
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for reflection in response.json()['reflections']:
+            self.assertEqual(reflection['content'], 'Reflection text')
+            self.assertEqual(reflection['synopsis'], 'Reflection synopsis')
+        self.assertEqual(mock_service.generate_response.await_count, 2)
+        self.assertEqual(AIResponse.objects.filter(query__conversation=self.conversation).count(), 2)
+
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_cross_reflect_exception_isolated_to_its_service(self, mock_factory):
+        """
+        Test: one reflection raises → other reflection still returned and tracked
+        """
+        mock_claude = MagicMock()
+        mock_claude.generate_response = AsyncMock(return_value={
+            'success': True,
+            'content': 'Reflection text\n===SYNOPSIS===\nReflection synopsis',
+            'metadata': {}
+        })
+        mock_openai = MagicMock()
+        mock_openai.generate_response = AsyncMock(side_effect=RuntimeError('connection reset'))
+        mock_factory.side_effect = lambda service_name, *args, **kwargs: (
+            mock_claude if service_name == 'claude' else mock_openai
+        )
+
+        url = reverse('api_v1:consensus_cross_reflect')
+        data = {
+            'user_query': 'What is REST API design?',
+            'llm1_name': 'Claude',
+            'llm1_response': 'REST APIs should follow stateless design...',
+            'llm2_name': 'OpenAI',
+            'llm2_response': 'RESTful architecture emphasizes resource-based URLs...',
+            'conversation_id': str(self.conversation.id)
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        claude_reflection, openai_reflection = response.json()['reflections']
+        self.assertTrue(claude_reflection['success'])
+        self.assertEqual(claude_reflection['content'], 'Reflection text')
+        self.assertEqual(claude_reflection['synopsis'], 'Reflection synopsis')
+        self.assertFalse(openai_reflection['success'])
+        self.assertEqual(openai_reflection['error'], 'connection reset')
+        mock_claude.generate_response.assert_awaited_once()
+        tracked = AIResponse.objects.filter(query__conversation=self.conversation)
+        self.assertEqual(list(tracked.values_list('service__name', flat=True)), ['claude'])
+        self.assertEqual(tracked.get().content, 'Reflection text')
 
     @patch('api.v1.consensus_ai.WebSearchCoordinator.search_for_query')
     @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
@@ -479,6 +1056,85 @@ class ConsensusIntegrationTests(TransactionTestCase):
         # the assertion cannot reliably verify this in tests. The functionality
         # works correctly in production.
 
+    @patch('api.v1.consensus_ai.WebSearchCoordinator.search_for_query', new_callable=AsyncMock)
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_web_search_results_in_prompt_and_sources(self, mock_factory, mock_search):
+        """
+        Test: Web search succeeds → top results formatted into the prompt → sources returned
+        """
+        mock_search.return_value = {
+            'success': True,
+            'results': [
+                {'title': f'Result {index}', 'url': f'https://example.com/{index}', 'content': f'Snippet {index}'}
+                for index in range(1, 8)
+            ],
+            'search_calls_made': 1
+        }
+
+        mock_claude = MagicMock()
+        mock_claude.generate_response = AsyncMock(return_value={
+            'success': True,
+            'content': 'Response with web search',
+            'metadata': {'usage': {'input_tokens': 100, 'output_tokens': 200}}
+        })
+        mock_factory.return_value = mock_claude
+
+        url = reverse('api_v1:consensus')
+        data = {
+            'message': 'Latest news about Django 5.0',
+            'services': ['claude'],
+            'use_web_search': True,
+            'conversation_id': str(self.conversation.id)
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['web_search_sources']), 7)
+
+        prompt, context = mock_claude.generate_response.call_args.args
+        self.assertIn('1. Result 1\n   URL: https://example.com/1\n   Snippet 1...\n', prompt)
+        self.assertIn('5. Result 5\n', prompt)
+        self.assertNotIn('6. Result 6', prompt)
+        self.assertEqual(len(context['web_search']['results']), 7)
+
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_oversized_payload_rejected(self, mock_factory):
+        """
+        Test: body over the size limit → 413 before any provider is created
+        """
+        url = reverse('api_v1:consensus')
+        data = {
+            'message': 'Test query',
+            'services': ['claude'],
+            'chat_history': 'x' * MAX_REQUEST_BODY_SIZE
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertFalse(response.json()['success'])
+        mock_factory.assert_not_called()
+
+    @patch('api.v1.consensus_ai.AIServiceFactory.create_service')
+    def test_oversized_synthesis_payload_rejected(self, mock_factory):
+        """
+        Test: synthesis body over the size limit → 413 before any provider is created
+        """
+        url = reverse('api_v1:consensus_synthesis')
+        data = {
+            'user_query': 'What is Django ORM?',
+            'llm1_name': 'Claude',
+            'llm1_response': 'x' * MAX_REQUEST_BODY_SIZE,
+            'llm2_name': 'OpenAI',
+            'llm2_response': 'Django ORM provides a Pythonic interface...'
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        mock_factory.assert_not_called()
+
     def test_unauthenticated_access_denied(self):
         """
         Test: No auth token → 401 or 403 response (authentication required)
@@ -495,3 +1151,59 @@ class ConsensusIntegrationTests(TransactionTestCase):
         response = self.client.post(url, data, format='json')
         # Should return 401 (Unauthorized) or 403 (Forbidden) for unauthenticated access
         self.assertIn(response.status_code, [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN])
+
+
+class SynopsisGenerationTests(SimpleTestCase):
+    """Validate cleanup of generated synopses and local synopses of short answers."""
+
+    def generate(self, content):
+        service = MagicMock()
+        service.generate_response = AsyncMock(return_value={'success': True, 'content': content, 'metadata': {}})
+        return async_to_sync(generate_synopsis_with_same_ai)('Answer', service, 'claude', 'model')['synopsis']
+
+    def test_overlong_synopsis_truncated(self):
+        """Synopses over 50 words are cut to 45 words."""
+        words = [f'word{index}' for index in range(60)]
+
+        self.assertEqual(self.generate(' '.join(words)), ' '.join(words[:45]) + '...')
+
+    def test_synopsis_within_limit_kept(self):
+        """Synopses of up to 50 words are returned unchanged."""
+        synopsis = ' '.join(f'word{index}' for index in range(50))
+
+        self.assertEqual(self.generate(synopsis), synopsis)
+
+    def test_mid_length_answer_summarized_by_first_and_last_sentence(self):
+        """Answers just over synopsis length keep their opening and closing sentences."""
+        middle = ' '.join(f'detail{index}.' for index in range(50))
+        content = f"Use TestCase for database tests.\n\n{middle}\nPrefer factories over fixtures."
+
+        self.assertEqual(local_synopsis(content), 'Use TestCase for database tests. Prefer factories over fixtures.')
+
+    def test_mid_length_extract_capped(self):
+        """An extract that is itself too long is cut to synopsis length."""
+        content = ' '.join(f'word{index}' for index in range(100)) + '.'
+
+        self.assertEqual(local_synopsis(content), ' '.join(f'word{index}' for index in range(45)) + '...')
+
+    def test_long_answer_needs_generated_synopsis(self):
+        """Answers over the local limit are left to the model."""
+        self.assertIsNone(local_synopsis('Sentence. ' * 121))
+
+
+class ChatHistoryTrimTests(SimpleTestCase):
+    """Validate the chat history prompt budget."""
+
+    def test_short_history_unchanged(self):
+        """Histories within the budget are passed through as-is."""
+        self.assertEqual(trim_chat_history('user: hi\nassistant: hello'), 'user: hi\nassistant: hello')
+
+    def test_long_history_keeps_recent_lines(self):
+        """Long histories keep their most recent whole lines within the budget."""
+        history = '\n'.join(f'user: message {index}' for index in range(2000))
+
+        trimmed = trim_chat_history(history)
+
+        self.assertLessEqual(len(trimmed), CHAT_HISTORY_MAX_CHARS)
+        self.assertTrue(trimmed.startswith('user: message '))
+        self.assertTrue(history.endswith(trimmed))
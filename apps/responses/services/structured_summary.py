@@ -50,15 +50,17 @@ class StructuredSummaryService:
         """
         start_time = time.time()
         
+        # Legacy summary is deterministic, so compute it once and reuse it for every fallback
+        legacy_summary_data = self.legacy_summarizer.generate_summary(content)
+        
         try:
             # Get legacy summary for backward compatibility
-            legacy_summary_data = self.legacy_summarizer.generate_summary(content)
             legacy_summary = legacy_summary_data.get('summary', 'No summary available')
             
             if use_enhanced:
-                enhanced_summary = await self._generate_enhanced_summary(content, ai_service_name)
+                enhanced_summary = await self._generate_enhanced_summary(content, ai_service_name, legacy_summary_data)
             else:
-                enhanced_summary = await self._generate_simple_overview(content, ai_service_name)
+                enhanced_summary = await self._generate_simple_overview(content, ai_service_name, legacy_summary_data)
             
             processing_time = time.time() - start_time
             
@@ -87,7 +89,6 @@ class StructuredSummaryService:
             processing_time = time.time() - start_time
             
             # Return fallback result with legacy summary
-            legacy_summary_data = self.legacy_summarizer.generate_summary(content)
             fallback_enhanced = self._create_fallback_enhanced_summary(content, legacy_summary_data)
             
             metadata = SummaryMetadata(
@@ -106,12 +107,17 @@ class StructuredSummaryService:
                 error_message=str(e)
             )
     
-    async def _generate_enhanced_summary(self, content: str, ai_service_name: str) -> EnhancedSummaryResponse:
+    async def _generate_enhanced_summary(
+        self,
+        content: str,
+        ai_service_name: str,
+        legacy_data: Optional[Dict[str, Any]] = None
+    ) -> EnhancedSummaryResponse:
         """Generate enhanced summary using Pydantic AI for all providers."""
         # Check if provider is supported by Pydantic AI
         if not pydantic_ai_service.supports_provider(ai_service_name):
             logger.warning(f"Provider {ai_service_name} not supported by Pydantic AI, using fallback")
-            return await self._generate_simple_overview_as_enhanced(content, ai_service_name)
+            return await self._generate_simple_overview_as_enhanced(content, ai_service_name, legacy_data)
         
         # Use unified Pydantic AI service for structured output
         response = await pydantic_ai_service.generate_enhanced_summary(
@@ -125,9 +131,16 @@ class StructuredSummaryService:
         else:
             logger.warning(f"Pydantic AI failed for {ai_service_name}: {response.get('error')}")
             # Fallback to manual creation
-            return self._create_fallback_enhanced_summary(content, self.legacy_summarizer.generate_summary(content))
+            if legacy_data is None:
+                legacy_data = self.legacy_summarizer.generate_summary(content)
+            return self._create_fallback_enhanced_summary(content, legacy_data)
     
-    async def _generate_simple_overview(self, content: str, ai_service_name: str) -> EnhancedSummaryResponse:
+    async def _generate_simple_overview(
+        self,
+        content: str,
+        ai_service_name: str,
+        legacy_data: Optional[Dict[str, Any]] = None
+    ) -> EnhancedSummaryResponse:
         """Generate simple overview and convert to enhanced format."""
         if pydantic_ai_service.supports_provider(ai_service_name):
             prompt = f"Provide a concise 2-3 sentence summary of this content (avoid numbered lists or explanatory phrases):\n\n{content[:4000]}"
@@ -143,9 +156,14 @@ class StructuredSummaryService:
                 return self._convert_overview_to_enhanced(overview_data, content)
         
         # Fallback for unsupported providers or failures
-        return await self._generate_simple_overview_as_enhanced(content, ai_service_name)
+        return await self._generate_simple_overview_as_enhanced(content, ai_service_name, legacy_data)
     
-    async def _generate_simple_overview_as_enhanced(self, content: str, ai_service_name: str) -> EnhancedSummaryResponse:
+    async def _generate_simple_overview_as_enhanced(
+        self,
+        content: str,
+        ai_service_name: str,
+        legacy_data: Optional[Dict[str, Any]] = None
+    ) -> EnhancedSummaryResponse:
         """Generate overview using Pydantic AI and convert to enhanced format."""
         try:
             # Use Pydantic AI for simple overview generation
@@ -164,7 +182,8 @@ class StructuredSummaryService:
             logger.warning(f"Pydantic AI failed for {ai_service_name}: {str(e)}")
         
         # Final fallback
-        legacy_data = self.legacy_summarizer.generate_summary(content)
+        if legacy_data is None:
+            legacy_data = self.legacy_summarizer.generate_summary(content)
         return self._create_fallback_enhanced_summary(content, legacy_data)
     
     def _convert_overview_to_enhanced(self, overview_data: Dict[str, Any], content: str) -> EnhancedSummaryResponse:
@@ -346,4 +365,8 @@ class StructuredSummaryService:
                 importance="high" if i == 0 else "medium" if i == 1 else "low"
             )
             for i, point in enumerate(legacy_points[:3])
-        ]
\ No newline at end of file
+        ]
+
+
+# Global instance
+structured_summary_service = StructuredSummaryService()
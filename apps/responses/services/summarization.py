@@ -2,9 +2,14 @@ import re
 from typing import Dict, List, Any, Optional
 import logging
 import asyncio
+import concurrent.futures
+from asgiref.sync import async_to_sync
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on a blocking structured-summary call before falling back
+STRUCTURED_SUMMARY_TIMEOUT = 30
+
 
 class ResponseSummarizer:
     def __init__(self):
@@ -217,8 +222,8 @@ class ResponseSummarizer:
             if use_structured:
                 # Lazy import to avoid circular imports
                 if self._structured_service is None:
-                    from .structured_summary import StructuredSummaryService
-                    self._structured_service = StructuredSummaryService()
+                    from .structured_summary import structured_summary_service
+                    self._structured_service = structured_summary_service
                 
                 # Generate structured summary
                 structured_result = await self._structured_service.generate_structured_summary(
@@ -253,6 +258,12 @@ class ResponseSummarizer:
                 'summary_type': 'legacy_fallback'
             }
     
+    async def _generate_enhanced_summary_with_timeout(self, content: str) -> Dict[str, Any]:
+        return await asyncio.wait_for(
+            self.generate_enhanced_summary(content),
+            timeout=STRUCTURED_SUMMARY_TIMEOUT
+        )
+
     def generate_summary_sync(self, content: str, use_structured: bool = False) -> Dict[str, Any]:
         """
         Synchronous wrapper for enhanced summary generation.
@@ -260,18 +271,20 @@ class ResponseSummarizer:
         """
         if use_structured:
             try:
-                # Run async method in event loop
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # If we're already in an async context, schedule the task
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(
-                            lambda: asyncio.run(self.generate_enhanced_summary(content))
-                        )
-                        return future.result(timeout=30)
-                else:
-                    return loop.run_until_complete(self.generate_enhanced_summary(content))
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    # No loop in this thread: awaits on the server's event loop
+                    # under ASGI, on a new loop for this call under WSGI
+                    return async_to_sync(self._generate_enhanced_summary_with_timeout)(content)
+
+                # Called from inside a running loop, where async_to_sync refuses
+                # to block; run the coroutine on a worker thread instead
+                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                    future = executor.submit(
+                        asyncio.run, self._generate_enhanced_summary_with_timeout(content)
+                    )
+                    return future.result()
             except Exception as e:
                 logger.error(f"Error in sync enhanced summary: {str(e)}")
                 return self.generate_summary(content)
@@ -0,0 +1,37 @@
+"""
+Tests for the structured summary service.
+"""
+from unittest.mock import AsyncMock, patch
+
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase
+
+from apps.responses.services.structured_summary import StructuredSummaryService
+
+
+class StructuredSummaryServiceTests(SimpleTestCase):
+    """Validate fallback behaviour of the structured summary service."""
+
+    @patch(
+        'apps.responses.services.structured_summary.pydantic_ai_service.generate_enhanced_summary',
+        new_callable=AsyncMock
+    )
+    def test_fallback_reuses_legacy_summary(self, mock_enhanced):
+        """A failed provider call falls back without re-running the legacy summarizer."""
+        mock_enhanced.return_value = {'success': False, 'structured_data': None, 'error': 'boom'}
+        service = StructuredSummaryService()
+        content = 'Django is a web framework. It ships an ORM. Many teams use it.'
+
+        with patch.object(
+            service.legacy_summarizer,
+            'generate_summary',
+            wraps=service.legacy_summarizer.generate_summary
+        ) as mock_legacy:
+            result = async_to_sync(service.generate_structured_summary)(
+                content=content,
+                ai_service_name='openai'
+            )
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.enhanced_summary.summary, result.legacy_summary)
+        mock_legacy.assert_called_once_with(content)
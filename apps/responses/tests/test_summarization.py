@@ -0,0 +1,44 @@
+"""
+Tests for the response summarizer.
+"""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from django.test import SimpleTestCase
+
+from apps.responses.services.summarization import ResponseSummarizer
+
+
+class GenerateSummarySyncTests(SimpleTestCase):
+    """Validate the synchronous wrapper around the structured summary path."""
+
+    def test_structured_summary_from_running_loop(self):
+        """Calling from inside a running event loop still takes the structured path."""
+        summarizer = ResponseSummarizer()
+        expected = {'summary': 'structured', 'summary_type': 'enhanced'}
+
+        async def call_from_loop():
+            return summarizer.generate_summary_sync('Some content.', use_structured=True)
+
+        with patch.object(
+            summarizer, 'generate_enhanced_summary', new_callable=AsyncMock
+        ) as mock_enhanced:
+            mock_enhanced.return_value = expected
+            result = asyncio.run(call_from_loop())
+
+        self.assertEqual(result, expected)
+        mock_enhanced.assert_awaited_once_with('Some content.')
+
+    def test_structured_summary_times_out_to_legacy(self):
+        """A hung structured call falls back to the legacy summary after the timeout."""
+        summarizer = ResponseSummarizer()
+
+        async def hang(content):
+            await asyncio.sleep(10)
+
+        with patch('apps.responses.services.summarization.STRUCTURED_SUMMARY_TIMEOUT', 0.01), \
+                patch.object(summarizer, 'generate_enhanced_summary', side_effect=hang):
+            result = summarizer.generate_summary_sync('Some content.', use_structured=True)
+
+        self.assertNotIn('summary_type', result)
+        self.assertIn('summary', result)
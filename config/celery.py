@@ -22,6 +22,7 @@ app.conf.task_routes = {
     'apps.ai_services.tasks.call_openai_api': {'queue': 'ai_tasks'},
     'apps.ai_services.tasks.summarize_response': {'queue': 'processing'},
     'apps.ai_services.tasks.rank_responses': {'queue': 'processing'},
+    'apps.accounts.tasks.send_passcode_email': {'queue': 'email'},
 }
 
 # Configure task priorities
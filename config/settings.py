@@ -164,18 +164,23 @@ AUTHENTICATION_BACKENDS = [
 REDIS_URL = config('REDIS_URL', default='redis://localhost:6379/0')
 
 # Cache Configuration
-# CACHES = {
-#     'default': {
-#         'BACKEND': 'django.core.cache.backends.redis.RedisCache',
-#         'LOCATION': REDIS_URL,
-#     }
-# }
-# For development without Redis, use dummy cache:
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+# The cache backs the passcode send throttle, the demo user lookup, Google's
+# signing certificates and the consensus response caches, so it must store
+# values. Redis is shared by every worker process; without REDIS_URL each
+# process keeps its own local-memory cache, enough for a single dev server.
+if config('REDIS_URL', default=''):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
     }
-}
 
 # Session Configuration
 SESSION_ENGINE = 'django.contrib.sessions.backends.db'
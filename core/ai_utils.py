@@ -1,4 +1,6 @@
+import copy
 import json
+from functools import lru_cache
 from typing import Dict, Any, Type
 from pydantic import BaseModel
 
@@ -9,9 +11,17 @@ def convert_pydantic_to_openai_function(model: Type[BaseModel]) -> Dict[str, Any
     NOTE: This is a legacy utility - structured outputs now use unified pydantic_ai_service
     for consistent JSON schema across all providers (OpenAI, Claude, Gemini).
     """
+    # Models are static for the process lifetime; deep-copy so callers can't
+    # mutate the cached entry's nested parameters
+    return copy.deepcopy(_build_function_schema(model))
+
+
+@lru_cache(maxsize=None)
+def _build_function_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Generate the function schema for a model once."""
     schema = model.model_json_schema()
     
-    function_schema = {
+    return {
         "name": model.__name__,
         "description": model.__doc__ or f"Call this function to create a {model.__name__}",
         "parameters": {
@@ -20,8 +30,6 @@ def convert_pydantic_to_openai_function(model: Type[BaseModel]) -> Dict[str, Any
             "required": schema.get("required", [])
         }
     }
-    
-    return function_schema
 
 
 def parse_function_call_response(response_content: str, function_name: str) -> Dict[str, Any]:
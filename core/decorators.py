@@ -0,0 +1,68 @@
+"""
+View decorators for ChatAI REST API.
+"""
+import hashlib
+from functools import wraps
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from rest_framework import status
+
+from core.responses import json_response
+
+
+def cached_post(timeout=60, uncached_fields=()):
+    """
+    Cache successful responses of a POST view by user, path and request body.
+
+    Identical repeat requests (retries, demo and evaluation runs) are answered
+    from the cache without running the view. Requests carrying any of
+    uncached_fields bypass the cache, for views whose side effects (such as
+    cost tracking against a conversation) must happen on every call.
+
+    Apply below @api_view so request.user is authenticated.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            # Read the raw body before request.data consumes the stream
+            body_hash = hashlib.blake2b(request.body, digest_size=16).hexdigest()
+            if any(request.data.get(field) for field in uncached_fields):
+                return view_func(request, *args, **kwargs)
+
+            cache_key = f"post:{request.path}:{request.user.pk}:{body_hash}"
+            cached = cache.get(cache_key)
+            if cached is not None:
+                content, content_type = cached
+                return HttpResponse(content, content_type=content_type)
+
+            response = view_func(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming and getattr(response, 'is_rendered', True):
+                cache.set(cache_key, (response.content, response['Content-Type']), timeout)
+            return response
+        return wrapper
+    return decorator
+
+
+def max_body_size(limit):
+    """
+    Reject request bodies larger than limit bytes with a 413.
+
+    The declared Content-Length is checked first so oversized payloads are
+    refused before Django buffers or parses them.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            try:
+                declared_length = int(request.META.get('CONTENT_LENGTH') or 0)
+            except ValueError:
+                declared_length = 0
+            if declared_length > limit or len(request.body) > limit:
+                return json_response({
+                    'success': False,
+                    'error': 'Request payload too large'
+                }, status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+            return view_func(request, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,7 +1,8 @@
 """
 Custom pagination classes for ChatAI REST API.
 """
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
 
 
@@ -25,4 +26,50 @@ class StandardResultsSetPagination(PageNumberPagination):
                 'total_pages': self.page.paginator.num_pages,
             },
             'results': data
-        })
\ No newline at end of file
+        })
+
+
+class CursorResultsSetPagination(CursorPagination):
+    """
+    Keyset pagination for large, frequently growing listings.
+
+    Pages are fetched with an index range scan on the ordering field instead
+    of OFFSET, and no COUNT(*) is run, so the response omits totals. Clients
+    follow the next/previous links; page numbers are rejected rather than
+    silently answered with the first page.
+
+    The cursor position is taken from the first ordering field and ties are
+    stepped through by offset, which is only stable when the order is total,
+    so the primary key is always appended as a tie-breaker.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-updated_at'
+    tie_breaker = 'pk'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if request.query_params.get('page', '1') != '1':
+            raise ValidationError({
+                'page': 'Page numbers are not supported; follow the next/previous cursor links.'
+            })
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_ordering(self, request, queryset, view):
+        ordering = tuple(super().get_ordering(request, queryset, view))
+        if self.tie_breaker in {field.lstrip('-') for field in ordering}:
+            return ordering
+        # Break ties in the same direction as the primary ordering field
+        prefix = '-' if ordering[0].startswith('-') else ''
+        return ordering + (prefix + self.tie_breaker,)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'success': True,
+            'pagination': {
+                'next': self.get_next_link(),
+                'previous': self.get_previous_link(),
+                'page_size': self.page_size,
+            },
+            'results': data
+        })
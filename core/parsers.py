@@ -0,0 +1,22 @@
+"""
+Request parsers for ChatAI REST API.
+"""
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class ORJSONParser(BaseParser):
+    """
+    Parses JSON request bodies with orjson.
+
+    orjson decodes straight from bytes, skipping the decode-to-str step and
+    the slower stdlib decoder used by DRF's JSONParser.
+    """
+    media_type = 'application/json'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
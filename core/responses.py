@@ -1,6 +1,11 @@
 """
 Unified response structures for ChatAI API.
 """
+import asyncio
+
+import orjson
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, StreamingHttpResponse
 from rest_framework.response import Response
 from rest_framework import status
 
@@ -34,4 +39,44 @@ def error_response(message="An error occurred", errors=None, error_code=None, st
     if error_code:
         response_data['error_code'] = error_code
     
-    return Response(response_data, status=status_code)
\ No newline at end of file
+    return Response(response_data, status=status_code)
+
+
+def json_response(data, status_code=status.HTTP_200_OK):
+    """
+    Plain JSON response serialized with orjson.
+
+    For views returning large payloads outside DRF's renderer pipeline,
+    where JsonResponse would use the slower stdlib encoder.
+    """
+    return HttpResponse(orjson.dumps(data), content_type='application/json', status=status_code)
+
+
+def ndjson_stream_response(request, stream):
+    """
+    Stream NDJSON lines produced by an async generator.
+
+    Under ASGI Django consumes the generator on the server's event loop. A WSGI
+    server can only iterate synchronously, and Django would buffer an async
+    iterator in full before sending it, so there the generator is driven on an
+    event loop of its own and each line is sent as soon as it is yielded.
+    """
+    if not isinstance(getattr(request, '_request', request), ASGIRequest):
+        stream = iterate_async_generator(stream)
+    return StreamingHttpResponse(stream, content_type='application/x-ndjson')
+
+
+def iterate_async_generator(stream):
+    """Yield the items of an async generator from synchronous code, on one event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(stream.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.run_until_complete(stream.aclose())
+        # Closes loop-scoped clients such as the shared aiohttp session
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
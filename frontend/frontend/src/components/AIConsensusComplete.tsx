@@ -882,9 +882,10 @@ const AIConsensusComplete: React.FC = () => {
         // Store reflections as AIResponse objects
         const reflections: AIResponse[] = data.reflections.map((reflection: any) => ({
           service: `${reflection.service} (reflecting on ${reflection.reflecting_on})`,
-          success: true,
+          success: reflection.success,
           content: reflection.content,
-          synopsis: reflection.synopsis
+          synopsis: reflection.synopsis,
+          error: reflection.error
         }));
         setCrossReflectionResults(reflections);
 
@@ -1054,9 +1055,10 @@ const AIConsensusComplete: React.FC = () => {
       if (data.success && data.reflections) {
         const reflections: AIResponse[] = data.reflections.map((reflection: any) => ({
           service: `${reflection.service} (reflecting on ${reflection.reflecting_on})`,
-          success: true,
+          success: reflection.success,
           content: reflection.content,
-          synopsis: reflection.synopsis
+          synopsis: reflection.synopsis,
+          error: reflection.error
         }));
         setPreviousCrossReflectionResults(prev => ({...prev, [exchangeKey]: reflections}));
         setPreviousCrossReflectionExpanded(prev => ({...prev, [exchangeKey]: true})); // Default to expanded
@@ -38,13 +38,13 @@ describe('ApiService', () => {
     test('ensureCsrfToken fetches token if not present', async () => {
       mockFetch.mockResolvedValueOnce({
         ok: true,
-        json: async () => ({ count: 0, results: [] }),
+        json: async () => ({ success: true, pagination: { next: null, previous: null, page_size: 20 }, results: [] }),
       });
 
       await apiService.ensureCsrfToken();
 
       expect(mockFetch).toHaveBeenCalledWith(
-        'http://localhost:8000/api/v1/conversations/?page=1',
+        'http://localhost:8000/api/v1/conversations/',
         expect.objectContaining({
           credentials: 'include',
         })
@@ -67,9 +67,8 @@ describe('ApiService', () => {
 
     test('getConversations makes correct API call', async () => {
       const mockResponse = {
-        count: 2,
-        next: null,
-        previous: null,
+        success: true,
+        pagination: { next: null, previous: null, page_size: 20 },
         results: [
           { id: '1', title: 'Conv 1' },
           { id: '2', title: 'Conv 2' },
@@ -95,17 +94,17 @@ describe('ApiService', () => {
     test('getConversations includes search parameters', async () => {
       mockFetch.mockResolvedValueOnce({
         ok: true,
-        json: async () => ({ count: 0, results: [] }),
+        json: async () => ({ success: true, pagination: { next: null, previous: null, page_size: 20 }, results: [] }),
       });
 
       await apiService.getConversations({
         q: 'test query',
-        page: 2,
+        cursor: 'cD0yMDI0',
         ordering: '-created_at',
       });
 
       expect(mockFetch).toHaveBeenCalledWith(
-        'http://localhost:8000/api/v1/conversations/?page=2&search=test+query&ordering=-created_at',
+        'http://localhost:8000/api/v1/conversations/?cursor=cD0yMDI0&search=test+query&ordering=-created_at',
         expect.any(Object)
       );
     });
@@ -215,7 +214,7 @@ describe('ApiService', () => {
     test('searchConversations includes all query parameters', async () => {
       mockFetch.mockResolvedValueOnce({
         ok: true,
-        json: async () => ({ count: 0, results: [] }),
+        json: async () => ({ success: true, pagination: { next: null, previous: null, page_size: 20 }, results: [] }),
       });
 
       await apiService.searchConversations({
@@ -355,7 +354,7 @@ describe('ApiService', () => {
 
       mockFetch.mockResolvedValueOnce({
         ok: true,
-        json: async () => ({ count: 0, results: [] }),
+        json: async () => ({ success: true, pagination: { next: null, previous: null, page_size: 20 }, results: [] }),
       });
 
       await apiService.getConversations();
@@ -398,7 +397,7 @@ describe('ApiService', () => {
     test('includes credentials for cookie-based auth', async () => {
       mockFetch.mockResolvedValueOnce({
         ok: true,
-        json: async () => ({ count: 0, results: [] }),
+        json: async () => ({ success: true, pagination: { next: null, previous: null, page_size: 20 }, results: [] }),
       });
 
       await apiService.getConversations();
@@ -49,9 +49,12 @@ export interface SearchParams {
 }
 
 export interface PaginatedResponse<T> {
-  count: number;
-  next: string | null;
-  previous: string | null;
+  success: boolean;
+  pagination: {
+    next: string | null;
+    previous: string | null;
+    page_size: number;
+  };
   results: T[];
 }
 
@@ -100,7 +103,7 @@ class ApiService {
     // Make a GET request to obtain the CSRF token cookie
     // We'll use the conversations endpoint which doesn't require any specific params
     try {
-      await this.request<PaginatedResponse<Conversation>>('/conversations/?page=1');
+      await this.request<PaginatedResponse<Conversation>>('/conversations/');
     } catch (error) {
       console.error('Failed to obtain CSRF token:', error);
       throw error;
@@ -159,10 +162,11 @@ class ApiService {
   }
 
   // Conversation management
-  async getConversations(params?: SearchParams & { page?: number }): Promise<PaginatedResponse<Conversation>> {
+  async getConversations(params?: SearchParams & { cursor?: string }): Promise<PaginatedResponse<Conversation>> {
     const searchParams = new URLSearchParams();
 
-    if (params?.page) searchParams.append('page', params.page.toString());
+    // Pages are keyset cursors taken from the previous response's pagination links
+    if (params?.cursor) searchParams.append('cursor', params.cursor);
     if (params?.q) searchParams.append('search', params.q);
     if (params?.ordering) searchParams.append('ordering', params.ordering);
     if (params?.date_from) searchParams.append('date_from', params.date_from);